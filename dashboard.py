@@ -14,7 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import UI components
 from nexusprime.ui import (
-    get_base_styles,
+    get_critical_styles,
+    get_deferred_styles,
     render_header,
     render_metrics_card,
     render_progress_pipeline,
@@ -23,6 +24,8 @@ from nexusprime.ui import (
     render_terminal,
 )
 from nexusprime.ui.components import render_workspace_files
+from nexusprime.integrations.memory import read_lessons
+from nexusprime.utils.status import load_status_snapshot
 from nexusprime.ui.animations import get_animation_styles
 
 # --- CONFIGURATION ---
@@ -32,9 +35,8 @@ st.set_page_config(
     page_icon="🔮"
 )
 
-# Apply styles
-st.markdown(get_base_styles(), unsafe_allow_html=True)
-st.markdown(get_animation_styles(), unsafe_allow_html=True)
+# Apply critical styles (terminal, animations and scrollbar come after the layout)
+st.markdown(get_critical_styles(), unsafe_allow_html=True)
 
 # --- AUTO-REFRESH ---
 # Refresh every 2 seconds
@@ -42,33 +44,24 @@ st_autorefresh(interval=2000, limit=1000, key="nexus_refresh")
 
 # --- DATA HELPERS ---
 def load_status():
-    """Load status from JSON file with error handling."""
-    if os.path.exists("status.json"):
-        try:
-            with open("status.json", "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            st.error("⚠️ status.json is corrupted. Please restart the factory.")
-            return None
-        except Exception as e:
-            st.error(f"⚠️ Failed to load status.json: {e}")
-            return None
-    return None
+    """Load the status snapshot (cached until status.json changes) with error handling."""
+    status = load_status_snapshot("status.json")
+    if status is None and os.path.exists("status.json"):
+        # load_status_snapshot logs the parse/read error and returns None
+        st.error("⚠️ status.json is corrupted. Please restart the factory.")
+    return status
 
 
 def load_memory():
-    """Load memory from JSON file with error handling."""
-    if os.path.exists("nexus_memory.json"):
-        try:
-            with open("nexus_memory.json", "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            st.warning("⚠️ nexus_memory.json is corrupted. Showing empty memory.")
-            return {"lessons": []}
-        except Exception as e:
-            st.warning(f"⚠️ Failed to load memory: {e}")
-            return {"lessons": []}
-    return {"lessons": []}
+    """Load live lessons (JSONL log, or the legacy JSON file before migration)."""
+    try:
+        return {"lessons": read_lessons("nexus_memory.json")}
+    except json.JSONDecodeError:
+        st.warning("⚠️ nexus_memory.json is corrupted. Showing empty memory.")
+        return {"lessons": []}
+    except Exception as e:
+        st.warning(f"⚠️ Failed to load memory: {e}")
+        return {"lessons": []}
 
 
 def parse_agent_info(status_text: str) -> tuple[str, str, str, int]:
@@ -531,3 +524,7 @@ st.markdown("""
     🔮 NexusPrime Multi-LLM Factory | Powered by Claude, Gemini & Grok via GitHub Copilot
 </div>
 """, unsafe_allow_html=True)
+
+# Deferred styles, sent once the main layout is on the page
+st.markdown(get_deferred_styles(), unsafe_allow_html=True)
+st.markdown(get_animation_styles(), unsafe_allow_html=True)
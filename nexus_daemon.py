@@ -9,6 +9,8 @@ This daemon polls the request file every 2-3 seconds and processes incoming requ
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import time
 import os
@@ -16,6 +18,7 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+import orjson
 from dotenv import load_dotenv
 from langchain_core.messages import HumanMessage
 
@@ -24,7 +27,7 @@ load_dotenv()
 
 from nexusprime import build_nexus_factory
 from nexusprime.utils.logging import get_logger
-from nexusprime.utils.status import save_status_snapshot
+from nexusprime.utils.status import flush_status_snapshots, save_status_snapshot, write_status_snapshot
 
 logger = get_logger(__name__)
 
@@ -65,12 +68,11 @@ def archive_request(request_data: Dict[str, Any]) -> None:
         request_data: Request data to archive
     """
     try:
-        # Save to processed file for history
-        with open(PROCESSED_FILE, "w", encoding="utf-8") as f:
-            json.dump({
-                **request_data,
-                "processed_at": datetime.now().isoformat()
-            }, f, indent=2)
+        # Save to processed file for history (serialized first, written in one call)
+        Path(PROCESSED_FILE).write_bytes(orjson.dumps({
+            **request_data,
+            "processed_at": datetime.now().isoformat()
+        }, option=orjson.OPT_INDENT_2))
         
         # Remove original request file
         if Path(REQUEST_FILE).exists():
@@ -108,18 +110,53 @@ def initialize_status(prompt: str, env_mode: str) -> None:
             }
         }
         
-        with open(STATUS_FILE, "w", encoding="utf-8") as f:
-            json.dump(initial_status, f, indent=2)
+        write_status_snapshot(initial_status, STATUS_FILE)
         
         logger.info("Status initialized")
     except Exception as e:
         logger.error(f"Error initializing status: {e}")
 
 
+def get_thread_id(request_data: Dict[str, Any], fresh: bool = False) -> str:
+    """
+    Derive a checkpoint thread ID for a request.
+    
+    Args:
+        request_data: Request data containing prompt and timestamp
+        fresh: Mix in the current time, for a request whose stable thread
+            has already run to completion
+    
+    Returns:
+        Thread ID string
+    """
+    key = f"{request_data.get('timestamp', '')}:{request_data.get('prompt', '')}"
+    if fresh:
+        key = f"{time.time_ns()}:{key}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=1)
+def get_factory():
+    """
+    Build the factory graph once per daemon process.
+    
+    The graph owns the SQLite checkpointer connection, so rebuilding it for
+    every request would open (and leak) a new connection each time.
+    
+    Returns:
+        Compiled StateGraph
+    """
+    logger.info("Building NexusPrime factory...")
+    return build_nexus_factory()
+
+
 def process_request(request_data: Dict[str, Any]) -> None:
     """
     Process a request by running the factory.
     
+    An interrupted run resumes when the same request is processed again; only
+    the first run of a request (its stable thread) can be resumed this way.
+    
     Args:
         request_data: Request data containing prompt and env_mode
     """
@@ -135,9 +172,7 @@ def process_request(request_data: Dict[str, Any]) -> None:
         # Initialize status for dashboard
         initialize_status(prompt, env_mode)
         
-        # Build the factory
-        logger.info("Building NexusPrime factory...")
-        app = build_nexus_factory()
+        app = get_factory()
         
         # Prepare initial state
         initial_state = {
@@ -146,12 +181,23 @@ def process_request(request_data: Dict[str, Any]) -> None:
             "feedback_loop_count": 0
         }
         
-        # Run the factory
-        logger.info("Starting factory execution...")
-        final_state = app.invoke(initial_state)
+        # Resume from the last checkpoint if this request was interrupted. A
+        # finished thread is never invoked again: the new run would inherit its
+        # messages, reviews and tokens, so it gets a fresh thread instead.
+        config = {"configurable": {"thread_id": get_thread_id(request_data)}}
+        checkpoint = app.get_state(config) if app.checkpointer is not None else None
+        if checkpoint is not None and checkpoint.next:
+            logger.info("Resuming factory execution from checkpoint...")
+            final_state = app.invoke(None, config=config)
+        else:
+            if checkpoint is not None and checkpoint.values:
+                config = {"configurable": {"thread_id": get_thread_id(request_data, fresh=True)}}
+            logger.info("Starting factory execution...")
+            final_state = app.invoke(initial_state, config=config)
         
         # Save final status
         save_status_snapshot(final_state, STATUS_FILE)
+        flush_status_snapshots()
         
         logger.info("Factory execution completed")
         logger.info(f"Final Status: {final_state.get('current_status')}")
@@ -161,7 +207,7 @@ def process_request(request_data: Dict[str, Any]) -> None:
     except Exception as e:
         logger.error(f"Error processing request: {e}", exc_info=True)
         
-        # Update status with error
+        # Update status with error (replaces any pending snapshot)
         try:
             error_status = {
                 "current_status": "ERROR",
@@ -177,8 +223,7 @@ def process_request(request_data: Dict[str, Any]) -> None:
                 }
             }
             
-            with open(STATUS_FILE, "w", encoding="utf-8") as f:
-                json.dump(error_status, f, indent=2)
+            write_status_snapshot(error_status, STATUS_FILE)
         except Exception as status_error:
             logger.error(f"Error updating status with error: {status_error}")
 
@@ -203,12 +248,13 @@ def run_daemon() -> None:
             if request_data:
                 logger.info("New request detected!")
                 
-                # Archive the request immediately to prevent reprocessing
-                archive_request(request_data)
-                
-                # Process the request
+                # Process the request (errors are handled and reported in status)
                 process_request(request_data)
                 
+                # Archive only once processed: if the daemon dies mid-run, the
+                # request is picked up again on restart and resumes from its checkpoint
+                archive_request(request_data)
+                
                 logger.info("Request processing completed")
                 logger.info("-" * 60)
             
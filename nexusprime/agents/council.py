@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+from collections import ChainMap
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base import Agent
 from ..core.llm_router import get_llm_router
 from ..core.state import NexusFactoryState
 from ..integrations.memory import NexusMemory
 from ..integrations.github_client import GitHubClient
-from ..utils.tokens import update_token_usage
+from ..utils.tokens import truncate_tokens, update_token_usage
 from ..utils.status import save_status_snapshot
 from ..config import get_settings
 
@@ -63,32 +66,64 @@ class CouncilAgent(Agent):
         spec = state.get("spec_document", "")
         current_code = state.get("previous_code", "")  # Code from Dev Squad
         previous_reviews = state.get("previous_reviews", [])
+        reviewed_versions = state.get("reviewed_versions", [])
+        
+        digest = self._fingerprint_version(spec, current_code)
+        cached = self._find_reviewed_version(digest, reviewed_versions)
+        if cached is not None and not self._is_approved(env, cached["quality_score"]):
+            # Reusing a rejection would hand Dev Squad the same feedback again,
+            # so the retry would resubmit the same code: review it afresh
+            self.log_execution("Code matches a rejected version - reviewing it again")
+            cached = None
+        
+        if cached is not None:
+            self.log_execution("Code matches an already reviewed version - reusing its verdict")
+            final_score = cached["quality_score"]
+            arbitration_reasoning = cached["reasoning"]
+            report = cached["council_report"]
+            review_comments = cached["review_comments"]
+            reviews = cached["previous_reviews"]
+            new_tokens = update_token_usage(state.get("total_tokens", {}), {})
+        else:
+            # Phase 1: Get independent reviews from each model
+            self.log_execution("Phase 1: Gathering independent reviews")
+            opinions = self._gather_independent_reviews(spec, current_code, previous_reviews)
+            
+            # Phase 2: Final arbitration by Claude
+            self.log_execution("Phase 2: Final arbitration")
+            final_score, arbitration_reasoning, usage_total = self._arbitrate_reviews(
+                spec, opinions
+            )
+            
+            # Generate detailed report
+            report = self._generate_report(opinions, final_score, arbitration_reasoning, previous_reviews)
+            new_tokens = update_token_usage(state.get("total_tokens", {}), usage_total)
+            
+            # Format feedback for Dev Squad
+            review_comments = self._format_concerns_for_dev_squad(opinions)
+            reviews = [
+                {
+                    "reviewer": op.reviewer,
+                    "model": op.model,
+                    "score": op.score,
+                    "reasoning": op.reasoning,
+                    "concerns": op.concerns
+                }
+                for op in opinions
+            ]
+            reviewed_versions = reviewed_versions + [{
+                "digest": digest,
+                "quality_score": final_score,
+                "reasoning": arbitration_reasoning,
+                "council_report": report,
+                "review_comments": review_comments,
+                "previous_reviews": reviews
+            }]
         
-        # Phase 1: Get independent reviews from each model
-        self.log_execution("Phase 1: Gathering independent reviews")
-        opinions = self._gather_independent_reviews(spec, current_code, previous_reviews)
-        
-        # Phase 2: Final arbitration by Claude
-        self.log_execution("Phase 2: Final arbitration")
-        final_score, arbitration_reasoning, usage_total = self._arbitrate_reviews(
-            spec, opinions
-        )
-        
-        # Generate detailed report
-        report = self._generate_report(opinions, final_score, arbitration_reasoning, previous_reviews)
         self.logger.info(f"\n{report}")
-        
-        new_tokens = update_token_usage(state.get("total_tokens", {}), usage_total)
-        
         self.logger.info(f"Final quality score: {final_score}/100")
         
-        # Check for approval
-        is_approved = (
-            (env == "DEV" and final_score > self.settings.dev_quality_threshold) or
-            (env == "PROD" and final_score > self.settings.prod_quality_threshold)
-        )
-        
-        if is_approved:
+        if self._is_approved(env, final_score):
             self.log_execution("APPROVAL GRANTED - Archiving lesson")
             
             # Store lesson in memory
@@ -109,9 +144,6 @@ class CouncilAgent(Agent):
                 f"Quality threshold not met ({final_score}). Requesting revision."
             )
         
-        # Format feedback for Dev Squad
-        review_comments = self._format_concerns_for_dev_squad(opinions)
-        
         state_update = {
             "current_status": "Agent: The Council (Multi-LLM Review Complete)",
             "quality_score": final_score,
@@ -119,22 +151,67 @@ class CouncilAgent(Agent):
             "feedback_loop_count": state.get("feedback_loop_count", 0) + 1,
             "total_tokens": new_tokens,
             "review_comments": review_comments,  # For Dev Squad to use
-            "previous_reviews": [  # Store opinions for next review
-                {
-                    "reviewer": op.reviewer,
-                    "model": op.model,
-                    "score": op.score,
-                    "reasoning": op.reasoning,
-                    "concerns": op.concerns
-                }
-                for op in opinions
-            ]
+            "previous_reviews": reviews,  # Store opinions for next review
+            "reviewed_versions": reviewed_versions
         }
         
-        save_status_snapshot({**state, **state_update})
+        save_status_snapshot(ChainMap(state_update, state))
         
         return state_update
     
+    def _is_approved(self, env: str, score: int) -> bool:
+        """
+        Check a quality score against the environment's threshold.
+        
+        Args:
+            env: Environment mode (DEV or PROD)
+            score: Quality score (0-100)
+        
+        Returns:
+            True if the score passes the threshold
+        """
+        return (
+            (env == "DEV" and score > self.settings.dev_quality_threshold) or
+            (env == "PROD" and score > self.settings.prod_quality_threshold)
+        )
+    
+    def _fingerprint_version(self, spec: str, code: str) -> str:
+        """
+        Identify a spec + code version for review reuse.
+        
+        Args:
+            spec: Specification document
+            code: Code under review
+        
+        Returns:
+            SHA-256 hex digest of the spec and code
+        """
+        return hashlib.sha256(f"{spec}\0{code}".encode("utf-8")).hexdigest()
+    
+    def _find_reviewed_version(
+        self,
+        digest: str,
+        reviewed_versions: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a previous review of exactly the same version.
+        
+        Only identical spec + code reuses a verdict: a near-identical fix must be
+        reviewed again, otherwise it would inherit the rejection it addresses.
+        Callers only reuse approvals (see execute).
+        
+        Args:
+            digest: Fingerprint of the version under review
+            reviewed_versions: Previously reviewed versions, oldest first
+        
+        Returns:
+            The most recent matching review, or None
+        """
+        for reviewed in reversed(reviewed_versions):
+            if reviewed["digest"] == digest:
+                return reviewed
+        return None
+    
     def _gather_independent_reviews(
         self, 
         spec: str, 
@@ -172,7 +249,7 @@ class CouncilAgent(Agent):
         
         code_context = ""
         if current_code:
-            code_context = f"\n\nGENERATED CODE (excerpt):\n{current_code[:800]}"
+            code_context = f"\n\nGENERATED CODE (excerpt):\n{truncate_tokens(current_code, 200)}"
         
         review_prompt_template = """You are a strict code auditor reviewing a specification{code_suffix}.
 
@@ -196,19 +273,25 @@ CONCERNS: [comma-separated list of specific concerns, or "None"]"""
         code_suffix = " and implementation" if current_code else ""
         comparison_criteria = "\n5. Progress - If this is a revision, are issues from previous reviews addressed?" if previous_reviews else ""
         
-        for reviewer_name, agent_name in reviewers:
+        review_prompt = review_prompt_template.format(
+            spec=truncate_tokens(spec, 400),
+            code_context=code_context,
+            history_context=history_context,
+            code_suffix=code_suffix,
+            comparison_criteria=comparison_criteria
+        )
+        results = self._fan_out_reviews(
+            router,
+            review_prompt,
+            "You are a strict code auditor. Be thorough and critical.",
+            [agent_name for _, agent_name in reviewers]
+        )
+        
+        for (reviewer_name, agent_name), result in zip(reviewers, results):
             try:
-                response, _ = router.call(
-                    prompt=review_prompt_template.format(
-                        spec=spec[:1500],
-                        code_context=code_context,
-                        history_context=history_context,
-                        code_suffix=code_suffix,
-                        comparison_criteria=comparison_criteria
-                    ),
-                    agent_name=agent_name,
-                    system_prompt="You are a strict code auditor. Be thorough and critical."
-                )
+                if isinstance(result, BaseException):
+                    raise result
+                response, _ = result
                 
                 # Parse the response
                 score = self._extract_score(response)
@@ -246,6 +329,40 @@ CONCERNS: [comma-separated list of specific concerns, or "None"]"""
         
         return opinions
     
+    def _fan_out_reviews(
+        self,
+        router: Any,
+        prompt: str,
+        system_prompt: str,
+        agent_names: List[str]
+    ) -> List[Any]:
+        """
+        Query all reviewers concurrently with the same prompt.
+        
+        Args:
+            router: LLM router
+            prompt: Review prompt
+            system_prompt: Reviewer system prompt
+            agent_names: Reviewer agent names
+        
+        Returns:
+            One (response, usage) tuple or exception per reviewer, in order
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Persistent router loop: the async client and its connections are reused across rounds
+            return router.run_coroutine(router.council_fanout(prompt, system_prompt, agent_names))
+        
+        # Already inside an event loop: fall back to sequential calls
+        results: List[Any] = []
+        for agent_name in agent_names:
+            try:
+                results.append(router.call(prompt=prompt, agent_name=agent_name, system_prompt=system_prompt))
+            except Exception as e:
+                results.append(e)
+        return results
+    
     def _arbitrate_reviews(
         self,
         spec: str,
@@ -278,7 +395,7 @@ Three expert reviewers have evaluated a specification. Your job is to synthesize
 opinions and provide a final, definitive quality score.
 
 SPECIFICATION EXCERPT:
-{spec[:800]}
+{truncate_tokens(spec, 200)}
 
 REVIEWER OPINIONS:
 {opinions_text}
@@ -503,19 +620,20 @@ REASONING: [2-3 sentences explaining your final decision]"""
             github_client = self._get_github_client()
             repo = github_client.get_or_create_repo("nexus-prime-workspace")
             
-            # Push workspace files
+            # Push workspace files in a single commit
             workspace_dir = self.settings.workspace_dir
-            files = ["app_dev.py", "app_prod.py"]
+            files = {
+                fname: os.path.join(workspace_dir, fname)
+                for fname in ("app_dev.py", "app_prod.py")
+                if os.path.exists(os.path.join(workspace_dir, fname))
+            }
             
-            for fname in files:
-                fpath = os.path.join(workspace_dir, fname)
-                if os.path.exists(fpath):
-                    github_client.push_local_file(
-                        repo,
-                        fpath,
-                        fname,
-                        f"Update {fname} by NexusPrime"
-                    )
+            if files:
+                github_client.push_local_files(
+                    repo,
+                    files,
+                    f"Update {', '.join(files)} by NexusPrime"
+                )
             
             self.log_execution("Files pushed to GitHub successfully")
             
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from collections import ChainMap
+from typing import Any, Dict, Tuple
 
 from .base import Agent
 from ..core.llm_router import get_llm_router
@@ -17,21 +18,17 @@ from ..config import get_settings
 class DevSquadAgent(Agent):
     """Dev Squad: Writes code and runs tests."""
     
-    def execute(self, state: NexusFactoryState) -> Dict[str, Any]:
+    def generate_code(self, state: NexusFactoryState) -> Tuple[str, Dict[str, Any]]:
         """
-        Generate code based on specification.
+        Generate code with the LLM, without touching the filesystem.
         
         Args:
             state: Current factory state
         
         Returns:
-            State updates with file system state and token usage
+            Tuple of (code_content, token_usage)
         """
-        self.log_execution("Starting code generation")
-        
-        settings = get_settings()
         spec = state.get("spec_document", "")
-        env = state.get("env_mode", "DEV")
         
         # Check if this is a revision (Council has provided feedback)
         review_comments = state.get("review_comments", "")
@@ -59,16 +56,36 @@ Retourne UNIQUEMENT le code Python amélioré, sans markdown."""
                 f"Return ONLY the code, no markdown.\n\nSPEC:\n{spec}"
             )
         
+        # Not cached: a retry after a rejection must be able to produce new code
+        router = get_llm_router()
+        code_content, usage = router.call(
+            prompt=prompt,
+            agent_name="dev_squad",
+            system_prompt="You are a senior Python developer. Write clean, production-ready code.",
+            cache=False
+        )
+        
+        # Strip markdown code fences if present
+        code_content = code_content.replace("```python", "").replace("```", "").strip()
+        return code_content, usage
+    
+    def execute(self, state: NexusFactoryState) -> Dict[str, Any]:
+        """
+        Generate code based on specification.
+        
+        Args:
+            state: Current factory state
+        
+        Returns:
+            State updates with file system state and token usage
+        """
+        self.log_execution("Starting code generation")
+        
+        settings = get_settings()
+        env = state.get("env_mode", "DEV")
+        
         try:
-            router = get_llm_router()
-            code_content, usage = router.call(
-                prompt=prompt,
-                agent_name="dev_squad",
-                system_prompt="You are a senior Python developer. Write clean, production-ready code."
-            )
-            
-            # Strip markdown code fences if present
-            code_content = code_content.replace("```python", "").replace("```", "").strip()
+            code_content, usage = self.generate_code(state)
             
             # Validate generated code for security
             is_safe, warnings = validate_generated_code(code_content)
@@ -97,7 +114,7 @@ Retourne UNIQUEMENT le code Python amélioré, sans markdown."""
                 "previous_code": code_content  # Store code for Council review
             }
             
-            save_status_snapshot({**state, **state_update})
+            save_status_snapshot(ChainMap(state_update, state))
             self.log_execution("Code generation complete")
             
             return state_update
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import ChainMap
 from typing import Any, Dict
 
 from .base import Agent
@@ -50,7 +51,7 @@ class ProductOwnerAgent(Agent):
                 "total_tokens": new_tokens
             }
             
-            save_status_snapshot({**state, **state_update})
+            save_status_snapshot(ChainMap(state_update, state))
             self.log_execution("Specification created successfully")
             
             return state_update
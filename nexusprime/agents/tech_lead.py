@@ -2,21 +2,43 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import re
+import time
+from collections import ChainMap
+from typing import Any, Dict, Optional
 
 from .base import Agent
 from ..core.llm_router import get_llm_router
 from ..core.state import NexusFactoryState
 from ..integrations.memory import NexusMemory
 from ..integrations.github_client import GitHubClient
-from ..utils.tokens import update_token_usage
+from ..utils.tokens import truncate_tokens, update_token_usage
 from ..utils.status import save_status_snapshot
 from ..config import get_settings
 
+# Keyword heuristics for the PROD/DEV decision (LLM is only asked when ambiguous)
+_PROD_RE = re.compile(
+    r"\b(production|prod|deploy(?:ment)?|SLA|uptime|scal(?:e|able|ability)|enterprise|secure|high[- ]availability)\b",
+    re.IGNORECASE
+)
+_DEV_RE = re.compile(
+    r"\b(prototype|poc|proof[- ]of[- ]concept|demo|mvp|draft|experiment(?:al)?|sandbox|toy|quick|simple)\b",
+    re.IGNORECASE
+)
+_ENV_SCAN_CHARS = 2000
+_ENV_MARGIN = 2
+
 
 class TechLeadAgent(Agent):
     """Tech Lead: Sets up environment and dispatches to Dev Squad."""
     
+    WORKSPACE_REPO = "nexus-prime-workspace"
+    REPO_CACHE_TTL = 3600.0  # seconds
+    
+    # Resolved workspace repo URL, shared across instances (one per node run)
+    _repo_url_cache: Optional[str] = None
+    _repo_url_cached_at: float = 0.0
+    
     def __init__(self):
         """Initialize Tech Lead agent."""
         super().__init__()
@@ -30,6 +52,48 @@ class TechLeadAgent(Agent):
             self.github_client = GitHubClient()
         return self.github_client
     
+    def _classify_env(self, spec: str) -> Optional[str]:
+        """
+        Classify the environment from spec keywords.
+        
+        Args:
+            spec: Specification document
+        
+        Returns:
+            "PROD" or "DEV" if the keywords are decisive, None if ambiguous
+        """
+        excerpt = spec[:_ENV_SCAN_CHARS]
+        prod_hits = len(_PROD_RE.findall(excerpt))
+        dev_hits = len(_DEV_RE.findall(excerpt))
+        
+        if prod_hits - dev_hits >= _ENV_MARGIN:
+            return "PROD"
+        if dev_hits - prod_hits >= _ENV_MARGIN:
+            return "DEV"
+        return None
+    
+    def _get_repo_url(self) -> str:
+        """
+        Get the workspace repository URL, creating the repo if needed.
+        Cached at class level so graph retries skip the GitHub round-trip.
+        
+        Returns:
+            Repository HTML URL
+        """
+        cls = type(self)
+        if cls._repo_url_cache is not None and time.monotonic() - cls._repo_url_cached_at < cls.REPO_CACHE_TTL:
+            return cls._repo_url_cache
+        
+        github_client = self._get_github_client()
+        repo = github_client.get_or_create_repo(
+            self.WORKSPACE_REPO,
+            description="Automated Factory Workspace",
+            private=True
+        )
+        cls._repo_url_cache = repo.html_url
+        cls._repo_url_cached_at = time.monotonic()
+        return repo.html_url
+    
     def execute(self, state: NexusFactoryState) -> Dict[str, Any]:
         """
         Set up environment and retrieve context from memory.
@@ -48,38 +112,38 @@ class TechLeadAgent(Agent):
         memory_ctx = self.memory.retrieve_context(spec)
         self.logger.info(f"Retrieved context: {len(memory_ctx)} characters")
         
-        # 2. Determine environment (AI decision)
-        env_prompt = (
-            f"Based on this compiled spec, does the user want a Production-ready system "
-            f"or a Prototype? Return ONLY 'PROD' or 'DEV'.\n\nSPEC EXCERPT:\n{spec[:500]}"
-        )
-        
-        try:
-            router = get_llm_router()
-            env_decision, usage = router.call(
-                prompt=env_prompt,
-                agent_name="tech_lead",
-                system_prompt="You are a Tech Lead. Output only PROD or DEV."
-            )
-            env_mode = "PROD" if "PROD" in env_decision.upper() else "DEV"
-            new_tokens = update_token_usage(state.get("total_tokens", {}), usage)
-        except Exception as e:
-            self.logger.error(f"Failed to determine environment, defaulting to DEV: {e}")
-            env_mode = "DEV"
+        # 2. Determine environment (keyword heuristic, AI decision if ambiguous)
+        env_mode = self._classify_env(spec)
+        if env_mode is not None:
+            self.logger.info(f"Environment decided by keywords: {env_mode}")
             new_tokens = state.get("total_tokens", {})
+        else:
+            env_prompt = (
+                f"Based on this compiled spec, does the user want a Production-ready system "
+                f"or a Prototype? Return ONLY 'PROD' or 'DEV'.\n\nSPEC EXCERPT:\n{truncate_tokens(spec, 150)}"
+            )
+            
+            try:
+                router = get_llm_router()
+                env_decision, usage = router.call(
+                    prompt=env_prompt,
+                    agent_name="tech_lead",
+                    system_prompt="You are a Tech Lead. Output only PROD or DEV."
+                )
+                env_mode = "PROD" if "PROD" in env_decision.upper() else "DEV"
+                self.logger.info(f"Environment decided by LLM: {env_mode}")
+                new_tokens = update_token_usage(state.get("total_tokens", {}), usage)
+            except Exception as e:
+                self.logger.error(f"Failed to determine environment, defaulting to DEV: {e}")
+                env_mode = "DEV"
+                new_tokens = state.get("total_tokens", {})
         
         self.logger.info(f"Environment set to: {env_mode}")
         
         # 3. GitHub integration
         repo_url = "N/A"
         try:
-            github_client = self._get_github_client()
-            repo = github_client.get_or_create_repo(
-                "nexus-prime-workspace",
-                description="Automated Factory Workspace",
-                private=True
-            )
-            repo_url = repo.html_url
+            repo_url = self._get_repo_url()
         except Exception as e:
             self.logger.error(f"GitHub setup error (non-blocking): {e}")
         
@@ -91,7 +155,7 @@ class TechLeadAgent(Agent):
             "total_tokens": new_tokens
         }
         
-        save_status_snapshot({**state, **state_update})
+        save_status_snapshot(ChainMap(state_update, state))
         self.log_execution("Environment setup complete")
         
         return state_update
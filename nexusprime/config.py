@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     workspace_dir: str = "workspace"
     memory_file: str = "nexus_memory.json"
     status_file: str = "status.json"
+    checkpoint_file: str = "status.db"
     
     model_config = SettingsConfigDict(
         env_file=".env",
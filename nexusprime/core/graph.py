@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import logging
+import sqlite3
+from typing import Any, Dict, Optional
+
 from langgraph.graph import StateGraph, END
 
 from .state import NexusFactoryState
@@ -11,6 +15,15 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Optional: SQLite checkpointer (langgraph-checkpoint-sqlite)
+try:
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+    from langgraph.checkpoint.sqlite import SqliteSaver
+    CHECKPOINT_AVAILABLE = True
+except ImportError:
+    CHECKPOINT_AVAILABLE = False
+    logger.warning("langgraph-checkpoint-sqlite not available. Graph runs will not be checkpointed.")
+
 
 def product_owner_node(state: NexusFactoryState) -> dict:
     """Product Owner node."""
@@ -36,6 +49,22 @@ def council_node(state: NexusFactoryState) -> dict:
     return agent.execute(state)
 
 
+_thresholds: Dict[str, int] = {}
+_thresholds_source: Optional[Any] = None
+
+
+def _get_thresholds(settings: Any) -> Dict[str, int]:
+    """Return the env -> quality threshold map, rebuilt only when settings change."""
+    global _thresholds, _thresholds_source
+    if settings is not _thresholds_source:
+        _thresholds = {
+            "DEV": settings.dev_quality_threshold,
+            "PROD": settings.prod_quality_threshold,
+        }
+        _thresholds_source = settings
+    return _thresholds
+
+
 def route_council(state: NexusFactoryState) -> str:
     """
     Decide if code is approved or needs rework.
@@ -47,8 +76,6 @@ def route_council(state: NexusFactoryState) -> str:
         Next node name: "approved", "rejected", or "failed"
     """
     settings = get_settings()
-    score = state.get("quality_score", 0)
-    env = state.get("env_mode", "DEV")
     loop_count = state.get("feedback_loop_count", 0)
     
     # Safety exit
@@ -56,22 +83,56 @@ def route_council(state: NexusFactoryState) -> str:
         logger.warning(f"Maximum feedback loops ({settings.max_feedback_loops}) exceeded")
         return "failed"
     
-    # Check quality thresholds
-    if env == "DEV" and score > settings.dev_quality_threshold:
-        logger.info(f"DEV approval: score {score} > {settings.dev_quality_threshold}")
-        return "approved"
-    elif env == "PROD" and score > settings.prod_quality_threshold:
-        logger.info(f"PROD approval: score {score} > {settings.prod_quality_threshold}")
-        return "approved"
-    else:
-        logger.info(f"Rejected: score {score} does not meet threshold for {env}")
-        return "rejected"
+    # Check quality thresholds (unknown environments are always rejected)
+    score = state.get("quality_score", 0)
+    env = state.get("env_mode", "DEV")
+    threshold = _get_thresholds(settings).get(env)
+    decision = "approved" if threshold is not None and score > threshold else "rejected"
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Council {decision}: env={env} score={score} threshold={threshold}")
+    return decision
+
+
+def get_checkpointer(checkpoint_file: Optional[str] = None) -> Optional[Any]:
+    """
+    Create a SQLite checkpointer so interrupted runs can resume without
+    re-running completed nodes.
+    
+    Args:
+        checkpoint_file: Path to SQLite database (default: settings.checkpoint_file)
+    
+    Returns:
+        SqliteSaver instance, or None if unavailable
+    """
+    if not CHECKPOINT_AVAILABLE:
+        return None
+    
+    if checkpoint_file is None:
+        checkpoint_file = get_settings().checkpoint_file
+    
+    try:
+        # State carries TokenUsage; allow it explicitly for msgpack deserialization
+        serde = JsonPlusSerializer(allowed_msgpack_modules=[("nexusprime.utils.tokens", "TokenUsage")])
+    except TypeError:  # older langgraph without msgpack allow-lists
+        serde = None
+    
+    try:
+        conn = sqlite3.connect(checkpoint_file, check_same_thread=False)
+        return SqliteSaver(conn, serde=serde)
+    except sqlite3.Error as e:
+        logger.error(f"Failed to open checkpoint database {checkpoint_file}: {e}")
+        return None
 
 
-def build_nexus_factory() -> StateGraph:
+def build_nexus_factory(checkpointer: Optional[Any] = None, use_checkpointer: bool = True) -> StateGraph:
     """
     Build and compile the NexusPrime factory graph.
     
+    Args:
+        checkpointer: Explicit LangGraph checkpointer (default: SQLite checkpointer)
+        use_checkpointer: Whether to checkpoint state after each node
+    
     Returns:
         Compiled StateGraph
     """
@@ -102,7 +163,10 @@ def build_nexus_factory() -> StateGraph:
         }
     )
     
-    compiled = workflow.compile()
+    if checkpointer is None and use_checkpointer:
+        checkpointer = get_checkpointer()
+    
+    compiled = workflow.compile(checkpointer=checkpointer)
     logger.info("NexusPrime factory graph compiled successfully")
     
     return compiled
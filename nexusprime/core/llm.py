@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import threading
-from typing import Dict, Tuple
+from typing import Dict, Tuple, TYPE_CHECKING
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from ..config import get_settings
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
 logger = get_logger(__name__)
 
 
@@ -30,6 +32,9 @@ def get_llm() -> ChatGoogleGenerativeAI:
         with _llm_lock:
             # Double-check locking pattern
             if _llm_instance is None:
+                # Deferred: the Google SDK is slow to import and unused by Claude-only runs
+                from langchain_google_genai import ChatGoogleGenerativeAI
+                
                 settings = get_settings()
                 _llm_instance = ChatGoogleGenerativeAI(
                     model=settings.llm_model,
@@ -4,19 +4,39 @@ Routes to Anthropic API, Google AI API, and GitHub Models API based on model.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import os
+import random
 import threading
+import time
+import weakref
+from concurrent.futures import Future
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any, Tuple, Optional
+from types import MappingProxyType
+from typing import Callable, Coroutine, Dict, Any, Iterator, List, Mapping, Sequence, Tuple, Optional, TypeVar
 
 import httpx
+import orjson
 
 from ..utils.logging import get_logger
 from ..utils.security import get_required_env
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+try:
+    import h2  # noqa: F401 - requis par httpx pour HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+    logger.warning("h2 not installed. LLM router will use HTTP/1.1. Install with: pip install 'httpx[http2]'")
+
 
 class LLMProvider(str, Enum):
     """Modèles disponibles via différentes APIs."""
@@ -39,6 +59,19 @@ class LLMConfig:
     max_tokens: int = 8192
 
 
+# Configuration des agents non mappés, construite une seule fois
+_DEFAULT_CONFIG = LLMConfig(LLMProvider.CLAUDE_SONNET_4)
+
+
+@dataclass(frozen=True)
+class _CompiledPlan:
+    """Configuration d'appel résolue une fois (modèle, paramètres, méthode API)."""
+    model: str
+    temperature: float
+    max_tokens: int
+    method: Callable[..., Tuple[str, Dict[str, Any]]]
+
+
 class GitHubModelsRouter:
     """
     Router Multi-LLM supportant plusieurs APIs.
@@ -52,8 +85,21 @@ class GitHubModelsRouter:
     ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
     ANTHROPIC_VERSION = "2023-06-01"
     
-    # Mapping Agent → Modèle optimal
-    AGENT_MODEL_MAP: Dict[str, LLMConfig] = {
+    # Connexions ouvertes à l'avance (HTTP/1.1 : une par requête concurrente du conseil)
+    PREWARM_CONNECTIONS = 5
+    
+    # Cache des réponses déterministes (température basse uniquement)
+    CACHE_MAX_ENTRIES = 512
+    CACHE_MAX_TEMPERATURE = 0.3
+    
+    # Réessais sur erreurs transitoires (rate limit, passerelle), en respectant Retry-After
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    RETRY_MAX_ATTEMPTS = 5
+    RETRY_INITIAL_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    
+    # Mapping Agent → Modèle optimal (lecture seule : les plans sont compilés à partir de lui)
+    AGENT_MODEL_MAP: Mapping[str, LLMConfig] = MappingProxyType({
         # Claude Sonnet 4 (Anthropic API) pour l'analyse et le code
         "product_owner": LLMConfig(LLMProvider.CLAUDE_SONNET_4, temperature=0.3),
         "dev_squad": LLMConfig(LLMProvider.CLAUDE_SONNET_4, temperature=0.1),
@@ -66,37 +112,187 @@ class GitHubModelsRouter:
         # GitHub Models API pour le conseil
         "council_grok": LLMConfig(LLMProvider.GROK_3, temperature=0.4),
         "council_gpt": LLMConfig(LLMProvider.GPT_5, temperature=0.4),
-    }
+    })
     
     # Alias pour compatibilité
     AGENT_MODEL_MAPPING = AGENT_MODEL_MAP
     
-    def __init__(self):
-        """Initialise le router avec les tokens nécessaires."""
+    def __init__(self, prewarm: bool = False):
+        """
+        Initialise le router avec les tokens nécessaires.
+        
+        Args:
+            prewarm: Ouvrir les connexions TLS en arrière-plan dès la construction
+        """
         self.github_token = get_required_env("GITHUB_TOKEN")
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         self.google_api_key = os.getenv("GOOGLE_API_KEY")
-        self._client = httpx.Client(timeout=120.0)
+        self._client = httpx.Client(
+            timeout=httpx.Timeout(connect=10.0, read=120.0, write=60.0, pool=5.0),
+            # Le transport réessaie les échecs de connexion ; les statuts sont gérés par _post
+            transport=httpx.HTTPTransport(
+                retries=3,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+            ),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        # Ferme le pool même si close() n'est jamais appelé (singleton)
+        self._finalizer = weakref.finalize(self, self._client.close)
+        # Client async créé à la demande, lié à la boucle d'événements courante
+        self._aclient: httpx.AsyncClient | None = None
+        self._aclient_loop: asyncio.AbstractEventLoop | None = None
+        # Boucle persistante (thread dédié) de run_coroutine(), créée à la demande
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+        # Nombre maximal de requêtes LLM simultanées (sync et async séparément)
+        self._concurrency = int(os.getenv("NEXUS_LLM_CONCURRENCY", "8"))
+        self._sema = threading.Semaphore(self._concurrency)
+        self._asema: asyncio.Semaphore | None = None
         self._google_genai = None  # Lazy loading
+        self._cache: OrderedDict[str, Tuple[str, Dict[str, Any]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self.cache_stats = {"hits": 0, "misses": 0}
+        
+        # Headers et plans d'appel construits une seule fois
+        # (l'auth reste par requête : le client est partagé entre fournisseurs)
+        self._github_headers = {"Authorization": f"Bearer {self.github_token}"}
+        self._anthropic_headers: Optional[Dict[str, str]] = None
+        self._agent_plans: Dict[str, _CompiledPlan] = {
+            name: self._compile_plan(config) for name, config in self.AGENT_MODEL_MAP.items()
+        }
+        self._default_plan = self._compile_plan(_DEFAULT_CONFIG)
+        # Plans override_model compilés à la demande, par (modèle, température)
+        self._override_plans: Dict[Tuple[LLMProvider, float], _CompiledPlan] = {}
+        
+        if prewarm:
+            self._start_prewarm()
         logger.info("🔌 Multi-API LLM Router initialisé")
     
+    def _start_prewarm(self) -> None:
+        """Lance des requêtes HEAD en arrière-plan pour remplir le pool keep-alive."""
+        urls = [self.GITHUB_MODELS_URL]
+        if self.anthropic_api_key:
+            urls.append(self.ANTHROPIC_API_URL)
+        # HTTP/2 multiplexe sur une seule connexion par hôte
+        per_host = 1 if HTTP2_AVAILABLE else self.PREWARM_CONNECTIONS
+        
+        for url in urls:
+            for _ in range(per_host):
+                threading.Thread(target=self._prewarm, args=(url,), daemon=True).start()
+    
+    def _prewarm(self, url: str) -> None:
+        """Ouvre une connexion vers l'hôte de url (le statut de la réponse est ignoré)."""
+        try:
+            self._client.head(url)
+        except Exception as e:
+            logger.debug(f"Pré-chauffage de {url} échoué: {e}")
+    
+    def close(self) -> None:
+        """Ferme les clients HTTP (sync et async), leurs connexions keep-alive et la boucle persistante."""
+        self._finalizer()
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._aclient is not None and self._aclient_loop is loop:
+            try:
+                asyncio.run_coroutine_threadsafe(self._aclient.aclose(), loop).result(timeout=5)
+            except Exception as e:
+                logger.debug(f"Fermeture du client async échouée: {e}")
+            self._aclient = None
+            self._aclient_loop = None
+        loop.call_soon_threadsafe(loop.stop)
+    
+    def __enter__(self) -> GitHubModelsRouter:
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _compile_plan(self, config: LLMConfig) -> _CompiledPlan:
+        """Résout la méthode API et les paramètres d'une configuration."""
+        model = config.provider.value
+        
+        if model == LLMProvider.CLAUDE_SONNET_4.value:
+            method = self._call_anthropic  # Anthropic API
+        elif model == LLMProvider.GEMINI_3_PRO.value:
+            method = self._call_google  # Google AI API
+        elif model in (LLMProvider.GROK_3.value, LLMProvider.GPT_5.value):
+            method = self._call_github_models  # GitHub Models API
+        else:
+            # Fallback vers GitHub Models pour compatibilité
+            logger.warning(f"Modèle inconnu '{model}', utilisation GitHub Models API")
+            method = self._call_github_models
+        
+        return _CompiledPlan(model, config.temperature, config.max_tokens, method)
+    
+    @classmethod
+    def _retry_delay(cls, response: httpx.Response, attempt: int) -> float:
+        """Délai avant le prochain essai : Retry-After si présent, sinon backoff exponentiel avec jitter."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), cls.RETRY_MAX_DELAY)
+        
+        backoff = cls.RETRY_INITIAL_DELAY * 2 ** attempt
+        return min(backoff + random.uniform(0, cls.RETRY_INITIAL_DELAY), cls.RETRY_MAX_DELAY)
+    
+    def _post(self, url: str, headers: Dict[str, str], content: bytes) -> httpx.Response:
+        """POST borné par le sémaphore, réessayé sur 429/502/503/504."""
+        for attempt in range(self.RETRY_MAX_ATTEMPTS):
+            with self._sema:
+                response = self._client.post(url, headers=headers, content=content)
+            if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.RETRY_MAX_ATTEMPTS - 1:
+                return response
+            delay = self._retry_delay(response, attempt)
+            logger.warning(
+                f"⏳ {url} a répondu {response.status_code}, nouvel essai dans {delay:.1f}s "
+                f"({attempt + 1}/{self.RETRY_MAX_ATTEMPTS - 1})"
+            )
+            time.sleep(delay)
+        return response
+    
+    async def _apost(self, url: str, headers: Dict[str, str], content: bytes) -> httpx.Response:
+        """Version asynchrone de _post()."""
+        client = self._get_async_client()
+        for attempt in range(self.RETRY_MAX_ATTEMPTS):
+            async with self._asema:
+                response = await client.post(url, headers=headers, content=content)
+            if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.RETRY_MAX_ATTEMPTS - 1:
+                return response
+            delay = self._retry_delay(response, attempt)
+            logger.warning(
+                f"⏳ {url} a répondu {response.status_code}, nouvel essai dans {delay:.1f}s "
+                f"({attempt + 1}/{self.RETRY_MAX_ATTEMPTS - 1})"
+            )
+            await asyncio.sleep(delay)
+        return response
+    
     def _get_github_headers(self) -> Dict[str, str]:
         """Retourne les headers pour l'API GitHub Models."""
-        return {
-            "Authorization": f"Bearer {self.github_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        return self._github_headers
     
     def _get_anthropic_headers(self) -> Dict[str, str]:
-        """Retourne les headers pour l'API Anthropic."""
-        if not self.anthropic_api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required for Claude models")
-        return {
-            "x-api-key": self.anthropic_api_key,
-            "anthropic-version": self.ANTHROPIC_VERSION,
-            "Content-Type": "application/json",
-        }
+        """Retourne les headers pour l'API Anthropic (clé relue si absente à l'init)."""
+        if self._anthropic_headers is None:
+            if not self.anthropic_api_key:
+                self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
+            if not self.anthropic_api_key:
+                raise ValueError("ANTHROPIC_API_KEY environment variable is required for Claude models")
+            self._anthropic_headers = {
+                "x-api-key": self.anthropic_api_key,
+                "anthropic-version": self.ANTHROPIC_VERSION,
+            }
+        return self._anthropic_headers
     
     def _init_google_genai(self):
         """Initialise le SDK Google Generative AI (lazy loading)."""
@@ -112,6 +308,43 @@ class GitHubModelsRouter:
                 raise ImportError("google-generativeai package is required. Install it with: pip install google-generativeai")
         return self._google_genai
     
+    @staticmethod
+    def _anthropic_payload(
+        prompt: str,
+        system_prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """Construit le corps d'une requête Anthropic Messages."""
+        return {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system_prompt,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ]
+        }
+    
+    @staticmethod
+    def _parse_anthropic(data: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Extrait le texte et l'usage d'une réponse Anthropic."""
+        content = data["content"][0]["text"]
+        usage = data.get("usage", {})
+        
+        usage_formatted = {
+            "prompt_tokens": usage.get("input_tokens", 0),
+            "completion_tokens": usage.get("output_tokens", 0),
+            "total_token_count": usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+        }
+        
+        logger.info(
+            f"✅ Réponse Anthropic ({usage_formatted['total_token_count']} tokens)"
+        )
+        
+        return content, usage_formatted
+    
     def _call_anthropic(
         self,
         prompt: str,
@@ -135,39 +368,16 @@ class GitHubModelsRouter:
         """
         logger.info(f"🤖 Appel Anthropic API avec modèle: {model}")
         
-        payload = {
-            "model": model,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "system": system_prompt,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ]
-        }
+        payload = self._anthropic_payload(prompt, system_prompt, model, temperature, max_tokens)
         
         try:
-            response = self._client.post(
+            response = self._post(
                 self.ANTHROPIC_API_URL,
-                headers=self._get_anthropic_headers(),
-                json=payload
+                self._get_anthropic_headers(),
+                orjson.dumps(payload)
             )
             response.raise_for_status()
-            data = response.json()
-            
-            content = data["content"][0]["text"]
-            usage = data.get("usage", {})
-            
-            usage_formatted = {
-                "prompt_tokens": usage.get("input_tokens", 0),
-                "completion_tokens": usage.get("output_tokens", 0),
-                "total_token_count": usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
-            }
-            
-            logger.info(
-                f"✅ Réponse Anthropic ({usage_formatted['total_token_count']} tokens)"
-            )
-            
-            return content, usage_formatted
+            return self._parse_anthropic(orjson.loads(response.content))
             
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -178,6 +388,67 @@ class GitHubModelsRouter:
             logger.error(f"❌ Erreur inattendue Anthropic: {e}")
             raise
     
+    def _iter_sse_events(self, url: str, headers: Dict[str, str], payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Envoie payload en streaming SSE et produit les événements JSON décodés.
+        
+        Les événements sont découpés par index dans un unique bytearray pour
+        éviter un décodage utf-8 et une chaîne par ligne reçue.
+        
+        Args:
+            url: URL de l'API
+            headers: Headers d'authentification
+            payload: Corps de la requête (la clé "stream" est ajoutée)
+            
+        Yields:
+            Événements décodés (la sentinelle [DONE] est ignorée)
+        """
+        with self._client.stream(
+            "POST",
+            url,
+            headers=headers,
+            content=orjson.dumps({**payload, "stream": True})
+        ) as response:
+            response.raise_for_status()
+            buf = bytearray()
+            for chunk in response.iter_bytes():
+                buf += chunk
+                while (end := buf.find(b"\n\n")) != -1:
+                    start = buf.find(b"data: ", 0, end)
+                    data = bytes(buf[start + 6:end]) if start != -1 else None
+                    del buf[:end + 2]
+                    if data is not None and data != b"[DONE]":
+                        yield orjson.loads(data)
+    
+    def _iter_anthropic_deltas(
+        self,
+        payload: Dict[str, Any],
+        usage: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Appelle l'API Anthropic en streaming SSE et produit les fragments de texte.
+        
+        Args:
+            payload: Corps de la requête Anthropic (sans la clé "stream")
+            usage: Dict optionnel complété avec prompt/completion tokens
+            
+        Yields:
+            Fragments de texte générés
+        """
+        for event in self._iter_sse_events(self.ANTHROPIC_API_URL, self._get_anthropic_headers(), payload):
+            event_type = event.get("type")
+            if event_type == "content_block_delta":
+                text = event.get("delta", {}).get("text")
+                if text:
+                    yield text
+            elif usage is not None and event_type == "message_start":
+                usage["prompt_tokens"] = event["message"].get("usage", {}).get("input_tokens", 0)
+            elif usage is not None and event_type == "message_delta":
+                usage["completion_tokens"] = event.get("usage", {}).get("output_tokens", 0)
+        
+        if usage is not None:
+            usage["total_token_count"] = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+    
     def _call_google(
         self,
         prompt: str,
@@ -247,6 +518,76 @@ class GitHubModelsRouter:
             logger.error(f"❌ Erreur Google AI API: {e}")
             raise
     
+    @staticmethod
+    def _github_payload(
+        prompt: str,
+        system_prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """Construit le corps d'une requête GitHub Models (format chat completions)."""
+        return {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+    
+    @staticmethod
+    def _parse_github(data: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Extrait le texte et l'usage d'une réponse GitHub Models."""
+        content = data["choices"][0]["message"]["content"]
+        usage = data.get("usage", {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0
+        })
+        
+        # Format usage for backward compatibility
+        usage_formatted = {
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "total_token_count": usage.get("total_tokens", 0)
+        }
+        
+        logger.info(
+            f"✅ Réponse GitHub Models ({usage_formatted['total_token_count']} tokens)"
+        )
+        
+        return content, usage_formatted
+    
+    def _iter_github_deltas(
+        self,
+        payload: Dict[str, Any],
+        usage: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Appelle l'API GitHub Models en streaming SSE et produit les fragments de texte.
+        
+        Args:
+            payload: Corps de la requête chat/completions (sans la clé "stream")
+            usage: Dict optionnel complété avec l'usage envoyé dans le dernier événement
+            
+        Yields:
+            Fragments de texte générés
+        """
+        if usage is not None:
+            payload = {**payload, "stream_options": {"include_usage": True}}
+        
+        for event in self._iter_sse_events(self.GITHUB_MODELS_URL, self._get_github_headers(), payload):
+            for choice in event.get("choices") or ():
+                text = (choice.get("delta") or {}).get("content")
+                if text:
+                    yield text
+            if usage is not None and event.get("usage"):
+                usage["prompt_tokens"] = event["usage"].get("prompt_tokens", 0)
+                usage["completion_tokens"] = event["usage"].get("completion_tokens", 0)
+                usage["total_token_count"] = event["usage"].get("total_tokens", 0)
+    
     def _call_github_models(
         self,
         prompt: str,
@@ -270,44 +611,16 @@ class GitHubModelsRouter:
         """
         logger.info(f"🤖 Appel GitHub Models API avec modèle: {model}")
         
-        payload = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
+        payload = self._github_payload(prompt, system_prompt, model, temperature, max_tokens)
         
         try:
-            response = self._client.post(
+            response = self._post(
                 self.GITHUB_MODELS_URL,
-                headers=self._get_github_headers(),
-                json=payload
+                self._get_github_headers(),
+                orjson.dumps(payload)
             )
             response.raise_for_status()
-            data = response.json()
-            
-            content = data["choices"][0]["message"]["content"]
-            usage = data.get("usage", {
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0
-            })
-            
-            # Format usage for backward compatibility
-            usage_formatted = {
-                "prompt_tokens": usage.get("prompt_tokens", 0),
-                "completion_tokens": usage.get("completion_tokens", 0),
-                "total_token_count": usage.get("total_tokens", 0)
-            }
-            
-            logger.info(
-                f"✅ Réponse GitHub Models ({usage_formatted['total_token_count']} tokens)"
-            )
-            
-            return content, usage_formatted
+            return self._parse_github(orjson.loads(response.content))
             
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -324,7 +637,8 @@ class GitHubModelsRouter:
         agent_name: str,
         system_prompt: str = "You are a helpful assistant.",
         custom_config: LLMConfig | None = None,
-        override_model: Optional[LLMProvider] = None
+        override_model: Optional[LLMProvider] = None,
+        cache: bool = True
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Appelle le LLM approprié en routant vers la bonne API.
@@ -335,6 +649,8 @@ class GitHubModelsRouter:
             system_prompt: Le prompt système
             custom_config: Configuration personnalisée (optionnel, legacy)
             override_model: Forcer un modèle spécifique (optionnel)
+            cache: Servir/stocker la réponse dans le cache (False pour les
+                appels rejoués en boucle, dont la réponse doit pouvoir changer)
             
         Returns:
             Tuple (réponse, usage_metadata)
@@ -343,63 +659,256 @@ class GitHubModelsRouter:
             ValueError: Si le modèle ou l'API key est invalide
             httpx.HTTPStatusError: Si l'API retourne une erreur
         """
-        # Get configuration - custom_config has priority for backward compatibility
+        # Get plan - custom_config has priority for backward compatibility
         if custom_config:
-            config = custom_config
+            plan = self._compile_plan(custom_config)
         elif override_model:
-            base_config = self.AGENT_MODEL_MAP.get(
-                agent_name, 
-                LLMConfig(LLMProvider.CLAUDE_SONNET_4)
-            )
-            config = LLMConfig(override_model, base_config.temperature)
+            temperature = self._agent_plans.get(agent_name, self._default_plan).temperature
+            plan = self._override_plans.get((override_model, temperature))
+            if plan is None:
+                plan = self._compile_plan(LLMConfig(override_model, temperature))
+                self._override_plans[(override_model, temperature)] = plan
         else:
-            config = self.AGENT_MODEL_MAP.get(
-                agent_name, 
-                LLMConfig(LLMProvider.CLAUDE_SONNET_4)
-            )
+            plan = self._agent_plans.get(agent_name, self._default_plan)
         
-        logger.info(f"🤖 Agent '{agent_name}' → Modèle: {config.provider.value}")
+        logger.info(f"🤖 Agent '{agent_name}' → Modèle: {plan.model}")
         
-        model = config.provider.value
+        if not cache or plan.temperature > self.CACHE_MAX_TEMPERATURE:
+            # Appel hors cache ou volontairement stochastique : ni cache ni regroupement
+            return self._dispatch(plan, prompt, system_prompt)
         
-        # Router vers la bonne API selon le modèle
-        if model == LLMProvider.CLAUDE_SONNET_4.value:
-            # Anthropic API
-            return self._call_anthropic(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                model=model,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens
-            )
-        elif model == LLMProvider.GEMINI_3_PRO.value:
-            # Google AI API
-            return self._call_google(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                model=model,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens
+        cache_key = self._cache_key(plan, prompt, system_prompt)
+        pending: Future | None = None
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+            else:
+                # Une requête identique est peut-être déjà en vol : on l'attend
+                pending = self._inflight.get(cache_key)
+                if pending is None:
+                    future: Future = Future()
+                    self._inflight[cache_key] = future
+            self.cache_stats["misses" if cached is None and pending is None else "hits"] += 1
+        
+        if cached is None and pending is not None:
+            logger.info(f"⏳ Requête identique en cours pour '{agent_name}', attente du résultat")
+            cached = pending.result()
+        if cached is not None:
+            logger.info(f"♻️ Réponse servie depuis le cache pour '{agent_name}'")
+            # Aucun token consommé pour une réponse en cache
+            return cached[0], {"prompt_tokens": 0, "completion_tokens": 0, "total_token_count": 0}
+        
+        try:
+            content, usage = self._dispatch(plan, prompt, system_prompt)
+        except BaseException as e:
+            with self._cache_lock:
+                del self._inflight[cache_key]
+            future.set_exception(e)
+            raise
+        
+        with self._cache_lock:
+            self._cache[cache_key] = (content, usage)
+            if len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+            del self._inflight[cache_key]
+        future.set_result((content, usage))
+        
+        return content, usage
+    
+    @staticmethod
+    def _dispatch(plan: _CompiledPlan, prompt: str, system_prompt: str) -> Tuple[str, Dict[str, Any]]:
+        """Appelle l'API correspondant au plan."""
+        return plan.method(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=plan.model,
+            temperature=plan.temperature,
+            max_tokens=plan.max_tokens
+        )
+    
+    @staticmethod
+    def _cache_key(plan: _CompiledPlan, prompt: str, system_prompt: str) -> str:
+        """Clé SHA-256 d'un appel (modèle, paramètres, prompts)."""
+        raw = orjson.dumps([plan.model, round(plan.temperature, 2), plan.max_tokens, system_prompt, prompt])
+        return hashlib.sha256(raw).hexdigest()
+
+    def stream(
+        self,
+        prompt: str,
+        agent_name: str,
+        system_prompt: str = "You are a helpful assistant.",
+        usage: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Comme call(), mais produit la réponse par fragments au fil de la génération.
+        
+        Les modèles Claude et GitHub Models sont streamés ; Gemini produit
+        sa réponse complète en un seul fragment.
+        
+        Args:
+            prompt: Le prompt utilisateur
+            agent_name: Nom de l'agent (product_owner, dev_squad, etc.)
+            system_prompt: Le prompt système
+            usage: Dict optionnel complété avec l'usage de tokens en fin de flux
+            
+        Yields:
+            Fragments de texte générés
+        """
+        plan = self._agent_plans.get(agent_name, self._default_plan)
+        logger.info(f"🤖 Agent '{agent_name}' → Modèle: {plan.model} (stream)")
+        
+        if plan.method == self._call_anthropic:
+            yield from self._iter_anthropic_deltas(
+                self._anthropic_payload(prompt, system_prompt, plan.model, plan.temperature, plan.max_tokens),
+                usage
             )
-        elif model in [LLMProvider.GROK_3.value, LLMProvider.GPT_5.value]:
-            # GitHub Models API
-            return self._call_github_models(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                model=model,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens
+        elif plan.method == self._call_github_models:
+            yield from self._iter_github_deltas(
+                self._github_payload(prompt, system_prompt, plan.model, plan.temperature, plan.max_tokens),
+                usage
             )
         else:
-            # Fallback vers GitHub Models pour compatibilité
-            logger.warning(f"Modèle inconnu '{model}', utilisation GitHub Models API")
-            return self._call_github_models(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                model=model,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens
+            content, call_usage = self.call(prompt, agent_name, system_prompt)
+            if usage is not None:
+                usage.update(call_usage)
+            yield content
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Fait tourner la boucle persistante jusqu'à close(), puis la ferme."""
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+        loop.close()
+    
+    def run_coroutine(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Exécute une coroutine sur la boucle persistante du router et attend son résultat.
+        
+        Contrairement à asyncio.run() (nouvelle boucle, donc nouveau client async
+        à chaque appel), le client async et ses connexions keep-alive sont
+        réutilisés d'un appel à l'autre.
+        
+        Args:
+            coro: Coroutine à exécuter (ex: council_fanout(...))
+            
+        Returns:
+            Résultat de la coroutine
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._run_loop, args=(self._loop,), name="nexus-llm-loop", daemon=True
+                ).start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Retourne le client async de la boucle courante (recréé si la boucle a changé)."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            if self._aclient is not None:
+                self._discard_async_client(self._aclient, self._aclient_loop, loop)
+            self._aclient = httpx.AsyncClient(
+                timeout=httpx.Timeout(connect=10.0, read=120.0, write=60.0, pool=5.0),
+                transport=httpx.AsyncHTTPTransport(
+                    retries=3,
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+                ),
+                headers={"Content-Type": "application/json", "Accept": "application/json"},
             )
+            self._asema = asyncio.Semaphore(self._concurrency)
+            self._aclient_loop = loop
+        return self._aclient
+    
+    @staticmethod
+    def _discard_async_client(
+        client: httpx.AsyncClient,
+        client_loop: asyncio.AbstractEventLoop | None,
+        loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Ferme (sans attendre) le client async d'une boucle précédente."""
+        def log_failure(future: Any) -> None:
+            if not future.cancelled() and future.exception() is not None:
+                logger.debug(f"Fermeture de l'ancien client async échouée: {future.exception()}")
+        
+        if client_loop is not None and client_loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+        else:
+            # Boucle d'origine arrêtée : la fermeture se fait sur la boucle courante
+            future = loop.create_task(client.aclose())
+        future.add_done_callback(log_failure)
+    
+    async def acall(
+        self,
+        prompt: str,
+        agent_name: str,
+        system_prompt: str = "You are a helpful assistant."
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Version asynchrone de call() pour paralléliser des appels indépendants.
+        
+        Les appels Anthropic et GitHub Models stochastiques passent par un
+        httpx.AsyncClient partagé. Les appels Gemini (SDK synchrone) et les
+        appels mis en cache délèguent à call() dans un thread.
+        
+        Args:
+            prompt: Le prompt utilisateur
+            agent_name: Nom de l'agent (council_gpt, council_claude, etc.)
+            system_prompt: Le prompt système
+            
+        Returns:
+            Tuple (réponse, usage_metadata)
+        """
+        plan = self._agent_plans.get(agent_name, self._default_plan)
+        
+        if plan.temperature <= self.CACHE_MAX_TEMPERATURE or plan.method == self._call_google:
+            return await asyncio.to_thread(self.call, prompt, agent_name, system_prompt)
+        
+        if plan.method == self._call_anthropic:
+            url, headers = self.ANTHROPIC_API_URL, self._get_anthropic_headers()
+            build_payload, parse, api_name = self._anthropic_payload, self._parse_anthropic, "Anthropic"
+        else:
+            url, headers = self.GITHUB_MODELS_URL, self._get_github_headers()
+            build_payload, parse, api_name = self._github_payload, self._parse_github, "GitHub Models"
+        
+        logger.info(f"🤖 Agent '{agent_name}' → Modèle: {plan.model} (async)")
+        payload = build_payload(prompt, system_prompt, plan.model, plan.temperature, plan.max_tokens)
+        
+        try:
+            response = await self._apost(url, headers, orjson.dumps(payload))
+            response.raise_for_status()
+            return parse(orjson.loads(response.content))
+        except httpx.HTTPStatusError as e:
+            logger.error(f"❌ Erreur {api_name} API: {e.response.status_code} - {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"❌ Erreur inattendue {api_name}: {e}")
+            raise
+    
+    async def council_fanout(
+        self,
+        prompt: str,
+        system_prompt: str,
+        agent_names: Sequence[str] = ("council_gpt", "council_gemini", "council_claude")
+    ) -> List[Tuple[str, Dict[str, Any]] | BaseException]:
+        """
+        Interroge plusieurs agents du conseil en parallèle avec le même prompt.
+        
+        Args:
+            prompt: Le prompt de revue
+            system_prompt: Le prompt système
+            agent_names: Agents à interroger
+            
+        Returns:
+            Résultats dans l'ordre de agent_names ; un échec est renvoyé comme exception
+        """
+        return await asyncio.gather(
+            *(self.acall(prompt, name, system_prompt) for name in agent_names),
+            return_exceptions=True
+        )
 
     def list_available_models(self) -> list[str]:
         """Retourne la liste des modèles disponibles."""
@@ -407,33 +916,38 @@ class GitHubModelsRouter:
     
     def get_model_for_agent(self, agent_name: str) -> str:
         """Retourne le modèle configuré pour un agent."""
-        config = self.AGENT_MODEL_MAP.get(agent_name)
-        if config:
-            return config.provider.value
-        return LLMProvider.CLAUDE_SONNET_4.value
+        return self._agent_plans.get(agent_name, self._default_plan).model
 
 
 # Aliases pour rétrocompatibilité
 CopilotLLMRouter = GitHubModelsRouter
 
 
-# Singleton instance
-_router_instance: GitHubModelsRouter | None = None
-_router_lock = threading.Lock()
-
-
+# Singleton : lru_cache sert l'instance sans verrou ni test global à chaque appel
+@functools.lru_cache(maxsize=1)
 def get_llm_router() -> GitHubModelsRouter:
     """
-    Retourne l'instance singleton du router (thread-safe).
+    Retourne l'instance singleton du router.
+    
+    Le premier appel a lieu dans le premier nœud du graphe, avant toute
+    exécution parallèle ; get_llm_router.cache_clear() ferme puis réinitialise l'instance.
     
     Returns:
         GitHubModelsRouter instance
     """
-    global _router_instance
-    if _router_instance is None:
-        with _router_lock:
-            # Double-check locking pattern
-            if _router_instance is None:
-                _router_instance = GitHubModelsRouter()
-                logger.info("LLM router singleton created")
-    return _router_instance
+    router = GitHubModelsRouter(prewarm=True)
+    logger.info("LLM router singleton created")
+    return router
+
+
+_clear_llm_router_cache = get_llm_router.cache_clear
+
+
+def _close_llm_router() -> None:
+    """Ferme le singleton courant (clients HTTP, boucle) avant de l'oublier."""
+    if get_llm_router.cache_info().currsize:
+        get_llm_router().close()
+    _clear_llm_router_cache()
+
+
+get_llm_router.cache_clear = _close_llm_router
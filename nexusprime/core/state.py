@@ -7,6 +7,8 @@ from typing import Annotated, Dict, List, Literal, TypedDict
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
+from ..utils.tokens import TokenUsage
+
 
 class NexusFactoryState(TypedDict):
     """
@@ -22,6 +24,7 @@ class NexusFactoryState(TypedDict):
     quality_score: int                                    # 0-100 score from Council
     review_comments: str                                  # Feedback from Council
     memory_context: str                                   # Retrieved lessons from NexusMemory
-    total_tokens: Dict[str, int]                          # Token Usage Tracking
+    total_tokens: TokenUsage                              # Token Usage Tracking
     previous_code: str                                    # Code from previous version
     previous_reviews: List[Dict]                          # Previous reviews from Council
+    reviewed_versions: List[Dict]                         # Council verdicts per reviewed code version
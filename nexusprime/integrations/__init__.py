@@ -1,6 +1,6 @@
 """Integration modules for NexusPrime."""
 
-from .memory import NexusMemory
+from .memory import NexusMemory, read_lessons
 from .github_client import GitHubClient
 
-__all__ = ['NexusMemory', 'GitHubClient']
+__all__ = ['NexusMemory', 'GitHubClient', 'read_lessons']
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import mmap
 import os
-from typing import Optional
+import time
+from typing import Dict, Mapping, Optional, Tuple, Union
 
-from github import Github
+from github import Github, GithubException, InputGitTreeElement
 from github.Repository import Repository
 
 from ..utils.logging import get_logger
@@ -14,9 +18,33 @@ from ..utils.security import get_required_env
 logger = get_logger(__name__)
 
 
+def git_blob_sha(content: Union[str, bytes]) -> str:
+    """Return the git blob SHA-1 of content (as reported by the contents API)."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def read_local_bytes(local_path: str) -> bytes:
+    """Read a local file through a read-only memory map, without decoding."""
+    with open(local_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses empty files
+            return b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:]
+
+
 class GitHubClient:
     """Client for GitHub API operations."""
     
+    REPO_CACHE_TTL = 3600.0  # seconds
+    FILE_SHA_CACHE_TTL = 300.0  # seconds, bounds how long a remote edit can go unnoticed
+    
+    # Shared across instances: agents create a new client per run.
+    # Values are (entry, time.monotonic() when stored).
+    _repo_cache: Dict[str, Tuple[Repository, float]] = {}
+    _file_sha_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+    
     def __init__(self, token: Optional[str] = None):
         """
         Initialize GitHub client.
@@ -27,10 +55,28 @@ class GitHubClient:
         if token is None:
             token = get_required_env("GITHUB_TOKEN")
         
-        self.github = Github(token)
+        self.github = Github(token, per_page=100, pool_size=10)
         self.user = self.github.get_user()
         logger.info(f"GitHub client initialized for user: {self.user.login}")
     
+    @classmethod
+    def _cached_file_sha(cls, repo: Repository, file_path: str) -> Optional[str]:
+        """Return the last pushed blob SHA of a file, or None if unknown or expired."""
+        cached = cls._file_sha_cache.get((repo.full_name, file_path))
+        if cached is None or time.monotonic() - cached[1] >= cls.FILE_SHA_CACHE_TTL:
+            return None
+        return cached[0]
+    
+    @classmethod
+    def _remember_file_sha(cls, repo: Repository, file_path: str, blob_sha: str) -> None:
+        """Record the blob SHA just pushed (or found) for a file."""
+        cls._file_sha_cache[(repo.full_name, file_path)] = (blob_sha, time.monotonic())
+    
+    @classmethod
+    def _forget_file_sha(cls, repo: Repository, file_path: str) -> None:
+        """Drop a file's cached SHA so the next push checks the remote again."""
+        cls._file_sha_cache.pop((repo.full_name, file_path), None)
+    
     def get_or_create_repo(self, repo_name: str, description: str = "", private: bool = True) -> Repository:
         """
         Get existing repository or create new one.
@@ -43,9 +89,14 @@ class GitHubClient:
         Returns:
             Repository object
         """
+        cached = self._repo_cache.get(repo_name)
+        if cached is not None and time.monotonic() - cached[1] < self.REPO_CACHE_TTL:
+            return cached[0]
+        
         try:
             repo = self.user.get_repo(repo_name)
             logger.info(f"Found existing repo: {repo.html_url}")
+            self._repo_cache[repo_name] = (repo, time.monotonic())
             return repo
         except Exception as e:
             logger.info(f"Repository {repo_name} not found, creating new one")
@@ -56,6 +107,7 @@ class GitHubClient:
                     private=private
                 )
                 logger.info(f"Created new repo: {repo.html_url}")
+                self._repo_cache[repo_name] = (repo, time.monotonic())
                 return repo
             except Exception as create_error:
                 logger.error(f"Failed to create repository: {create_error}")
@@ -65,7 +117,7 @@ class GitHubClient:
         self,
         repo: Repository,
         file_path: str,
-        content: str,
+        content: Union[str, bytes],
         commit_message: str
     ) -> None:
         """
@@ -74,18 +126,28 @@ class GitHubClient:
         Args:
             repo: Repository object
             file_path: Path to file in repository
-            content: File content
+            content: File content (bytes are base64-encoded as-is)
             commit_message: Commit message
         """
+        blob_sha = git_blob_sha(content)
+        if self._cached_file_sha(repo, file_path) == blob_sha:
+            logger.info(f"Unchanged file, skipping: {file_path}")
+            return
+        
         try:
             # Try to get existing file
             contents = repo.get_contents(file_path)
+            if contents.sha == blob_sha:
+                self._remember_file_sha(repo, file_path, blob_sha)
+                logger.info(f"Unchanged file, skipping: {file_path}")
+                return
             repo.update_file(
                 contents.path,
                 commit_message,
                 content,
                 contents.sha
             )
+            self._remember_file_sha(repo, file_path, blob_sha)
             logger.info(f"Updated file: {file_path}")
         except Exception:
             # File doesn't exist, create it
@@ -95,8 +157,10 @@ class GitHubClient:
                     commit_message,
                     content
                 )
+                self._remember_file_sha(repo, file_path, blob_sha)
                 logger.info(f"Created file: {file_path}")
             except Exception as e:
+                self._forget_file_sha(repo, file_path)
                 logger.error(f"Failed to create/update file {file_path}: {e}")
                 raise
     
@@ -117,10 +181,101 @@ class GitHubClient:
             commit_message: Commit message
         """
         try:
-            with open(local_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            self.create_or_update_file(repo, repo_path, content, commit_message)
+            content = read_local_bytes(local_path)
         except (OSError, IOError) as e:
             logger.error(f"Failed to read local file {local_path}: {e}")
             raise
+        
+        self.create_or_update_file(repo, repo_path, content, commit_message)
+    
+    def push_many(
+        self,
+        repo: Repository,
+        files: Mapping[str, Union[str, bytes]],
+        commit_message: str
+    ) -> Optional[str]:
+        """
+        Push several files in a single commit through the Git Data API.
+        
+        Unchanged files are skipped. Falls back to per-file commits when the
+        default branch has no commit yet.
+        
+        Args:
+            repo: Repository object
+            files: Mapping of repository path to file content (bytes are
+                uploaded as base64 blobs, so they need not be UTF-8)
+            commit_message: Commit message
+        
+        Returns:
+            SHA of the new commit, or None if nothing changed
+        """
+        changed = {
+            path: content for path, content in files.items()
+            if self._cached_file_sha(repo, path) != git_blob_sha(content)
+        }
+        if not changed:
+            logger.info("No file changes to push")
+            return None
+        
+        try:
+            ref = repo.get_git_ref(f"heads/{repo.default_branch}")
+        except GithubException as e:
+            # 404/409: empty repository; auth, rate-limit and other errors propagate
+            if e.status not in (404, 409):
+                raise
+            logger.info("Branch has no commits yet, pushing files one by one")
+            for path, content in changed.items():
+                self.create_or_update_file(repo, path, content, commit_message)
+            return None
+        
+        try:
+            base_commit = repo.get_git_commit(ref.object.sha)
+            elements = [self._tree_element(repo, path, content) for path, content in changed.items()]
+            tree = repo.create_git_tree(elements, base_commit.tree)
+            commit = repo.create_git_commit(commit_message, tree, [base_commit])
+            ref.edit(commit.sha)
+        except Exception as e:
+            logger.error(f"Failed to push {len(changed)} files: {e}")
+            for path in changed:
+                self._forget_file_sha(repo, path)
+            raise
+        
+        for path, content in changed.items():
+            self._remember_file_sha(repo, path, git_blob_sha(content))
+        logger.info(f"Pushed {len(changed)} files in commit {commit.sha[:7]}")
+        return commit.sha
+    
+    @staticmethod
+    def _tree_element(repo: Repository, path: str, content: Union[str, bytes]) -> InputGitTreeElement:
+        """Build a tree entry: text inline, bytes through a base64 blob."""
+        if isinstance(content, str):
+            return InputGitTreeElement(path, "100644", "blob", content=content)
+        blob = repo.create_git_blob(base64.b64encode(content).decode("ascii"), "base64")
+        return InputGitTreeElement(path, "100644", "blob", sha=blob.sha)
+    
+    def push_local_files(
+        self,
+        repo: Repository,
+        paths: Mapping[str, str],
+        commit_message: str
+    ) -> Optional[str]:
+        """
+        Push several local files in a single commit.
+        
+        Args:
+            repo: Repository object
+            paths: Mapping of repository path to local file path
+            commit_message: Commit message
+        
+        Returns:
+            SHA of the new commit, or None if nothing changed
+        """
+        files = {}
+        for repo_path, local_path in paths.items():
+            try:
+                files[repo_path] = read_local_bytes(local_path)
+            except (OSError, IOError) as e:
+                logger.error(f"Failed to read local file {local_path}: {e}")
+                raise
+        
+        return self.push_many(repo, files, commit_message)
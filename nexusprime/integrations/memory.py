@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import heapq
 import os
+import platform
+import string
 import uuid
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set
+
+import orjson
 
 from ..utils.logging import get_logger
 
@@ -21,11 +27,129 @@ except ImportError:
     EMBEDDINGS_AVAILABLE = False
     logger.warning("sentence-transformers not available. Falling back to keyword search.")
 
+# Optional: advisory file locks (POSIX only)
+try:
+    import fcntl
+    FILE_LOCKS_AVAILABLE = True
+except ImportError:
+    FILE_LOCKS_AVAILABLE = False
+
+
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# Pre-quantized int8 ONNX exports shipped in the model repository
+_ONNX_QINT8_FILES = {
+    "arm64": "onnx/model_qint8_arm64.onnx",
+    "aarch64": "onnx/model_qint8_arm64.onnx",
+}
+_ONNX_QINT8_DEFAULT = "onnx/model_quint8_avx2.onnx"
+
+# Below this many lessons the int8 index is not worth its quantization pass
+INT8_INDEX_MIN_ROWS = 256
+# Candidates ranked by the int8 index per requested lesson, re-scored in float32
+INT8_RESCORE_FACTOR = 4
+
+# Keyword tokenization: lowercase, punctuation replaced by spaces
+_PUNCTUATION_TABLE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Split text into a set of lowercase words without punctuation."""
+    return set(text.lower().translate(_PUNCTUATION_TABLE).split())
+
+
+def _load_embedding_model() -> Any:
+    """
+    Load the sentence-transformers model in the cheapest available precision.
+    
+    Tries the int8-quantized ONNX export first (needs onnxruntime/optimum),
+    then the torch model, converted to FP16 when CUDA is available.
+    
+    Returns:
+        Loaded SentenceTransformer model
+    """
+    onnx_file = _ONNX_QINT8_FILES.get(platform.machine().lower(), _ONNX_QINT8_DEFAULT)
+    try:
+        model = SentenceTransformer(EMBEDDING_MODEL, backend="onnx", model_kwargs={"file_name": onnx_file})
+        logger.info(f"Embeddings model loaded: {EMBEDDING_MODEL} (ONNX int8)")
+        return model
+    except Exception as e:
+        logger.warning(f"Quantized ONNX embeddings unavailable ({e}). Using the torch model.")
+    
+    model = SentenceTransformer(EMBEDDING_MODEL)
+    try:
+        import torch
+        if torch.cuda.is_available():
+            model = model.half()
+            logger.info(f"Embeddings model loaded: {EMBEDDING_MODEL} (FP16 on CUDA)")
+            return model
+    except ImportError:
+        pass
+    
+    logger.info(f"Embeddings model loaded: {EMBEDDING_MODEL}")
+    return model
+
+
+def read_lessons(memory_path: str = "nexus_memory.json") -> List[Dict[str, Any]]:
+    """
+    Read the live lessons of a memory store without loading models or indexes.
+
+    Reads the JSONL log and drops tombstoned rows; before migration, reads the
+    legacy JSON file instead. Meant for read-only consumers such as the dashboard.
+
+    Args:
+        memory_path: Path to legacy JSON storage file (sibling files share its base name)
+
+    Returns:
+        Live lessons in storage order
+
+    Raises:
+        orjson.JSONDecodeError: If the legacy JSON file is invalid
+        OSError: If a storage file cannot be read
+    """
+    base, _ = os.path.splitext(memory_path)
+    lessons_path = f"{base}.jsonl"
+    deleted_path = f"{base}.deleted"
+
+    if not os.path.exists(lessons_path):
+        if not os.path.exists(memory_path):
+            return []
+        with open(memory_path, "rb") as f:
+            lessons = orjson.loads(f.read()).get("lessons", [])
+        for lesson in lessons:
+            lesson.pop("embedding", None)
+        return lessons
+
+    deleted = b""
+    if os.path.exists(deleted_path):
+        with open(deleted_path, "rb") as f:
+            deleted = f.read()
+
+    lessons = []
+    with open(lessons_path, "rb") as f:
+        for row, line in enumerate(f):
+            if row < len(deleted) and deleted[row]:
+                continue
+            try:
+                lessons.append(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Skipping invalid lesson at line {row + 1}: {e}")
+    return lessons
+
 
 class NexusMemory:
     """
     Enhanced auto-learning module for NexusPrime with RAG capabilities.
     Stores lessons from past successes/failures and retrieves them using embeddings.
+    
+    Storage is append-only, next to memory_path:
+    - <base>.jsonl: one lesson per line (row i = line i)
+    - <base>.npy: float32 embedding matrix, row-aligned, grown in powers of two
+    - <base>.deleted: one tombstone byte per row (missing bytes = live)
+    A legacy <base>.json file is migrated on first load.
+    
+    Appends and tombstones hold an exclusive lock on the .jsonl file and take
+    row numbers from the log itself, so several instances can share the files.
     """
     
     def __init__(self, memory_path: str = "nexus_memory.json", use_embeddings: bool = True):
@@ -33,50 +157,222 @@ class NexusMemory:
         Initialize NexusMemory.
         
         Args:
-            memory_path: Path to JSON storage file
+            memory_path: Path to legacy JSON storage file (sibling files share its base name)
             use_embeddings: Whether to use embeddings (requires sentence-transformers)
         """
         self.memory_path = memory_path
+        base, _ = os.path.splitext(memory_path)
+        self.lessons_path = f"{base}.jsonl"
+        self.embeddings_path = f"{base}.npy"
+        self.deleted_path = f"{base}.deleted"
+        
         self.use_embeddings = use_embeddings and EMBEDDINGS_AVAILABLE
         self.model: Optional[Any] = None
+        # Row of each live lesson in the on-disk files
+        self._row_of: Dict[str, int] = {}
+        self._num_rows = 0
+        # Size of the log when _num_rows was last counted (detects foreign appends)
+        self._log_size = 0
+        # Memory-mapped (capacity, dim) embedding matrix
+        self._embeddings: Optional[Any] = None
+        # L2-normalized embeddings (one row per lesson in _emb_lessons)
+        self._emb_matrix: Optional[Any] = None
+        self._emb_lessons: List[Dict[str, Any]] = []
+        # int8 copy of _emb_matrix (scale 127), built once the index is large enough
+        self._emb_matrix_q: Optional[Any] = None
+        # Keyword fallback: word -> IDs of lessons whose topic/context contain it
+        self._inv_index: Dict[str, Set[str]] = defaultdict(set)
+        self._lessons_by_id: Dict[str, Dict[str, Any]] = {}
         
         if self.use_embeddings:
             try:
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')
-                logger.info("Embeddings model loaded: all-MiniLM-L6-v2")
+                self.model = _load_embedding_model()
             except Exception as e:
                 logger.warning(f"Failed to load embeddings model: {e}. Falling back to keyword search.")
                 self.use_embeddings = False
         
         self._load_memory()
+        self._rebuild_embedding_index()
     
     def _load_memory(self) -> None:
         """Load memory from disk."""
-        if os.path.exists(self.memory_path):
-            try:
-                with open(self.memory_path, "r", encoding="utf-8") as f:
-                    self.data = json.load(f)
-                logger.info(f"Memory loaded: {len(self.data.get('lessons', []))} lessons")
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in memory file: {e}")
-                self.data = {"lessons": []}
-            except (OSError, IOError) as e:
-                logger.error(f"Failed to load memory file: {e}")
-                self.data = {"lessons": []}
+        self.data = {"lessons": []}
+        self._row_of = {}
+        self._num_rows = 0
+        self._log_size = 0
+        
+        if os.path.exists(self.lessons_path):
+            self._load_lessons_log()
+        elif os.path.exists(self.memory_path):
+            self._migrate_json_memory()
         else:
-            self.data = {"lessons": []}
             logger.info("No existing memory file. Starting fresh.")
+        
+        self._inv_index = defaultdict(set)
+        self._lessons_by_id = {}
+        self._index_keywords(self.data["lessons"])
     
-    def _save_memory(self) -> None:
-        """Save memory to disk."""
+    def _load_lessons_log(self) -> None:
+        """Stream the JSONL lesson log, skipping tombstoned rows."""
         try:
-            with open(self.memory_path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Memory saved to {self.memory_path}")
+            deleted = b""
+            if os.path.exists(self.deleted_path):
+                with open(self.deleted_path, "rb") as f:
+                    deleted = f.read()
+            
+            with open(self.lessons_path, "rb") as f:
+                for row, line in enumerate(f):
+                    self._num_rows = row + 1
+                    if row < len(deleted) and deleted[row]:
+                        continue
+                    try:
+                        lesson = orjson.loads(line)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"Skipping invalid lesson at line {row + 1}: {e}")
+                        continue
+                    self._row_of[lesson["id"]] = row
+                    self.data["lessons"].append(lesson)
+                self._log_size = f.tell()
+            
+            if self.use_embeddings and os.path.exists(self.embeddings_path):
+                self._embeddings = np.load(self.embeddings_path, mmap_mode="r+")
+            
+            logger.info(f"Memory loaded: {len(self.data['lessons'])} lessons")
+        except (OSError, IOError) as e:
+            logger.error(f"Failed to load memory file: {e}")
+            self.data = {"lessons": []}
+            self._row_of = {}
+    
+    def _migrate_json_memory(self) -> None:
+        """Convert a legacy JSON memory file to the append-only layout."""
+        try:
+            with open(self.memory_path, "rb") as f:
+                legacy = orjson.loads(f.read())
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in memory file: {e}")
+            return
+        except (OSError, IOError) as e:
+            logger.error(f"Failed to load memory file: {e}")
+            return
+        
+        lessons = legacy.get("lessons", [])
+        embeddings = [lesson.pop("embedding", None) for lesson in lessons]
+        self._append_lessons(lessons, embeddings)
+        self.data["lessons"] = lessons
+        logger.info(f"Migrated {len(lessons)} lessons from {self.memory_path} to {self.lessons_path}")
+    
+    def _append_lessons(
+        self,
+        lessons: List[Dict[str, Any]],
+        embeddings: List[Optional[Any]]
+    ) -> None:
+        """Append lessons to the log and their embeddings to the matrix (O(new rows))."""
+        try:
+            with self._locked_log() as f:
+                start = self._sync_row_count(f)
+                f.write(b"".join(orjson.dumps(lesson, option=orjson.OPT_APPEND_NEWLINE) for lesson in lessons))
+                f.flush()
+                self._log_size = f.tell()
+                self._num_rows = start + len(lessons)
+                logger.debug(f"Memory saved to {self.lessons_path}")
+                
+                for offset, lesson in enumerate(lessons):
+                    self._row_of[lesson["id"]] = start + offset
+                
+                if (self.use_embeddings or EMBEDDINGS_AVAILABLE) and any(e is not None for e in embeddings):
+                    try:
+                        self._write_embeddings(start, embeddings)
+                    except (OSError, IOError, ValueError) as e:
+                        logger.error(f"Failed to save embeddings: {e}")
         except (OSError, IOError) as e:
             logger.error(f"Failed to save memory: {e}")
     
-    def _compute_embedding(self, text: str) -> Optional[List[float]]:
+    @contextmanager
+    def _locked_log(self) -> Iterator[BinaryIO]:
+        """Open the lesson log for appending under an exclusive lock."""
+        with open(self.lessons_path, "a+b") as f:
+            if FILE_LOCKS_AVAILABLE:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield f
+    
+    def _sync_row_count(self, f: BinaryIO) -> int:
+        """
+        Return the number of rows in the locked log, ready for appending.
+        
+        Recounts the lines when another instance appended since this one last
+        looked, and terminates a torn last line so it stays a row of its own.
+        
+        Args:
+            f: Lesson log opened by _locked_log
+        
+        Returns:
+            Row number of the next appended lesson
+        """
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+                size += 1
+                self._log_size = -1
+        if size == self._log_size:
+            return self._num_rows
+        
+        f.seek(0)
+        self._num_rows = f.read().count(b"\n")
+        self._log_size = size
+        # Another instance may have grown (replaced) the embedding file
+        if EMBEDDINGS_AVAILABLE and os.path.exists(self.embeddings_path):
+            self._embeddings = np.load(self.embeddings_path, mmap_mode="r+")
+        return self._num_rows
+    
+    def _write_embeddings(self, start: int, embeddings: List[Optional[Any]]) -> None:
+        """Write embedding rows, growing the memory-mapped matrix when needed."""
+        needed = start + len(embeddings)
+        dim = len(next(e for e in embeddings if e is not None))
+        if self._embeddings is None or self._embeddings.shape[0] < needed:
+            self._grow_embeddings(needed, dim)
+        
+        for offset, embedding in enumerate(embeddings):
+            if embedding is not None:
+                self._embeddings[start + offset] = embedding
+        self._embeddings.flush()
+    
+    def _grow_embeddings(self, needed: int, dim: int) -> None:
+        """Reallocate the embedding file to the next power of two >= needed rows."""
+        capacity = 1 << max(needed - 1, 0).bit_length()
+        tmp_path = f"{self.embeddings_path}.tmp"
+        grown = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(capacity, dim))
+        if self._embeddings is not None:
+            grown[:self._embeddings.shape[0]] = self._embeddings
+        grown.flush()
+        del grown
+        self._embeddings = None
+        os.replace(tmp_path, self.embeddings_path)
+        self._embeddings = np.load(self.embeddings_path, mmap_mode="r+")
+    
+    def _rebuild_embedding_index(self) -> None:
+        """Rebuild the normalized embedding matrix from the stored embeddings."""
+        self._emb_matrix = None
+        self._emb_matrix_q = None
+        self._emb_lessons = []
+        if not self.use_embeddings or self._embeddings is None:
+            return
+        
+        capacity = self._embeddings.shape[0]
+        candidates = [l for l in self.data["lessons"] if self._row_of.get(l["id"], capacity) < capacity]
+        if not candidates:
+            return
+        
+        matrix = np.asarray(self._embeddings[[self._row_of[l["id"]] for l in candidates]], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1)
+        # All-zero rows belong to lessons stored without an embedding
+        mask = norms > 0
+        if mask.any():
+            self._emb_matrix = matrix[mask] / norms[mask, None]
+            self._emb_lessons = [l for l, keep in zip(candidates, mask) if keep]
+    
+    def _compute_embedding(self, text: str) -> Optional[Any]:
         """
         Compute embedding for text.
         
@@ -90,12 +386,33 @@ class NexusMemory:
             return None
         
         try:
-            embedding = self.model.encode(text)
-            return embedding.tolist()
+            # float32 ndarray end-to-end (an FP16 model would otherwise return float16)
+            return np.asarray(self.model.encode(text, normalize_embeddings=True), dtype=np.float32)
         except Exception as e:
             logger.error(f"Failed to compute embedding: {e}")
             return None
     
+    def embed_texts(self, texts: List[str]) -> Optional[Any]:
+        """
+        Embed several texts in one batch with the memory's model.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            (len(texts), dim) float32 array of normalized embeddings, or None if unavailable
+        """
+        if not self.use_embeddings or self.model is None or not texts:
+            return None
+        
+        try:
+            return np.asarray(self.model.encode(
+                texts, batch_size=64, normalize_embeddings=True, show_progress_bar=False
+            ), dtype=np.float32)
+        except Exception as e:
+            logger.error(f"Failed to compute embeddings: {e}")
+            return None
+    
     def store_lesson(
         self,
         topic: str,
@@ -115,30 +432,91 @@ class NexusMemory:
         Returns:
             Unique lesson ID
         """
-        lesson_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
-        
         # Compute embedding from topic + context
-        embedding_text = f"{topic} {context}"
-        embedding = self._compute_embedding(embedding_text)
+        embedding = self._compute_embedding(f"{topic} {context}")
+        lesson = self._build_lesson(topic, context, outcome, solution)
+        
+        self._append_lessons([lesson], [embedding])
+        self._index_lessons([lesson], [embedding])
+        self._index_keywords([lesson])
+        self.data["lessons"].append(lesson)
+        
+        logger.info(f"Lesson stored: {topic} (ID: {lesson['id']})")
+        return lesson["id"]
+    
+    def store_lessons_bulk(self, lessons: List[Dict[str, str]]) -> List[str]:
+        """
+        Save several lessons with one batched embedding pass and one disk write.
+        
+        Args:
+            lessons: Dicts with "topic", "context", "outcome" and "solution" keys
         
-        lesson: Dict[str, Any] = {
-            "id": lesson_id,
+        Returns:
+            Unique lesson IDs, in input order
+        """
+        if not lessons:
+            return []
+        
+        batch = self.embed_texts([f"{l['topic']} {l['context']}" for l in lessons])
+        embeddings: List[Optional[Any]] = list(batch) if batch is not None else [None] * len(lessons)
+        
+        stored = [
+            self._build_lesson(l["topic"], l["context"], l["outcome"], l["solution"])
+            for l in lessons
+        ]
+        self._append_lessons(stored, embeddings)
+        self._index_lessons(stored, embeddings)
+        self._index_keywords(stored)
+        self.data["lessons"].extend(stored)
+        
+        logger.info(f"{len(stored)} lessons stored")
+        return [lesson["id"] for lesson in stored]
+    
+    def _build_lesson(self, topic: str, context: str, outcome: str, solution: str) -> Dict[str, Any]:
+        """Create a lesson record."""
+        return {
+            "id": str(uuid.uuid4()),
             "topic": topic,
             "context": context,
             "outcome": outcome,
             "solution": solution,
-            "timestamp": timestamp
+            "timestamp": datetime.now().isoformat()
         }
-        
-        if embedding is not None:
-            lesson["embedding"] = embedding
-        
-        self.data["lessons"].append(lesson)
-        self._save_memory()
-        
-        logger.info(f"Lesson stored: {topic} (ID: {lesson_id})")
-        return lesson_id
+    
+    def _index_lessons(
+        self,
+        lessons: List[Dict[str, Any]],
+        embeddings: List[Optional[Any]]
+    ) -> None:
+        """Append the embeddings of new lessons to the similarity index in one stack."""
+        embedded = [(l, e) for l, e in zip(lessons, embeddings) if e is not None]
+        if not self.use_embeddings or not embedded:
+            return
+        
+        rows = np.asarray([e for _, e in embedded], dtype=np.float32)
+        rows /= np.linalg.norm(rows, axis=1, keepdims=True) + 1e-12
+        self._emb_matrix = rows if self._emb_matrix is None else np.vstack([self._emb_matrix, rows])
+        if self._emb_matrix_q is not None:
+            self._emb_matrix_q = np.vstack([self._emb_matrix_q, self._quantize(rows)])
+        self._emb_lessons.extend(l for l, _ in embedded)
+    
+    @staticmethod
+    def _quantize(vectors: Any) -> Any:
+        """Quantize L2-normalized vectors (components in [-1, 1]) to int8."""
+        return np.rint(vectors * 127).astype(np.int8)
+    
+    def _quantized_index(self) -> Optional[Any]:
+        """Return the int8 index, or None while the float32 matrix is small."""
+        if self._emb_matrix_q is None and len(self._emb_matrix) >= INT8_INDEX_MIN_ROWS:
+            self._emb_matrix_q = self._quantize(self._emb_matrix)
+        return self._emb_matrix_q
+    
+    def _index_keywords(self, lessons: Iterable[Dict[str, Any]]) -> None:
+        """Add lessons to the keyword inverted index."""
+        for lesson in lessons:
+            self._lessons_by_id[lesson["id"]] = lesson
+            for word in _tokenize(f"{lesson['topic']} {lesson['context']}"):
+                self._inv_index[word].add(lesson["id"])
     
     def retrieve_context(self, query: str, top_k: int = 5) -> str:
         """
@@ -170,36 +548,37 @@ class NexusMemory:
             logger.warning("Failed to compute query embedding, falling back to keywords")
             return self._retrieve_with_keywords(query, top_k)
         
-        # Filter lessons that have embeddings
-        lessons_with_embeddings = [
-            l for l in self.data["lessons"] if "embedding" in l
-        ]
-        
-        if not lessons_with_embeddings:
+        if self._emb_matrix is None:
             logger.warning("No lessons with embeddings found, falling back to keywords")
             return self._retrieve_with_keywords(query, top_k)
         
-        # Compute similarities efficiently
-        query_emb_np = np.array(query_embedding)
-        lesson_embeddings = np.array([l["embedding"] for l in lessons_with_embeddings])
+        # Cosine similarity: rows are pre-normalized, so one matrix-vector product
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        query_vec /= np.linalg.norm(query_vec) + 1e-12
         
-        # Vectorized cosine similarity computation
-        # cosine_sim = dot(a, b) / (norm(a) * norm(b))
-        dot_products = np.dot(lesson_embeddings, query_emb_np)
-        query_norm = np.linalg.norm(query_emb_np)
-        lesson_norms = np.linalg.norm(lesson_embeddings, axis=1)
-        similarities = dot_products / (lesson_norms * query_norm)
+        num_rows = len(self._emb_matrix)
+        k = min(top_k, num_rows)
+        if k <= 0:
+            return "No relevant lessons found."
         
-        # Get top_k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        quantized = self._quantized_index()
+        if quantized is not None and k * INT8_RESCORE_FACTOR < num_rows:
+            # Shortlist on the int8 index (a quarter of the bytes), then re-score exactly
+            approx = np.einsum("ij,j->i", quantized, self._quantize(query_vec), dtype=np.int32)
+            candidates = np.argpartition(-approx, k * INT8_RESCORE_FACTOR - 1)[:k * INT8_RESCORE_FACTOR]
+        else:
+            candidates = np.arange(num_rows)
+        similarities = self._emb_matrix[candidates] @ query_vec
         
-        if len(top_indices) == 0:
-            return "No relevant lessons found."
+        # Partial sort: only the top_k candidates are ordered
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        top_indices = candidates[top]
         
         formatted = "### PREVIOUS LESSONS LEARNED:\n"
-        for idx in top_indices:
-            lesson = lessons_with_embeddings[idx]
-            score = float(similarities[idx])
+        for idx, score in zip(top_indices, similarities[top]):
+            lesson = self._emb_lessons[idx]
+            score = float(score)
             formatted += f"- **{lesson['topic']}** (similarity: {score:.2f}): {lesson['solution']}\n"
         
         logger.debug(f"Retrieved {len(top_indices)} lessons using embeddings")
@@ -207,23 +586,18 @@ class NexusMemory:
     
     def _retrieve_with_keywords(self, query: str, top_k: int) -> str:
         """Retrieve using simple keyword matching (fallback)."""
-        query_words = set(query.lower().split())
-        relevant_lessons = []
-        
-        for lesson in self.data["lessons"]:
-            topic_words = set(lesson["topic"].lower().split())
-            context_words = set(lesson["context"].lower().split())
-            
-            # Count matching words
-            matches = len(query_words & (topic_words | context_words))
-            if matches > 0:
-                relevant_lessons.append((lesson, matches))
-        
-        # Sort by match count
-        relevant_lessons.sort(key=lambda x: x[1], reverse=True)
-        
-        # Take top_k
-        top_lessons = relevant_lessons[:top_k]
+        # Count matching words through the inverted index
+        matches: Counter = Counter()
+        for word in _tokenize(query):
+            matches.update(self._inv_index.get(word, ()))
+        
+        # Most matches first, oldest lesson first on ties
+        top_ids = heapq.nsmallest(
+            top_k,
+            matches,
+            key=lambda lesson_id: (-matches[lesson_id], self._row_of.get(lesson_id, 0))
+        )
+        top_lessons = [(self._lessons_by_id[lesson_id], matches[lesson_id]) for lesson_id in top_ids]
         
         if not top_lessons:
             return "No prior lessons found for this topic."
@@ -245,16 +619,45 @@ class NexusMemory:
         Returns:
             True if deleted, False if not found
         """
-        original_count = len(self.data["lessons"])
-        self.data["lessons"] = [l for l in self.data["lessons"] if l.get("id") != lesson_id]
-        
-        if len(self.data["lessons"]) < original_count:
-            self._save_memory()
-            logger.info(f"Lesson deleted: {lesson_id}")
-            return True
+        row = self._row_of.pop(lesson_id, None)
+        if row is None:
+            logger.warning(f"Lesson not found for deletion: {lesson_id}")
+            return False
         
-        logger.warning(f"Lesson not found for deletion: {lesson_id}")
-        return False
+        self.data["lessons"] = [l for l in self.data["lessons"] if l.get("id") != lesson_id]
+        self._mark_deleted(row)
+        
+        lesson = self._lessons_by_id.pop(lesson_id, None)
+        if lesson is not None:
+            for word in _tokenize(f"{lesson['topic']} {lesson['context']}"):
+                postings = self._inv_index.get(word)
+                if postings is not None:
+                    postings.discard(lesson_id)
+                    if not postings:
+                        del self._inv_index[word]
+        
+        for idx, lesson in enumerate(self._emb_lessons):
+            if lesson.get("id") == lesson_id:
+                del self._emb_lessons[idx]
+                remaining = np.delete(self._emb_matrix, idx, axis=0)
+                self._emb_matrix = remaining if len(remaining) else None
+                if self._emb_matrix_q is not None:
+                    self._emb_matrix_q = np.delete(self._emb_matrix_q, idx, axis=0) if len(remaining) else None
+                break
+        
+        logger.info(f"Lesson deleted: {lesson_id}")
+        return True
+    
+    def _mark_deleted(self, row: int) -> None:
+        """Set the tombstone byte of a row (the file is zero-padded as needed)."""
+        try:
+            with self._locked_log():
+                mode = "r+b" if os.path.exists(self.deleted_path) else "wb"
+                with open(self.deleted_path, mode) as f:
+                    f.seek(row)
+                    f.write(b"\x01")
+        except (OSError, IOError) as e:
+            logger.error(f"Failed to save memory: {e}")
     
     def list_lessons(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
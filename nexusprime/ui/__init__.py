@@ -1,6 +1,6 @@
 """UI module for NexusPrime dashboard components."""
 
-from .styles import COLORS, get_base_styles
+from .styles import COLORS, get_base_styles, get_critical_styles, get_deferred_styles
 from .components import (
     render_header,
     render_metrics_card,
@@ -13,6 +13,8 @@ from .components import (
 __all__ = [
     "COLORS",
     "get_base_styles",
+    "get_critical_styles",
+    "get_deferred_styles",
     "render_header",
     "render_metrics_card",
     "render_progress_pipeline",
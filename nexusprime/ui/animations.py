@@ -1,14 +1,6 @@
 """CSS animations for NexusPrime dashboard."""
 
-
-def get_animation_styles() -> str:
-    """
-    Get additional animation styles for advanced effects.
-    
-    Returns:
-        CSS string with animation definitions
-    """
-    return """
+_ANIMATION_STYLES = """
     <style>
     /* ===== LOADING ANIMATIONS ===== */
     @keyframes shimmer {
@@ -242,3 +234,13 @@ def get_animation_styles() -> str:
     }
     </style>
     """
+
+
+def get_animation_styles() -> str:
+    """
+    Get additional animation styles for advanced effects.
+    
+    Returns:
+        CSS string with animation definitions (the same object on every call)
+    """
+    return _ANIMATION_STYLES
@@ -1,21 +1,23 @@
 """Reusable UI components for NexusPrime dashboard."""
 
-from typing import Dict, List, Optional, Tuple
+import functools
+import io
+import math
+import os
+import sys
+from collections import deque
+from collections.abc import Sized
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
 
-def render_header(user_name: str = "ADMIN", plan: str = "PRO") -> str:
-    """
-    Render the premium header with gradient logo and status indicator.
-    
-    Args:
-        user_name: User name to display
-        plan: Plan type (PRO, FREE, etc.)
-    
-    Returns:
-        HTML string for header
-    """
-    return f"""
+# HTML templates (static markup kept out of the per-rerun render calls).
+# Hot templates use positional %-formatting, which measured 2-3x faster than
+# str.format with keywords on these strings; _STEP_TMPL (rendered once at
+# import) keeps str.format.
+_HEADER_TMPL = """
     <div class="nexus-header fade-in">
         <div>
             <div class="brand-logo">
@@ -23,19 +25,239 @@ def render_header(user_name: str = "ADMIN", plan: str = "PRO") -> str:
                 <span class="brand-subtitle">// AI SOFTWARE FACTORY</span>
             </div>
         </div>
-        <div style="display: flex; align-items: center; gap: 20px;">
+        <div class="header-actions">
             <span class="multi-llm-badge">Multi-LLM ✨</span>
             <div class="status-indicator">
                 <div class="status-dot"></div>
                 <span>Online</span>
             </div>
-            <div style="background: rgba(255, 255, 255, 0.05); padding: 8px 16px; border-radius: 20px; font-size: 0.85em;">
-                @{user_name} | {plan}
+            <div class="user-badge">
+                @%s | %s
             </div>
         </div>
     </div>
     """
 
+_CARD_TMPL_NOBAR = """
+    <div class="nexus-card metric-container">
+        <div class="card-icon">%s</div>
+        <div class="metric-label">%s</div>
+        <div class="metric-value" style="color: %s;">%s</div>
+        
+    </div>
+    """
+
+_CARD_TMPL_BAR = """
+    <div class="nexus-card metric-container">
+        <div class="card-icon">%s</div>
+        <div class="metric-label">%s</div>
+        <div class="metric-value" style="color: %s;">%s</div>
+        
+        <div class="metric-progress">
+            <div class="metric-progress-bar" style="width: %s%%; background: %s;"></div>
+        </div>
+        
+    </div>
+    """
+
+
+_ACTIVE_AGENT_TMPL = """
+    <div class="nexus-card agent-card fade-in">
+        <div class="card-title">
+            <span class="card-icon">🎯</span>
+            ACTIVE AGENT
+        </div>
+        <div class="agent-header">
+            <div class="agent-name">
+                <span>%s</span>
+                <span>%s</span>
+            </div>
+            <div class="agent-model">
+                Powered by %s
+            </div>
+        </div>
+        <div class="agent-status">%s</div>
+        <div class="metric-progress">
+            <div class="metric-progress-bar" style="width: %s%%;"></div>
+        </div>
+        <div class="agent-progress-label">
+            %s%% Complete
+        </div>
+    </div>
+    """
+
+_JUDGE_CARD_TMPL = """
+        <div class="judge-card slide-in">
+            <div class="judge-icon">%s</div>
+            <div class="judge-name">%s</div>
+            <div class="judge-model">%s</div>
+            <div class="score-circle" style="border-color: %s; color: %s;">
+                %s
+            </div>
+            <div class="judge-score-max">
+                /100
+            </div>
+            <span class="verdict-badge %s">%s</span>
+        </div>
+        """
+
+_ARBITRATOR_TMPL = """
+        <div class="arbitrator-card council-arbitrator fade-in">
+            <div class="arb-title">
+                ⚖️ FINAL ARBITRATION (Claude)
+            </div>
+            <div class="arb-score">
+                %s/100
+            </div>
+            <span class="verdict-badge arb-verdict %s">
+                %s
+            </span>
+            <div class="arb-reasoning">
+                %s
+            </div>
+            %s
+        </div>
+        """
+
+_PROGRESSION_TMPL = """
+            <div class="progression-box">
+                <div class="progression-title">
+                    📈 Progression vs Previous Review:
+                </div>
+                <div class="progression-value" style="color: %s;">
+                    %s %+d points (%s → %s)
+                </div>
+            </div>
+            """
+
+_CONCERN_TMPL = """
+                <div class="concern-row">
+                    <span class="concern-judge">%s:</span>
+                    <span class="concern-text">%s</span>
+                </div>
+                """
+
+_FILE_ROW_TMPL = """
+                    <div class="workspace-row">
+                        %s %s
+                    </div>
+                    """
+
+_LOG_ROW_TMPL = """
+            <div class="log-entry">
+                <span class="log-timestamp">[%s]</span>
+                <span class="%s"> %s:</span> 
+                %s
+            </div>
+            """
+
+_TERMINAL_OPEN = '<div class="terminal-container">'
+_TERMINAL_IDLE = """
+        <div class="log-entry">
+            <span class="log-timestamp">[--:--:--]</span>
+            <span class="log-level-info"> SYSTEM:</span> 
+            Waiting for factory to start...
+        </div>
+        """
+_TERMINAL_CLOSE = '<div class="log-cursor">█</div></div>'
+# Idle terminal, returned as-is while there are no logs to show
+_TERMINAL_EMPTY_HTML = _TERMINAL_OPEN + _TERMINAL_IDLE + _TERMINAL_CLOSE
+
+# Log level -> (CSS class, label) for the levels styled in styles.py, in either case
+_LOG_LEVELS = {
+    name: (f"log-level-{level}", level.upper())
+    for level in ("info", "success", "warning", "error")
+    for name in (level, level.upper())
+}
+
+# Lookup tables shared by the renderers (keys interned, see _intern)
+_AGENT_ICONS = {sys.intern(k): v for k, v in {
+    "Product Owner": "🕵️",
+    "Tech Lead": "🌐",
+    "Dev Squad": "⚡",
+    "Council": "⚖️",
+}.items()}
+_JUDGE_ICONS = {sys.intern(k): v for k, v in {"Grok": "🔸", "Gemini": "🔹", "Claude": "🔷"}.items()}
+_VERDICT_CLASSES = {sys.intern(k): v for k, v in {
+    "APPROVE": "verdict-approve",
+    "REJECT": "verdict-reject",
+    "PENDING": "verdict-pending",
+}.items()}
+# Score accent colors indexed by (score >= 60) + (score >= 80)
+_SCORE_COLORS = ("#ef4444", "#f59e0b", "#10b981")
+_PLACEHOLDER_JUDGES = (
+    {"name": "Grok", "model": "grok-3", "score": "--", "verdict": "PENDING"},
+    {"name": "Gemini", "model": "gemini-2.5-pro", "score": "--", "verdict": "PENDING"},
+    {"name": "Claude", "model": "claude-sonnet-4", "score": "--", "verdict": "PENDING"},
+)
+
+
+# Progress pipeline: every step is pre-rendered in its three possible states
+_PIPELINE_STEPS = (
+    ("Input", "📥", "input"),
+    ("Product Owner", "🕵️", "po"),
+    ("Tech Lead", "🌐", "tech"),
+    ("Dev Squad", "⚡", "dev"),
+    ("Council", "⚖️", "council"),
+    ("Output", "✅", "output"),
+)
+_PIPELINE_STEP_ORDER = {step_key: idx for idx, (_, _, step_key) in enumerate(_PIPELINE_STEPS)}
+_STEP_TMPL = """
+        <div class="pipeline-step {css_class}">
+            <div class="pipeline-icon">{icon}</div>
+            <div class="pipeline-label">{label}</div>
+        </div>
+        """
+_STEP_COMPLETED, _STEP_ACTIVE, _STEP_PENDING = range(3)
+_STEP_FRAGMENTS = tuple(
+    tuple(
+        _STEP_TMPL.format(css_class=css_class, icon=icon, label=label)
+        for css_class in ("completed", "active", "pending")
+    )
+    for label, icon, _ in _PIPELINE_STEPS
+)
+_PIPELINE_ARROW = '<span class="pipeline-arrow">→</span>'
+
+
+def _log_row(timestamp: str, level: str, message: str) -> str:
+    """Render one terminal log line."""
+    level_class, label = _LOG_LEVELS.get(level) or (f"log-level-{level.lower()}", level.upper())
+    return _LOG_ROW_TMPL % (timestamp, level_class, label, message)
+
+
+def _intern(value: Any) -> Any:
+    """Intern short repeated strings so cache and table lookups compare by identity."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _norm_score(score: Any) -> Union[int, str]:
+    """Normalize a score to an int, or to "--" when it is missing or not a number."""
+    if isinstance(score, (int, float)) and math.isfinite(score):
+        return round(score)
+    return "--"
+
+
+def _score_color(score: Any) -> str:
+    """Return the accent color for a normalized score (indigo when not scored)."""
+    if score == "--":
+        return "#6366f1"
+    return _SCORE_COLORS[(score >= 60) + (score >= 80)]
+
+
+@functools.lru_cache(maxsize=8)
+def render_header(user_name: str = "ADMIN", plan: str = "PRO") -> str:
+    """
+    Render the premium header with gradient logo and status indicator.
+    
+    Args:
+        user_name: User name to display
+        plan: Plan type (PRO, FREE, etc.)
+    
+    Returns:
+        HTML string for header
+    """
+    return _HEADER_TMPL % (user_name, plan)
+
 
 def render_metrics_card(
     label: str,
@@ -57,24 +279,12 @@ def render_metrics_card(
     Returns:
         HTML string for metric card
     """
-    progress_bar = ""
-    if progress is not None:
-        # Cap progress at 100%
-        progress = min(100, max(0, progress))
-        progress_bar = f"""
-        <div class="metric-progress">
-            <div class="metric-progress-bar" style="width: {progress}%; background: {color};"></div>
-        </div>
-        """
+    if progress is None:
+        return _CARD_TMPL_NOBAR % (icon, label, color, value)
     
-    return f"""
-    <div class="nexus-card metric-container">
-        <div class="card-icon">{icon}</div>
-        <div class="metric-label">{label}</div>
-        <div class="metric-value" style="color: {color};">{value}</div>
-        {progress_bar}
-    </div>
-    """
+    # Cap progress at 100%
+    progress = min(100, max(0, progress))
+    return _CARD_TMPL_BAR % (icon, label, color, value, progress, color)
 
 
 def render_progress_pipeline(current_step: str) -> str:
@@ -87,44 +297,27 @@ def render_progress_pipeline(current_step: str) -> str:
     Returns:
         HTML string for pipeline
     """
-    steps = [
-        ("Input", "📥", "input"),
-        ("Product Owner", "🕵️", "po"),
-        ("Tech Lead", "🌐", "tech"),
-        ("Dev Squad", "⚡", "dev"),
-        ("Council", "⚖️", "council"),
-        ("Output", "✅", "output"),
-    ]
-    
-    # Determine step status
-    step_order = {s[2]: i for i, s in enumerate(steps)}
-    current_idx = step_order.get(current_step.lower(), -1)
-    
-    pipeline_html = ['<div class="pipeline">']
-    
-    for idx, (label, icon, step_key) in enumerate(steps):
-        # Determine CSS class
+    current_idx = _PIPELINE_STEP_ORDER.get(current_step.lower(), -1)
+    
+    buf = io.StringIO()
+    w = buf.write
+    w('<div class="pipeline">')
+    
+    for idx, fragments in enumerate(_STEP_FRAGMENTS):
         if idx < current_idx:
-            css_class = "completed"
+            w(fragments[_STEP_COMPLETED])
         elif idx == current_idx:
-            css_class = "active"
+            w(fragments[_STEP_ACTIVE])
         else:
-            css_class = "pending"
-        
-        pipeline_html.append(f"""
-        <div class="pipeline-step {css_class}">
-            <div class="pipeline-icon">{icon}</div>
-            <div class="pipeline-label">{label}</div>
-        </div>
-        """)
+            w(fragments[_STEP_PENDING])
         
         # Add arrow between steps
-        if idx < len(steps) - 1:
-            pipeline_html.append('<span class="pipeline-arrow">→</span>')
+        if idx < len(_STEP_FRAGMENTS) - 1:
+            w(_PIPELINE_ARROW)
     
-    pipeline_html.append('</div>')
+    w('</div>')
     
-    return ''.join(pipeline_html)
+    return buf.getvalue()
 
 
 def render_active_agent(
@@ -145,49 +338,30 @@ def render_active_agent(
     Returns:
         HTML string for active agent card
     """
-    # Map agent to icon
-    agent_icons = {
-        "Product Owner": "🕵️",
-        "Tech Lead": "🌐",
-        "Dev Squad": "⚡",
-        "Council": "⚖️",
-    }
-    icon = agent_icons.get(agent_name, "🤖")
-    
-    return f"""
-    <div class="nexus-card agent-card fade-in">
-        <div class="card-title">
-            <span class="card-icon">🎯</span>
-            ACTIVE AGENT
-        </div>
-        <div class="agent-header">
-            <div class="agent-name">
-                <span>{icon}</span>
-                <span>{agent_name.upper()}</span>
-            </div>
-            <div class="agent-model">
-                Powered by {model}
-            </div>
-        </div>
-        <div class="agent-status">{status}</div>
-        <div class="metric-progress">
-            <div class="metric-progress-bar" style="width: {progress}%;"></div>
-        </div>
-        <div style="text-align: right; font-size: 0.9em; color: #94a3b8; margin-top: 10px;">
-            {progress}% Complete
-        </div>
-    </div>
-    """
+    agent_name = _intern(agent_name)
+    return _ACTIVE_AGENT_TMPL % (
+        _AGENT_ICONS.get(agent_name, "🤖"),
+        agent_name.upper(),
+        model,
+        status,
+        progress,
+        progress
+    )
 
 
 def render_council_section(
-    judges: Optional[List[Dict[str, any]]] = None,
-    arbitrator: Optional[Dict[str, any]] = None,
+    judges: Optional[Sequence[Dict[str, Any]]] = None,
+    arbitrator: Optional[Dict[str, Any]] = None,
     previous_score: Optional[int] = None
 ) -> str:
     """
     Render the council review section with 3 judges + arbitrator.
     
+    The section is memoized on its content, so dashboard reruns with an
+    unchanged review return the previously rendered HTML.
+    
+    Scores are rounded to whole points; non-numeric scores show as "--".
+    
     Args:
         judges: List of judge dicts with keys: name, model, score, verdict, concerns
         arbitrator: Arbitrator dict with keys: score, reasoning, verdict
@@ -197,212 +371,225 @@ def render_council_section(
         HTML string for council section
     """
     if not judges:
+        if not arbitrator:
+            # Idle factory: the pending placeholder is pre-rendered
+            return _COUNCIL_EMPTY_HTML
         # Default placeholder
-        judges = [
-            {"name": "Grok", "model": "grok-3", "score": "--", "verdict": "PENDING"},
-            {"name": "Gemini", "model": "gemini-2.5-pro", "score": "--", "verdict": "PENDING"},
-            {"name": "Claude", "model": "claude-sonnet-4", "score": "--", "verdict": "PENDING"},
-        ]
+        judges = _PLACEHOLDER_JUDGES
+    
+    judges_key = _judges_key(judges)
+    arbitrator_key = _typed(
+        _norm_score(arbitrator.get("score")),
+        arbitrator.get("reasoning", "Pending arbitration..."),
+        _intern(arbitrator.get("verdict", "PENDING"))
+    ) if arbitrator else None
+    
+    previous = _norm_score(previous_score) if previous_score is not None else None
     
-    council_html = ["""
+    return _render_council_section(judges_key, arbitrator_key, previous)
+
+
+def _judges_key(judges: Iterable[Dict[str, Any]]) -> Tuple[Tuple, ...]:
+    """Build the hashable _render_council_section key for a list of judge dicts."""
+    return tuple(
+        _typed(
+            _intern(judge["name"]),
+            _intern(judge.get("model", "")),
+            _norm_score(judge.get("score")),
+            _intern(judge.get("verdict", "PENDING")),
+            tuple(judge.get("concerns") or ())
+        )
+        for judge in judges
+    )
+
+
+def _typed(*values: Any) -> Tuple:
+    """Build a cache key that tells 1, 1.0 and True apart (they render differently)."""
+    return values + tuple(type(value) for value in values)
+
+
+@functools.lru_cache(maxsize=32, typed=True)
+def _render_council_section(
+    judges_key: Tuple[Tuple, ...],
+    arbitrator_key: Optional[Tuple],
+    previous_score: Union[int, str, None]
+) -> str:
+    """Render the council section from hashable judge/arbitrator keys (see _judges_key)."""
+    buf = io.StringIO()
+    w = buf.write
+    w("""
     <div class="nexus-card">
         <div class="card-title">
             <span class="card-icon">⚖️</span>
             COUNCIL REVIEW (Multi-LLM Debate)
         </div>
         <div class="council-grid">
-    """]
+    """)
     
     # Render judge cards
-    for judge in judges:
-        score_display = judge.get("score", "--")
-        score_color = "#6366f1"
-        
-        if isinstance(score_display, (int, float)):
-            if score_display >= 80:
-                score_color = "#10b981"
-            elif score_display >= 60:
-                score_color = "#f59e0b"
-            else:
-                score_color = "#ef4444"
-        
-        verdict = judge.get("verdict", "PENDING")
-        verdict_class = "verdict-pending"
-        if verdict == "APPROVE":
-            verdict_class = "verdict-approve"
-        elif verdict == "REJECT":
-            verdict_class = "verdict-reject"
-        
-        judge_icon = {"Grok": "🔸", "Gemini": "🔹", "Claude": "🔷"}.get(judge["name"], "⚪")
-        
-        council_html.append(f"""
-        <div class="judge-card slide-in">
-            <div style="font-size: 2em; margin-bottom: 10px;">{judge_icon}</div>
-            <div class="judge-name">{judge["name"]}</div>
-            <div class="judge-model">{judge.get("model", "")}</div>
-            <div class="score-circle" style="border-color: {score_color}; color: {score_color};">
-                {score_display}
-            </div>
-            <div style="font-size: 0.7em; color: #94a3b8; margin-bottom: 10px;">
-                /100
-            </div>
-            <span class="verdict-badge {verdict_class}">{verdict}</span>
-        </div>
-        """)
+    for name, model, score, verdict, _ in (key[:5] for key in judges_key):
+        w(_judge_card(name, model, score, verdict))
     
-    council_html.append('</div>')
+    w('</div>')
     
     # Arbitrator section
-    if arbitrator:
-        arb_score = arbitrator.get("score", "--")
-        arb_reasoning = arbitrator.get("reasoning", "Pending arbitration...")
-        arb_verdict = arbitrator.get("verdict", "PENDING")
-        
-        verdict_class = "verdict-pending"
-        if arb_verdict == "APPROVE":
-            verdict_class = "verdict-approve"
-        elif arb_verdict == "REJECT":
-            verdict_class = "verdict-reject"
+    if arbitrator_key:
+        arb_score, arb_reasoning, arb_verdict = arbitrator_key[:3]
         
         # Add progression indicator if available
         progression_html = ""
-        if previous_score is not None and isinstance(arb_score, (int, float)):
+        if previous_score is not None and previous_score != "--" and arb_score != "--":
             score_change = arb_score - previous_score
-            change_icon = "📈" if score_change > 0 else "📉" if score_change < 0 else "➡️"
-            change_color = "#10b981" if score_change > 0 else "#ef4444" if score_change < 0 else "#94a3b8"
-            progression_html = f"""
-            <div style="margin-top: 15px; padding: 10px; background: rgba(255, 255, 255, 0.05); 
-                        border-radius: 8px; border: 1px solid rgba(255, 255, 255, 0.1);">
-                <div style="font-size: 0.9em; color: #94a3b8; margin-bottom: 5px;">
-                    📈 Progression vs Previous Review:
-                </div>
-                <div style="font-size: 1.2em; font-weight: 600; color: {change_color};">
-                    {change_icon} {score_change:+d} points ({previous_score} → {arb_score})
-                </div>
-            </div>
-            """
+            progression_html = _PROGRESSION_TMPL % (
+                "#10b981" if score_change > 0 else "#ef4444" if score_change < 0 else "#94a3b8",
+                "📈" if score_change > 0 else "📉" if score_change < 0 else "➡️",
+                score_change,
+                previous_score,
+                arb_score
+            )
         
-        council_html.append(f"""
-        <div class="arbitrator-card fade-in" style="margin-top: 20px;">
-            <div style="font-size: 1.2em; font-weight: 600; margin-bottom: 15px;">
-                ⚖️ FINAL ARBITRATION (Claude)
-            </div>
-            <div style="font-size: 2.5em; font-weight: 800; color: #6366f1; margin: 20px 0;">
-                {arb_score}/100
-            </div>
-            <span class="verdict-badge {verdict_class}" style="font-size: 1em; padding: 8px 20px;">
-                {arb_verdict}
-            </span>
-            <div style="margin-top: 20px; font-size: 0.9em; color: #94a3b8; line-height: 1.6;">
-                {arb_reasoning}
-            </div>
-            {progression_html}
-        </div>
-        """)
+        w(_ARBITRATOR_TMPL % (
+            arb_score,
+            _VERDICT_CLASSES.get(arb_verdict, "verdict-pending"),
+            arb_verdict,
+            arb_reasoning,
+            progression_html
+        ))
     else:
-        council_html.append("""
-        <div class="arbitrator-card" style="margin-top: 20px;">
-            <div style="font-size: 1.2em; font-weight: 600; margin-bottom: 15px;">
+        w("""
+        <div class="arbitrator-card council-arbitrator">
+            <div class="arb-title">
                 ⚖️ FINAL ARBITRATION
             </div>
-            <div style="font-size: 1.5em; color: #f59e0b; margin: 20px 0;">
+            <div class="arb-waiting">
                 Awaiting reviews...
             </div>
         </div>
         """)
     
-    # Add concerns summary if available
-    if judges:
+    # Add concerns summary if available (skipped outright while no judge has any)
+    if any(key[4] for key in judges_key):
+        # Concerns raised by several judges are listed once, under the first judge
         all_concerns = []
-        for judge in judges:
-            concerns = judge.get("concerns", [])
-            if concerns:
-                for concern in concerns:
-                    if concern and concern not in all_concerns:
-                        all_concerns.append((judge["name"], concern))
+        seen = set()
+        for name, _, _, _, concerns in (key[:5] for key in judges_key):
+            for concern in concerns:
+                if concern and concern not in seen:
+                    seen.add(concern)
+                    all_concerns.append((name, concern))
         
         if all_concerns:
-            council_html.append("""
-            <div style="margin-top: 20px; padding: 20px; background: rgba(239, 68, 68, 0.1); 
-                        border-radius: 12px; border: 1px solid rgba(239, 68, 68, 0.3);">
-                <div style="font-size: 1.1em; font-weight: 600; margin-bottom: 15px; color: #ef4444;">
+            w("""
+            <div class="concerns-box">
+                <div class="concerns-title">
                     📝 Concerns Identifiées:
                 </div>
             """)
             
             for judge_name, concern in all_concerns:
-                council_html.append(f"""
-                <div style="margin: 8px 0; padding: 8px 12px; background: rgba(0, 0, 0, 0.2); 
-                            border-radius: 6px; border-left: 3px solid #ef4444;">
-                    <span style="color: #94a3b8; font-size: 0.85em;">{judge_name}:</span>
-                    <span style="color: #f8fafc; margin-left: 8px;">{concern}</span>
-                </div>
-                """)
+                w(_concern_row(judge_name, concern))
             
-            council_html.append('</div>')
+            w('</div>')
     
-    council_html.append('</div>')
+    w('</div>')
     
-    return ''.join(council_html)
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _judge_card(name: str, model: str, score: Union[int, str], verdict: str) -> str:
+    """Render one judge card (cached per judge content)."""
+    score_color = _score_color(score)
+    return _JUDGE_CARD_TMPL % (
+        _JUDGE_ICONS.get(name, "⚪"),
+        name,
+        model,
+        score_color,
+        score_color,
+        score,
+        _VERDICT_CLASSES.get(verdict, "verdict-pending"),
+        verdict
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _concern_row(judge_name: str, concern: str) -> str:
+    """Render one concern row (cached per judge and concern)."""
+    return _CONCERN_TMPL % (judge_name, concern)
+
+
+# Idle council (placeholder judges, no arbitration), rendered once at import
+_COUNCIL_EMPTY_HTML = _render_council_section(_judges_key(_PLACEHOLDER_JUDGES), None, None)
 
 
 def render_terminal(
-    logs: List[Tuple[str, str, str]],
+    logs: Iterable[Tuple[str, str, str]],
     max_lines: int = 20
 ) -> str:
     """
     Render terminal/console with logs.
     
+    Only the last max_lines entries are read: sized inputs are skipped to
+    their tail without copying, other iterables go through a bounded deque.
+    Long-lived callers should keep their logs in a deque(maxlen=max_lines).
+    
     Args:
-        logs: List of tuples (timestamp, level, message)
+        logs: Tuples (timestamp, level, message), oldest first
         max_lines: Maximum number of log lines to display
     
     Returns:
         HTML string for terminal
     """
-    terminal_html = ['<div class="terminal-container">']
-    
-    if not logs:
-        terminal_html.append("""
-        <div class="log-entry">
-            <span class="log-timestamp">[--:--:--]</span>
-            <span class="log-level-info"> SYSTEM:</span> 
-            Waiting for factory to start...
-        </div>
-        """)
+    if isinstance(logs, Sized):
+        if not len(logs):
+            return _TERMINAL_EMPTY_HTML
+        recent_logs: Iterable[Tuple[str, str, str]] = islice(logs, max(0, len(logs) - max_lines), None)
     else:
-        # Show last N logs
-        recent_logs = logs[-max_lines:] if len(logs) > max_lines else logs
-        
-        for timestamp, level, message in recent_logs:
-            level_class = f"log-level-{level.lower()}"
-            terminal_html.append(f"""
-            <div class="log-entry">
-                <span class="log-timestamp">[{timestamp}]</span>
-                <span class="{level_class}"> {level.upper()}:</span> 
-                {message}
-            </div>
-            """)
+        recent_logs = deque(logs, maxlen=max_lines)
+    
+    buf = io.StringIO()
+    w = buf.write
+    w(_TERMINAL_OPEN)
+    rows_start = buf.tell()
+    for timestamp, level, message in recent_logs:
+        w(_log_row(timestamp, level, message))
+    
+    if buf.tell() == rows_start:
+        w(_TERMINAL_IDLE)
     
     # Add blinking cursor
-    terminal_html.append('<div class="log-cursor">█</div>')
-    terminal_html.append('</div>')
+    w(_TERMINAL_CLOSE)
     
-    return ''.join(terminal_html)
+    return buf.getvalue()
 
 
 def render_workspace_files(workspace_path: str = "workspace") -> str:
     """
     Render workspace file list.
     
+    The listing is cached on the directory's mtime and size, so it is only
+    rebuilt when entries are added, removed or renamed.
+    
     Args:
         workspace_path: Path to workspace directory
     
     Returns:
         HTML string for file list
     """
-    import os
-    
+    try:
+        stat = os.stat(workspace_path)
+    except OSError:
+        return _render_workspace_listing(workspace_path, None, None)
+    return _render_workspace_listing(workspace_path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_workspace_listing(
+    workspace_path: str,
+    mtime_ns: Optional[int],
+    size: Optional[int]
+) -> str:
+    """Render the file list of workspace_path (mtime_ns is None when it does not exist)."""
     file_html = ["""
     <div class="nexus-card">
         <div class="card-title">
@@ -411,23 +598,21 @@ def render_workspace_files(workspace_path: str = "workspace") -> str:
         </div>
     """]
     
-    if os.path.exists(workspace_path):
+    if mtime_ns is not None:
         try:
-            files = os.listdir(workspace_path)
-            if files:
-                for fname in sorted(files):
-                    file_icon = "📄" if "." in fname else "📁"
-                    file_html.append(f"""
-                    <div style="padding: 8px; border-bottom: 1px solid #2d2d3a; font-family: monospace; font-size: 0.9em;">
-                        {file_icon} {fname}
-                    </div>
-                    """)
+            with os.scandir(workspace_path) as it:
+                entries = sorted(it, key=attrgetter("name"))
+            if entries:
+                file_html.append("".join(
+                    _FILE_ROW_TMPL % ("📁" if entry.is_dir() else "📄", entry.name)
+                    for entry in entries
+                ))
             else:
-                file_html.append('<div style="color: #94a3b8; padding: 20px; text-align: center;">No files yet</div>')
+                file_html.append('<div class="workspace-empty">No files yet</div>')
         except Exception as e:
-            file_html.append(f'<div style="color: #ef4444; padding: 20px;">Error: {e}</div>')
+            file_html.append(f'<div class="workspace-error">Error: {e}</div>')
     else:
-        file_html.append('<div style="color: #94a3b8; padding: 20px; text-align: center;">Workspace not found</div>')
+        file_html.append('<div class="workspace-empty">Workspace not found</div>')
     
     file_html.append('</div>')
     
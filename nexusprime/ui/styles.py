@@ -1,5 +1,7 @@
 """Style constants and CSS for NexusPrime dashboard."""
 
+import re
+
 # Modern SaaS Dark Theme Color Palette
 COLORS = {
     "bg_primary": "#0a0a0f",        # Main background - very dark
@@ -19,28 +21,37 @@ COLORS = {
 }
 
 
-def get_base_styles() -> str:
-    """
-    Generate base CSS styles for the dashboard.
-    
-    Returns:
-        CSS string with all base styles
-    """
-    return f"""
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACE = re.compile(r" ?([{};]) ?")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace (the stylesheet is re-sent to the browser on every rerun)."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    return _CSS_PUNCTUATION_SPACE.sub(r"\1", css).strip()
+
+
+# Base stylesheet: %(name)s templates over COLORS, filled and minified once at
+# import since the dashboard injects them on every rerun. It is split in two:
+# the critical part styles the layout above the fold and is injected first,
+# the deferred part is injected once the main layout has been sent.
+_CRITICAL_STYLES_TMPL = """
     <style>
     /* ===== GLOBAL THEME ===== */
-    .stApp {{
-        background: linear-gradient(135deg, {COLORS['bg_primary']} 0%, {COLORS['bg_secondary']} 100%);
-        color: {COLORS['text_primary']};
+    .stApp {
+        background: linear-gradient(135deg, %(bg_primary)s 0%%, %(bg_secondary)s 100%%);
+        color: %(text_primary)s;
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
+    }
     
     /* Hide default Streamlit elements */
-    #MainMenu {{visibility: hidden;}}
-    footer {{visibility: hidden;}}
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
     
     /* ===== HEADER ===== */
-    .nexus-header {{
+    .nexus-header {
         display: flex;
         justify-content: space-between;
         align-items: center;
@@ -48,275 +59,295 @@ def get_base_styles() -> str:
         background: rgba(255, 255, 255, 0.03);
         backdrop-filter: blur(20px);
         -webkit-backdrop-filter: blur(20px);
-        border-bottom: 1px solid {COLORS['border']};
+        border-bottom: 1px solid %(border)s;
         border-radius: 12px;
         margin-bottom: 30px;
         box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-    }}
+    }
     
-    .brand-logo {{
+    .brand-logo {
         font-size: 1.8em;
         font-weight: 800;
-        background: linear-gradient(135deg, {COLORS['accent_primary']}, {COLORS['accent_secondary']});
+        background: linear-gradient(135deg, %(accent_primary)s, %(accent_secondary)s);
         -webkit-background-clip: text;
         -webkit-text-fill-color: transparent;
         background-clip: text;
         letter-spacing: 2px;
-        text-shadow: 0 0 30px {COLORS['glow']};
-    }}
+        text-shadow: 0 0 30px %(glow)s;
+    }
     
-    .brand-subtitle {{
+    .brand-subtitle {
         font-size: 0.5em;
-        color: {COLORS['text_secondary']};
+        color: %(text_secondary)s;
         letter-spacing: 3px;
         font-weight: 400;
         display: block;
         margin-top: 5px;
-    }}
+    }
     
-    .multi-llm-badge {{
+    .multi-llm-badge {
         display: inline-block;
-        background: linear-gradient(135deg, {COLORS['accent_primary']}, {COLORS['accent_secondary']});
+        background: linear-gradient(135deg, %(accent_primary)s, %(accent_secondary)s);
         padding: 6px 16px;
         border-radius: 20px;
         font-size: 0.75em;
         font-weight: 600;
         margin-left: 15px;
-        box-shadow: 0 4px 15px {COLORS['glow']};
+        box-shadow: 0 4px 15px %(glow)s;
         animation: pulse-glow 2s ease-in-out infinite;
-    }}
+    }
     
-    .status-indicator {{
+    .status-indicator {
         display: flex;
         align-items: center;
         gap: 10px;
         font-size: 0.9em;
-        color: {COLORS['text_secondary']};
-    }}
+        color: %(text_secondary)s;
+    }
     
-    .status-dot {{
+    .status-dot {
         width: 10px;
         height: 10px;
-        border-radius: 50%;
-        background: {COLORS['accent_success']};
-        box-shadow: 0 0 10px {COLORS['glow_success']};
+        border-radius: 50%%;
+        background: %(accent_success)s;
+        box-shadow: 0 0 10px %(glow_success)s;
         animation: pulse 2s ease-in-out infinite;
-    }}
+    }
+    
+    .header-actions {
+        display: flex;
+        align-items: center;
+        gap: 20px;
+    }
+    
+    .user-badge {
+        background: rgba(255, 255, 255, 0.05);
+        padding: 8px 16px;
+        border-radius: 20px;
+        font-size: 0.85em;
+    }
     
     /* ===== CARDS ===== */
-    .nexus-card {{
+    .nexus-card {
         background: rgba(255, 255, 255, 0.05);
         backdrop-filter: blur(15px);
         -webkit-backdrop-filter: blur(15px);
-        border: 1px solid {COLORS['border']};
+        border: 1px solid %(border)s;
         border-radius: 16px;
         padding: 24px;
         margin-bottom: 20px;
         box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
         transition: all 0.3s ease;
-    }}
+    }
     
-    .nexus-card:hover {{
-        border-color: {COLORS['accent_primary']};
-        box-shadow: 0 8px 40px {COLORS['glow']};
+    .nexus-card:hover {
+        border-color: %(accent_primary)s;
+        box-shadow: 0 8px 40px %(glow)s;
         transform: translateY(-2px);
-    }}
+    }
     
-    .card-title {{
+    .card-title {
         font-size: 1.1em;
         font-weight: 600;
-        color: {COLORS['text_primary']};
+        color: %(text_primary)s;
         margin-bottom: 15px;
         display: flex;
         align-items: center;
         gap: 10px;
-    }}
+    }
     
-    .card-icon {{
+    .card-icon {
         font-size: 1.3em;
-    }}
+    }
     
     /* ===== METRICS ===== */
-    .metric-container {{
+    .metric-container {
         text-align: center;
-    }}
+    }
     
-    .metric-value {{
+    .metric-value {
         font-size: 2.5em;
         font-weight: 800;
-        color: {COLORS['text_primary']};
+        color: %(text_primary)s;
         line-height: 1.2;
         margin: 10px 0;
-    }}
+    }
     
-    .metric-label {{
+    .metric-label {
         font-size: 0.75em;
-        color: {COLORS['text_secondary']};
+        color: %(text_secondary)s;
         text-transform: uppercase;
         letter-spacing: 1.5px;
         font-weight: 500;
-    }}
+    }
     
-    .metric-progress {{
+    .metric-progress {
         height: 6px;
-        background: {COLORS['bg_secondary']};
+        background: %(bg_secondary)s;
         border-radius: 3px;
         margin-top: 12px;
         overflow: hidden;
-    }}
+    }
     
-    .metric-progress-bar {{
-        height: 100%;
-        background: linear-gradient(90deg, {COLORS['accent_primary']}, {COLORS['accent_secondary']});
+    .metric-progress-bar {
+        height: 100%%;
+        background: linear-gradient(90deg, %(accent_primary)s, %(accent_secondary)s);
         border-radius: 3px;
         transition: width 0.5s ease;
-        box-shadow: 0 0 10px {COLORS['glow']};
-    }}
+        box-shadow: 0 0 10px %(glow)s;
+    }
     
     /* ===== PIPELINE ===== */
-    .pipeline {{
+    .pipeline {
         display: flex;
         justify-content: space-between;
         align-items: center;
         padding: 20px;
         margin-bottom: 25px;
-    }}
+    }
     
-    .pipeline-step {{
+    .pipeline-step {
         flex: 1;
         text-align: center;
         position: relative;
         padding: 15px 10px;
         border-radius: 8px;
         transition: all 0.3s ease;
-    }}
+    }
     
-    .pipeline-step.active {{
+    .pipeline-step.active {
         background: rgba(99, 102, 241, 0.15);
-        border: 2px solid {COLORS['accent_primary']};
-        box-shadow: 0 0 20px {COLORS['glow']};
-    }}
+        border: 2px solid %(accent_primary)s;
+        box-shadow: 0 0 20px %(glow)s;
+    }
     
-    .pipeline-step.completed {{
+    .pipeline-step.completed {
         background: rgba(16, 185, 129, 0.1);
-        border: 1px solid {COLORS['accent_success']};
-    }}
+        border: 1px solid %(accent_success)s;
+    }
     
-    .pipeline-step.pending {{
+    .pipeline-step.pending {
         background: rgba(255, 255, 255, 0.02);
-        border: 1px solid {COLORS['border']};
+        border: 1px solid %(border)s;
         opacity: 0.5;
-    }}
+    }
     
-    .pipeline-icon {{
+    .pipeline-icon {
         font-size: 1.5em;
         margin-bottom: 8px;
-    }}
+    }
     
-    .pipeline-label {{
+    .pipeline-label {
         font-size: 0.8em;
         font-weight: 500;
-        color: {COLORS['text_secondary']};
-    }}
+        color: %(text_secondary)s;
+    }
     
-    .pipeline-step.active .pipeline-label {{
-        color: {COLORS['accent_primary']};
+    .pipeline-step.active .pipeline-label {
+        color: %(accent_primary)s;
         font-weight: 600;
-    }}
+    }
     
-    .pipeline-arrow {{
-        color: {COLORS['border']};
+    .pipeline-arrow {
+        color: %(border)s;
         font-size: 1.5em;
         margin: 0 5px;
-    }}
+    }
     
     /* ===== ACTIVE AGENT ===== */
-    .agent-card {{
+    .agent-card {
         background: linear-gradient(135deg, rgba(99, 102, 241, 0.1), rgba(139, 92, 246, 0.05));
-        border: 1px solid {COLORS['accent_primary']};
+        border: 1px solid %(accent_primary)s;
         border-radius: 16px;
         padding: 25px;
-        box-shadow: 0 0 30px {COLORS['glow']};
-    }}
+        box-shadow: 0 0 30px %(glow)s;
+    }
     
-    .agent-header {{
+    .agent-header {
         display: flex;
         justify-content: space-between;
         align-items: center;
         margin-bottom: 20px;
-    }}
+    }
     
-    .agent-name {{
+    .agent-name {
         font-size: 1.3em;
         font-weight: 700;
-        color: {COLORS['text_primary']};
+        color: %(text_primary)s;
         display: flex;
         align-items: center;
         gap: 12px;
-    }}
+    }
     
-    .agent-model {{
+    .agent-model {
         font-size: 0.85em;
-        color: {COLORS['text_secondary']};
+        color: %(text_secondary)s;
         background: rgba(255, 255, 255, 0.05);
         padding: 6px 14px;
         border-radius: 12px;
-        border: 1px solid {COLORS['border']};
-    }}
+        border: 1px solid %(border)s;
+    }
     
-    .agent-status {{
+    .agent-status {
         font-size: 0.9em;
-        color: {COLORS['text_secondary']};
+        color: %(text_secondary)s;
         margin-bottom: 15px;
-    }}
+    }
+    
+    .agent-progress-label {
+        text-align: right;
+        font-size: 0.9em;
+        color: %(text_secondary)s;
+        margin-top: 10px;
+    }
     
     /* ===== COUNCIL ===== */
-    .council-grid {{
+    .council-grid {
         display: grid;
         grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
         gap: 20px;
         margin-bottom: 20px;
-    }}
+    }
     
-    .judge-card {{
+    .judge-card {
         background: rgba(255, 255, 255, 0.03);
-        border: 1px solid {COLORS['border']};
+        border: 1px solid %(border)s;
         border-radius: 12px;
         padding: 20px;
         text-align: center;
         transition: all 0.3s ease;
-    }}
+    }
     
-    .judge-card:hover {{
-        border-color: {COLORS['accent_primary']};
+    .judge-card:hover {
+        border-color: %(accent_primary)s;
         transform: translateY(-5px);
-    }}
+    }
     
-    .judge-name {{
+    .judge-name {
         font-size: 1.1em;
         font-weight: 600;
         margin-bottom: 10px;
-        color: {COLORS['text_primary']};
-    }}
+        color: %(text_primary)s;
+    }
     
-    .judge-model {{
+    .judge-model {
         font-size: 0.75em;
-        color: {COLORS['text_secondary']};
+        color: %(text_secondary)s;
         margin-bottom: 15px;
-    }}
+    }
     
-    .judge-score {{
+    .judge-score {
         font-size: 2em;
         font-weight: 800;
-        color: {COLORS['accent_primary']};
+        color: %(accent_primary)s;
         margin: 15px 0;
-    }}
+    }
     
-    .score-circle {{
+    .score-circle {
         width: 100px;
         height: 100px;
-        border-radius: 50%;
-        border: 4px solid {COLORS['border']};
+        border-radius: 50%%;
+        border: 4px solid %(border)s;
         display: flex;
         align-items: center;
         justify-content: center;
@@ -324,223 +355,378 @@ def get_base_styles() -> str:
         font-size: 1.8em;
         font-weight: 800;
         background: rgba(255, 255, 255, 0.05);
-    }}
+    }
     
-    .verdict-badge {{
+    .verdict-badge {
         display: inline-block;
         padding: 6px 16px;
         border-radius: 20px;
         font-size: 0.8em;
         font-weight: 600;
         text-transform: uppercase;
-    }}
+    }
     
-    .verdict-approve {{
-        background: {COLORS['accent_success']};
+    .verdict-approve {
+        background: %(accent_success)s;
         color: white;
-        box-shadow: 0 0 15px {COLORS['glow_success']};
-    }}
+        box-shadow: 0 0 15px %(glow_success)s;
+    }
     
-    .verdict-reject {{
-        background: {COLORS['accent_error']};
+    .verdict-reject {
+        background: %(accent_error)s;
         color: white;
-    }}
+    }
     
-    .verdict-pending {{
-        background: {COLORS['accent_warning']};
+    .verdict-pending {
+        background: %(accent_warning)s;
         color: white;
-        box-shadow: 0 0 15px {COLORS['glow_warning']};
-    }}
+        box-shadow: 0 0 15px %(glow_warning)s;
+    }
     
-    .arbitrator-card {{
+    .arbitrator-card {
         background: linear-gradient(135deg, rgba(99, 102, 241, 0.15), rgba(139, 92, 246, 0.1));
-        border: 2px solid {COLORS['accent_primary']};
+        border: 2px solid %(accent_primary)s;
         border-radius: 16px;
         padding: 25px;
         text-align: center;
-        box-shadow: 0 0 30px {COLORS['glow']};
-    }}
+        box-shadow: 0 0 30px %(glow)s;
+    }
+    
+    .judge-icon {
+        font-size: 2em;
+        margin-bottom: 10px;
+    }
+    
+    .judge-score-max {
+        font-size: 0.7em;
+        color: %(text_secondary)s;
+        margin-bottom: 10px;
+    }
+    
+    .council-arbitrator {
+        margin-top: 20px;
+    }
+    
+    .arb-title {
+        font-size: 1.2em;
+        font-weight: 600;
+        margin-bottom: 15px;
+    }
+    
+    .arb-score {
+        font-size: 2.5em;
+        font-weight: 800;
+        color: %(accent_primary)s;
+        margin: 20px 0;
+    }
+    
+    .arb-waiting {
+        font-size: 1.5em;
+        color: %(accent_warning)s;
+        margin: 20px 0;
+    }
+    
+    .verdict-badge.arb-verdict {
+        font-size: 1em;
+        padding: 8px 20px;
+    }
+    
+    .arb-reasoning {
+        margin-top: 20px;
+        font-size: 0.9em;
+        color: %(text_secondary)s;
+        line-height: 1.6;
+    }
+    
+    .progression-box {
+        margin-top: 15px;
+        padding: 10px;
+        background: rgba(255, 255, 255, 0.05);
+        border-radius: 8px;
+        border: 1px solid rgba(255, 255, 255, 0.1);
+    }
+    
+    .progression-title {
+        font-size: 0.9em;
+        color: %(text_secondary)s;
+        margin-bottom: 5px;
+    }
+    
+    .progression-value {
+        font-size: 1.2em;
+        font-weight: 600;
+    }
+    
+    .concerns-box {
+        margin-top: 20px;
+        padding: 20px;
+        background: rgba(239, 68, 68, 0.1);
+        border-radius: 12px;
+        border: 1px solid rgba(239, 68, 68, 0.3);
+    }
+    
+    .concerns-title {
+        font-size: 1.1em;
+        font-weight: 600;
+        margin-bottom: 15px;
+        color: %(accent_error)s;
+    }
+    
+    .concern-row {
+        margin: 8px 0;
+        padding: 8px 12px;
+        background: rgba(0, 0, 0, 0.2);
+        border-radius: 6px;
+        border-left: 3px solid %(accent_error)s;
+    }
+    
+    .concern-judge {
+        color: %(text_secondary)s;
+        font-size: 0.85em;
+    }
+    
+    .concern-text {
+        color: %(text_primary)s;
+        margin-left: 8px;
+    }
+    
+    /* ===== WORKSPACE ===== */
+    .workspace-row {
+        padding: 8px;
+        border-bottom: 1px solid %(border)s;
+        font-family: monospace;
+        font-size: 0.9em;
+    }
+    
+    .workspace-empty {
+        color: %(text_secondary)s;
+        padding: 20px;
+        text-align: center;
+    }
+    
+    .workspace-error {
+        color: %(accent_error)s;
+        padding: 20px;
+    }
+    
+    /* ===== FORMS ===== */
+    .stTextArea textarea {
+        background: rgba(255, 255, 255, 0.05) !important;
+        border: 1px solid %(border)s !important;
+        border-radius: 12px !important;
+        color: %(text_primary)s !important;
+        font-family: 'Inter', sans-serif !important;
+        padding: 15px !important;
+    }
+    
+    .stTextArea textarea:focus {
+        border-color: %(accent_primary)s !important;
+        box-shadow: 0 0 15px %(glow)s !important;
+    }
     
+    .stTextArea label {
+        color: #22d3ee !important;
+        font-weight: 500 !important;
+    }
+    
+    .stButton button {
+        background: linear-gradient(135deg, %(accent_primary)s, %(accent_secondary)s) !important;
+        color: white !important;
+        border: none !important;
+        border-radius: 12px !important;
+        padding: 12px 30px !important;
+        font-weight: 600 !important;
+        font-size: 1em !important;
+        transition: all 0.3s ease !important;
+        box-shadow: 0 4px 15px %(glow)s !important;
+    }
+    
+    .stButton button:hover {
+        box-shadow: 0 6px 25px %(glow)s !important;
+        transform: translateY(-2px) !important;
+    }
+    
+    /* ===== RESPONSIVE ===== */
+    @media (max-width: 768px) {
+        .nexus-header {
+            flex-direction: column;
+            gap: 15px;
+        }
+        
+        .pipeline {
+            flex-direction: column;
+        }
+        
+        .pipeline-arrow {
+            transform: rotate(90deg);
+            margin: 10px 0;
+        }
+        
+        .council-grid {
+            grid-template-columns: 1fr;
+        }
+    }
+    </style>
+    """
+
+# Terminal, animations and scrollbar: not needed for the first paint
+_DEFERRED_STYLES_TMPL = """
+    <style>
     /* ===== TERMINAL ===== */
-    .terminal-container {{
+    .terminal-container {
         background: #000000;
-        border: 1px solid {COLORS['border']};
+        border: 1px solid %(border)s;
         border-radius: 12px;
         padding: 20px;
         font-family: 'Monaco', 'Courier New', monospace;
-        color: {COLORS['accent_success']};
+        color: %(accent_success)s;
         height: 400px;
         overflow-y: auto;
         box-shadow: inset 0 2px 10px rgba(0, 0, 0, 0.5);
-    }}
+    }
     
-    .log-entry {{
+    .log-entry {
         margin-bottom: 8px;
         padding: 5px 0;
         border-bottom: 1px solid #111;
         line-height: 1.6;
-    }}
+    }
     
-    .log-timestamp {{
-        color: {COLORS['text_secondary']};
+    .log-timestamp {
+        color: %(text_secondary)s;
         font-size: 0.85em;
-    }}
+    }
     
-    .log-level-info {{
-        color: {COLORS['accent_primary']};
-    }}
+    .log-level-info {
+        color: %(accent_primary)s;
+    }
     
-    .log-level-success {{
-        color: {COLORS['accent_success']};
-    }}
+    .log-level-success {
+        color: %(accent_success)s;
+    }
     
-    .log-level-warning {{
-        color: {COLORS['accent_warning']};
-    }}
+    .log-level-warning {
+        color: %(accent_warning)s;
+    }
     
-    .log-level-error {{
-        color: {COLORS['accent_error']};
-    }}
+    .log-level-error {
+        color: %(accent_error)s;
+    }
     
-    .log-cursor {{
-        color: {COLORS['accent_success']};
+    .log-cursor {
+        color: %(accent_success)s;
         animation: blink 1s step-end infinite;
-    }}
+    }
     
     /* ===== ANIMATIONS ===== */
-    @keyframes pulse {{
-        0%, 100% {{
+    @keyframes pulse {
+        0%%, 100%% {
             opacity: 1;
-        }}
-        50% {{
+        }
+        50%% {
             opacity: 0.5;
-        }}
-    }}
-    
-    @keyframes pulse-glow {{
-        0%, 100% {{
-            box-shadow: 0 4px 15px {COLORS['glow']};
-        }}
-        50% {{
-            box-shadow: 0 4px 25px {COLORS['glow']};
-        }}
-    }}
-    
-    @keyframes blink {{
-        0%, 50% {{
+        }
+    }
+    
+    @keyframes pulse-glow {
+        0%%, 100%% {
+            box-shadow: 0 4px 15px %(glow)s;
+        }
+        50%% {
+            box-shadow: 0 4px 25px %(glow)s;
+        }
+    }
+    
+    @keyframes blink {
+        0%%, 50%% {
             opacity: 1;
-        }}
-        51%, 100% {{
+        }
+        51%%, 100%% {
             opacity: 0;
-        }}
-    }}
+        }
+    }
     
-    @keyframes fadeIn {{
-        from {{
+    @keyframes fadeIn {
+        from {
             opacity: 0;
             transform: translateY(10px);
-        }}
-        to {{
+        }
+        to {
             opacity: 1;
             transform: translateY(0);
-        }}
-    }}
+        }
+    }
     
-    @keyframes slideIn {{
-        from {{
+    @keyframes slideIn {
+        from {
             transform: translateX(-20px);
             opacity: 0;
-        }}
-        to {{
+        }
+        to {
             transform: translateX(0);
             opacity: 1;
-        }}
-    }}
+        }
+    }
     
-    .fade-in {{
+    .fade-in {
         animation: fadeIn 0.5s ease-out;
-    }}
+    }
     
-    .slide-in {{
+    .slide-in {
         animation: slideIn 0.5s ease-out;
-    }}
-    
-    /* ===== FORMS ===== */
-    .stTextArea textarea {{
-        background: rgba(255, 255, 255, 0.05) !important;
-        border: 1px solid {COLORS['border']} !important;
-        border-radius: 12px !important;
-        color: {COLORS['text_primary']} !important;
-        font-family: 'Inter', sans-serif !important;
-        padding: 15px !important;
-    }}
-    
-    .stTextArea textarea:focus {{
-        border-color: {COLORS['accent_primary']} !important;
-        box-shadow: 0 0 15px {COLORS['glow']} !important;
-    }}
-    
-    .stTextArea label {{
-        color: #22d3ee !important;
-        font-weight: 500 !important;
-    }}
-    
-    .stButton button {{
-        background: linear-gradient(135deg, {COLORS['accent_primary']}, {COLORS['accent_secondary']}) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 12px !important;
-        padding: 12px 30px !important;
-        font-weight: 600 !important;
-        font-size: 1em !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 4px 15px {COLORS['glow']} !important;
-    }}
-    
-    .stButton button:hover {{
-        box-shadow: 0 6px 25px {COLORS['glow']} !important;
-        transform: translateY(-2px) !important;
-    }}
+    }
     
     /* ===== SCROLLBAR ===== */
-    ::-webkit-scrollbar {{
+    ::-webkit-scrollbar {
         width: 10px;
         height: 10px;
-    }}
+    }
     
-    ::-webkit-scrollbar-track {{
-        background: {COLORS['bg_secondary']};
+    ::-webkit-scrollbar-track {
+        background: %(bg_secondary)s;
         border-radius: 5px;
-    }}
+    }
     
-    ::-webkit-scrollbar-thumb {{
-        background: {COLORS['accent_primary']};
+    ::-webkit-scrollbar-thumb {
+        background: %(accent_primary)s;
         border-radius: 5px;
-    }}
-    
-    ::-webkit-scrollbar-thumb:hover {{
-        background: {COLORS['accent_secondary']};
-    }}
+    }
     
-    /* ===== RESPONSIVE ===== */
-    @media (max-width: 768px) {{
-        .nexus-header {{
-            flex-direction: column;
-            gap: 15px;
-        }}
-        
-        .pipeline {{
-            flex-direction: column;
-        }}
-        
-        .pipeline-arrow {{
-            transform: rotate(90deg);
-            margin: 10px 0;
-        }}
-        
-        .council-grid {{
-            grid-template-columns: 1fr;
-        }}
-    }}
+    ::-webkit-scrollbar-thumb:hover {
+        background: %(accent_secondary)s;
+    }
     </style>
     """
+_CRITICAL_STYLES = _minify_css(_CRITICAL_STYLES_TMPL % COLORS)
+_DEFERRED_STYLES = _minify_css(_DEFERRED_STYLES_TMPL % COLORS)
+_BASE_STYLES = _CRITICAL_STYLES + _DEFERRED_STYLES
+
+
+def get_base_styles() -> str:
+    """
+    Generate base CSS styles for the dashboard.
+    
+    Returns:
+        CSS string with all base styles
+    """
+    return _BASE_STYLES
+
+
+def get_critical_styles() -> str:
+    """
+    Get the CSS needed for the first paint (theme, header, cards, forms, layout).
+    
+    Returns:
+        CSS string to inject before any dashboard content
+    """
+    return _CRITICAL_STYLES
+
+
+def get_deferred_styles() -> str:
+    """
+    Get the CSS that can wait for the main layout (terminal, animations, scrollbar).
+    
+    Returns:
+        CSS string to inject after the main layout
+    """
+    return _DEFERRED_STYLES
@@ -2,9 +2,45 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Optional
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp once (the date format has no sub-second part)."""
+    
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt, datefmt)
+        self._last_time = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached = self._last_time
+        if second == cached_second:
+            return cached
+        formatted = super().formatTime(record, datefmt)
+        self._last_time = (second, formatted)
+        return formatted
+
+
+# Shared by every handler so the timestamp cache is shared too
+_formatter = _CachedTimeFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Configured loggers by name: repeat calls skip logging's module lock
+_loggers: Dict[str, logging.Logger] = {}
+
+# One queue per (log_file, level), drained to the console and file handlers by
+# a background listener thread so callers never block on terminal or disk I/O
+_queue_handlers: Dict[Tuple[str, int], QueueHandler] = {}
+_queue_handlers_lock = threading.Lock()
 
 
 def get_logger(name: str, log_file: str = "nexus.log", level: int = logging.INFO) -> logging.Logger:
@@ -19,7 +55,12 @@ def get_logger(name: str, log_file: str = "nexus.log", level: int = logging.INFO
     Returns:
         Configured logger instance
     """
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+    
     logger = logging.getLogger(name)
+    _loggers[name] = logger
     
     # Avoid adding handlers multiple times
     if logger.handlers:
@@ -27,25 +68,36 @@ def get_logger(name: str, log_file: str = "nexus.log", level: int = logging.INFO
     
     logger.setLevel(level)
     
-    # Create formatters
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    try:
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    except (OSError, IOError) as e:
-        logger.warning(f"Could not create file handler for {log_file}: {e}")
+    file_error = None
+    with _queue_handlers_lock:
+        queue_handler = _queue_handlers.get((log_file, level))
+        if queue_handler is None:
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(level)
+            console_handler.setFormatter(_formatter)
+            handlers = [console_handler]
+            
+            # File handler
+            try:
+                file_handler = logging.FileHandler(log_file, encoding='utf-8')
+                file_handler.setLevel(level)
+                file_handler.setFormatter(_formatter)
+                handlers.append(file_handler)
+            except (OSError, IOError) as e:
+                file_error = e
+            
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            # Drain the queue before the interpreter exits
+            atexit.register(listener.stop)
+            
+            queue_handler = QueueHandler(log_queue)
+            _queue_handlers[(log_file, level)] = queue_handler
+    
+    logger.addHandler(queue_handler)
+    if file_error is not None:
+        logger.warning(f"Could not create file handler for {log_file}: {file_error}")
     
     return logger
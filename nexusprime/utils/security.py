@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
 import re
 from typing import List, Tuple
@@ -10,6 +12,41 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Dangerous imports and calls flagged in generated code, compiled once at import
+_DANGEROUS_PATTERNS = tuple((re.compile(pattern), description) for pattern, description in (
+    (r'\bos\.system\b', "os.system() - Command execution"),
+    (r'\bsubprocess\.', "subprocess module - Process execution"),
+    (r'\beval\s*\(', "eval() - Code evaluation"),
+    (r'\bexec\s*\(', "exec() - Code execution"),
+    (r'\b__import__\s*\(', "__import__() - Dynamic imports"),
+    (r'\bcompile\s*\(', "compile() - Code compilation"),
+    (r'\bopen\s*\([^)]*[\'"][wWaA]', "open() with write/append mode - File writing"),
+    (r'\bshutil\.rmtree\b', "shutil.rmtree() - Recursive deletion"),
+    (r'\bos\.remove\b', "os.remove() - File deletion"),
+    (r'\bos\.unlink\b', "os.unlink() - File deletion"),
+))
+
+# The patterns fused into a single scan of the code. Each one sits in its own
+# lookahead so overlapping hits (eval( inside an open(...) call) are all seen,
+# and since every pattern starts with \b and a literal character, a guard on
+# that first character rejects most positions before any alternative is tried.
+_DANGEROUS_SCAN = re.compile(r"\b(?=[%s])(?:%s)" % (
+    re.escape("".join(sorted({pattern.pattern[2] for pattern, _ in _DANGEROUS_PATTERNS}))),
+    "|".join(
+        f"(?=(?P<p{index}>{pattern.pattern}))"
+        for index, (pattern, _) in enumerate(_DANGEROUS_PATTERNS)
+    ),
+))
+
+# Warning reported for each pattern, by pattern index
+_DANGEROUS_WARNINGS = tuple(
+    f"Potentially dangerous code detected: {description}" for _, description in _DANGEROUS_PATTERNS
+)
+
+# Literal substrings at least one of which every dangerous pattern contains:
+# code holding none of them is safe without running the regex scan
+_FAST_TOKENS = ("os.", "subprocess", "eval", "exec", "__import__", "compile", "open", "shutil")
+
 
 def get_required_env(key: str) -> str:
     """
@@ -32,6 +69,20 @@ def get_required_env(key: str) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=32)
+def _find_dangerous_patterns(code: str) -> Tuple[int, ...]:
+    """Return the indexes of dangerous patterns found in code (memoized: feedback loops resubmit identical code)."""
+    if not any(token in code for token in _FAST_TOKENS):
+        return ()
+    
+    found = set()
+    for match in _DANGEROUS_SCAN.finditer(code):
+        found.add(int(match.lastgroup[1:]))
+        if len(found) == len(_DANGEROUS_PATTERNS):
+            break
+    return tuple(sorted(found))
+
+
 def validate_generated_code(code: str) -> Tuple[bool, List[str]]:
     """
     Validate generated Python code for potentially dangerous imports and patterns.
@@ -44,31 +95,13 @@ def validate_generated_code(code: str) -> Tuple[bool, List[str]]:
         - is_safe: True if no dangerous patterns found, False otherwise
         - list_of_warnings: List of warning messages about dangerous patterns
     """
-    warnings: List[str] = []
-    
-    # Dangerous imports to check
-    dangerous_patterns = [
-        (r'\bos\.system\b', "os.system() - Command execution"),
-        (r'\bsubprocess\.', "subprocess module - Process execution"),
-        (r'\beval\s*\(', "eval() - Code evaluation"),
-        (r'\bexec\s*\(', "exec() - Code execution"),
-        (r'\b__import__\s*\(', "__import__() - Dynamic imports"),
-        (r'\bcompile\s*\(', "compile() - Code compilation"),
-        (r'\bopen\s*\([^)]*[\'"][wWaA]', "open() with write/append mode - File writing"),
-        (r'\bshutil\.rmtree\b', "shutil.rmtree() - Recursive deletion"),
-        (r'\bos\.remove\b', "os.remove() - File deletion"),
-        (r'\bos\.unlink\b', "os.unlink() - File deletion"),
-    ]
-    
-    for pattern, description in dangerous_patterns:
-        if re.search(pattern, code):
-            warning_msg = f"Potentially dangerous code detected: {description}"
-            warnings.append(warning_msg)
-            logger.warning(warning_msg)
-    
+    warnings = [_DANGEROUS_WARNINGS[index] for index in _find_dangerous_patterns(code)]
     is_safe = len(warnings) == 0
     
-    if not is_safe:
-        logger.warning(f"Code validation found {len(warnings)} potential security issues")
+    # One batched record instead of one per hit, built only if it will be emitted
+    if not is_safe and logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            f"Code validation found {len(warnings)} potential security issues:\n" + "\n".join(warnings)
+        )
     
     return is_safe, warnings
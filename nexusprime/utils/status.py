@@ -2,43 +2,155 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Mapping, Optional, Tuple, TYPE_CHECKING
+
+import orjson
 
 from .logging import get_logger
+from .tokens import TokenUsage
 
 if TYPE_CHECKING:
     from ..core.state import NexusFactoryState
 
 logger = get_logger(__name__)
 
+# Snapshots are coalesced: at most one write per file per debounce window
+SNAPSHOT_DEBOUNCE_SECONDS = 0.2
+
+_pending_snapshots: Dict[str, Dict[str, Any]] = {}
+_pending_lock = threading.Lock()
+_write_lock = threading.Lock()
+# Delayed flushes run on one long-lived writer thread, off the agents' threads
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="status-writer")
+_flush_scheduled = False
+# Last bytes written per status file and the file signature they produced, so
+# unchanged snapshots are not rewritten unless someone else rewrote the file
+_last_written: Dict[str, Tuple[bytes, Tuple[int, int, int]]] = {}
+# Last snapshot loaded per status file, keyed by its (mtime_ns, size, inode)
+_loaded_snapshots: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+
+def _file_signature(status_file: str) -> Tuple[int, int, int]:
+    """Return the (mtime_ns, size, inode) of a file; every write replaces the file."""
+    stat = os.stat(status_file)
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
 
-def save_status_snapshot(state: Dict[str, Any], status_file: str = "status.json") -> None:
+def _write_snapshot(snapshot: Mapping[str, Any], status_file: str) -> bool:
+    """
+    Write a snapshot atomically (temp file + rename) so readers never see a partial file.
+    
+    Returns:
+        True if the file was written, False if it already held this snapshot
+    """
+    data = orjson.dumps(dict(snapshot), option=orjson.OPT_INDENT_2)
+    last = _last_written.get(status_file)
+    if last is not None and last[0] == data:
+        try:
+            if _file_signature(status_file) == last[1]:
+                return False
+        except FileNotFoundError:
+            pass
+    tmp_file = f"{status_file}.tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, status_file)
+    _last_written[status_file] = (data, _file_signature(status_file))
+    return True
+
+
+def write_status_snapshot(snapshot: Mapping[str, Any], status_file: str = "status.json") -> None:
+    """
+    Write a ready-made status snapshot immediately, replacing any pending one.
+    
+    Used for statuses that do not come from factory state (daemon start-up
+    and error reports).
+    
+    Args:
+        snapshot: Status dictionary in the dashboard format
+        status_file: Path to status file
+    
+    Raises:
+        OSError: If the file cannot be written
+    """
+    with _write_lock:
+        with _pending_lock:
+            # A stale pending snapshot must not overwrite this one later
+            _pending_snapshots.pop(status_file, None)
+        _write_snapshot(snapshot, status_file)
+
+
+def flush_status_snapshots() -> None:
+    """Write any pending status snapshots to disk immediately."""
+    global _flush_scheduled
+    # Held across take-and-write so write_status_snapshot() cannot interleave
+    with _write_lock:
+        with _pending_lock:
+            pending = dict(_pending_snapshots)
+            _pending_snapshots.clear()
+            _flush_scheduled = False
+        
+        for status_file, snapshot in pending.items():
+            try:
+                if _write_snapshot(snapshot, status_file):
+                    logger.debug(f"Status snapshot saved to {status_file}")
+                else:
+                    logger.debug(f"Status snapshot unchanged, {status_file} not rewritten")
+            except (OSError, IOError) as e:
+                logger.error(f"Failed to save status snapshot: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error saving status snapshot: {e}")
+
+
+def _flush_after_debounce() -> None:
+    """Writer-thread job: let the debounce window fill up, then flush it."""
+    time.sleep(SNAPSHOT_DEBOUNCE_SECONDS)
+    flush_status_snapshots()
+
+
+atexit.register(flush_status_snapshots)
+
+
+def save_status_snapshot(state: Mapping[str, Any], status_file: str = "status.json") -> None:
     """
     Export current state to JSON file for dashboard consumption.
     
+    Writes are debounced: the latest snapshot per file is written once
+    SNAPSHOT_DEBOUNCE_SECONDS after the first pending update. Call
+    flush_status_snapshots() to force the write.
+    
     Args:
-        state: Current factory state
+        state: Current factory state (any read-only mapping, e.g. a ChainMap
+            of a node's update over the incoming state)
         status_file: Path to status file
     """
+    global _flush_scheduled
     try:
+        total_tokens = state.get("total_tokens") or TokenUsage()
+        if isinstance(total_tokens, TokenUsage):
+            total_tokens = total_tokens.to_dict()
+        
         snapshot = {
             "current_status": state.get("current_status"),
             "env_mode": state.get("env_mode"),
             "quality_score": state.get("quality_score"),
             "feedback_loop_count": state.get("feedback_loop_count"),
-            "spec_excerpt": state.get("spec_document", "")[:200],
+            "spec_excerpt": (state.get("spec_document") or "")[:200],
             "last_message": state["messages"][-1].content if state.get("messages") else "",
-            "total_tokens": state.get("total_tokens", {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0})
+            "total_tokens": total_tokens
         }
         
-        with open(status_file, "w", encoding="utf-8") as f:
-            json.dump(snapshot, f, indent=2)
-        
-        logger.debug(f"Status snapshot saved to {status_file}")
-    except (OSError, IOError) as e:
-        logger.error(f"Failed to save status snapshot: {e}")
+        with _pending_lock:
+            _pending_snapshots[status_file] = snapshot
+            if not _flush_scheduled:
+                _writer.submit(_flush_after_debounce)
+                _flush_scheduled = True
     except Exception as e:
         logger.error(f"Unexpected error saving status snapshot: {e}")
 
@@ -47,6 +159,9 @@ def load_status_snapshot(status_file: str = "status.json") -> Optional[Dict[str,
     """
     Load status snapshot from JSON file.
     
+    The parsed snapshot is reused while the file's mtime, size and inode are
+    unchanged (every write replaces the file), so callers must not mutate it.
+    
     Args:
         status_file: Path to status file
     
@@ -54,14 +169,18 @@ def load_status_snapshot(status_file: str = "status.json") -> Optional[Dict[str,
         Status dictionary or None if file doesn't exist or is invalid
     """
     try:
-        status_path = Path(status_file)
-        if not status_path.exists():
-            logger.debug(f"Status file {status_file} does not exist")
-            return None
+        signature = _file_signature(status_file)
+        cached = _loaded_snapshots.get(status_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
         
-        with open(status_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        snapshot = orjson.loads(Path(status_file).read_bytes())
+        _loaded_snapshots[status_file] = (signature, snapshot)
+        return snapshot
+    except FileNotFoundError:
+        logger.debug(f"Status file {status_file} does not exist")
+        return None
+    except orjson.JSONDecodeError as e:
         logger.error(f"Invalid JSON in status file {status_file}: {e}")
         return None
     except (OSError, IOError) as e:
@@ -2,38 +2,152 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Union
 
+from .logging import get_logger
 
-def update_token_usage(current_usage: Dict[str, int], new_usage: Dict[str, int]) -> Dict[str, int]:
+logger = get_logger(__name__)
+
+# Optional: Try to import tiktoken for token-aware truncation
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Rough chars-per-token ratio for English text, used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+_encoder: Optional[Any] = None
+_encoder_loaded = False
+
+
+def _get_encoder() -> Optional[Any]:
+    """Load the shared tokenizer once (None if unavailable)."""
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        _encoder_loaded = True
+        if TIKTOKEN_AVAILABLE:
+            try:
+                _encoder = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                logger.warning(f"Failed to load tiktoken encoding: {e}. Falling back to character slicing.")
+    return _encoder
+
+
+@lru_cache(maxsize=128)
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to at most max_tokens tokens.
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+    
+    Returns:
+        Truncated text (approximated by characters if no tokenizer is available)
+    """
+    # Fast path: text cannot exceed the budget even at one char per token
+    if len(text) <= max_tokens:
+        return text
+    
+    encoder = _get_encoder()
+    if encoder is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    
+    tokens = encoder.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+
+@dataclass(slots=True)
+class TokenUsage:
+    """Cumulative token usage across LLM calls."""
+    
+    prompt: int = 0
+    completion: int = 0
+    total: int = 0
+    
+    @classmethod
+    def from_dict(cls, usage: Mapping[str, int]) -> TokenUsage:
+        """Build from a serialized usage dict (status.json format)."""
+        get = usage.get
+        return cls(get("prompt_tokens", 0), get("completion_tokens", 0), get("total_tokens", 0))
+    
+    def add(self, usage: Mapping[str, int]) -> TokenUsage:
+        """
+        Add usage from one LLM call (router or Gemini format) in place.
+        
+        Args:
+            usage: Token usage from latest LLM call
+        
+        Returns:
+            self, for chaining
+        """
+        get = usage.get
+        self.prompt += get("prompt_tokens", 0) or get("prompt_token_count", 0)
+        self.completion += get("completion_tokens", 0) or get("candidates_token_count", 0)
+        self.total += get("total_token_count", 0)
+        return self
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Serialize for JSON consumers (status snapshot, dashboard)."""
+        return {
+            "prompt_tokens": self.prompt,
+            "completion_tokens": self.completion,
+            "total_tokens": self.total
+        }
+
+
+def update_token_usage(
+    current_usage: Union[TokenUsage, Mapping[str, int], None],
+    new_usage: Mapping[str, int]
+) -> TokenUsage:
     """
     Merge token usage from a new LLM call into cumulative usage.
     
     Args:
-        current_usage: Current cumulative token usage
-        new_usage: Token usage from latest LLM call (Gemini format)
+        current_usage: Current cumulative token usage (left unchanged: it is
+            still referenced by the graph state and its checkpoints)
+        new_usage: Token usage from latest LLM call
     
     Returns:
-        Updated token usage dictionary
+        New cumulative token usage
     """
-    return {
-        "prompt_tokens": current_usage.get("prompt_tokens", 0) + new_usage.get("prompt_token_count", 0),
-        "completion_tokens": current_usage.get("completion_tokens", 0) + new_usage.get("candidates_token_count", 0),
-        "total_tokens": current_usage.get("total_tokens", 0) + new_usage.get("total_token_count", 0)
-    }
+    if isinstance(current_usage, TokenUsage):
+        return replace(current_usage).add(new_usage)
+    return TokenUsage.from_dict(current_usage or {}).add(new_usage)
 
 
-def format_token_usage(usage: Dict[str, int]) -> str:
+def format_token_usage(usage: Union[TokenUsage, Mapping[str, int]]) -> str:
     """
     Format token usage for display.
     
     Args:
-        usage: Token usage dictionary
+        usage: Token usage (TokenUsage or dictionary)
+    
+    Returns:
+        Formatted string
+    """
+    if isinstance(usage, TokenUsage):
+        return format_token_counts(usage.prompt, usage.completion, usage.total)
+    get = usage.get
+    return format_token_counts(get("prompt_tokens", 0), get("completion_tokens", 0), get("total_tokens", 0))
+
+
+def format_token_counts(prompt: int, completion: int, total: int) -> str:
+    """
+    Format token counts for display, for callers that already hold the numbers.
+    
+    Args:
+        prompt: Prompt tokens
+        completion: Completion tokens
+        total: Total tokens
     
     Returns:
         Formatted string
     """
-    prompt = usage.get("prompt_tokens", 0)
-    completion = usage.get("completion_tokens", 0)
-    total = usage.get("total_tokens", 0)
     return f"Tokens - Prompt: {prompt:,}, Completion: {completion:,}, Total: {total:,}"
@@ -2,29 +2,51 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
+from typing import Optional
+
 from dotenv import load_dotenv
 from langchain_core.messages import HumanMessage
 
-# Load environment variables
-load_dotenv()
-
 from nexusprime import build_nexus_factory
 
 
-def run_simulation():
-    """Run the NexusPrime factory with a sample input."""
+def run_simulation(
+    prompt: str = "Build a secure Python calculator for production.",
+    thread_id: Optional[str] = None
+):
+    """
+    Run the NexusPrime factory on a prompt.
+    
+    Args:
+        prompt: User request fed to the factory
+        thread_id: Checkpoint thread ID of an interrupted run to resume. Runs
+            that are not pending (or no thread_id) start on a fresh thread.
+    """
     print("### BOOTING NEXUSPRIME FACTORY ###")
     app = build_nexus_factory()
     
     initial_state = {
-        "messages": [HumanMessage(content="Build a secure Python calculator for production.")],
+        "messages": [HumanMessage(content=prompt)],
         "feedback_loop_count": 0
     }
     
-    print(f"Input: {initial_state['messages'][0].content}")
+    print(f"Input: {prompt}")
     
-    # Run the Graph
-    final_state = app.invoke(initial_state)
+    # Run the Graph (thread_id scopes the checkpoints of this run). Only a
+    # pending thread is resumed: invoking a finished thread would merge the new
+    # input into the old run's state, so everything else gets a fresh thread.
+    config = {"configurable": {"thread_id": thread_id}}
+    if thread_id is not None and app.checkpointer is not None and app.get_state(config).next:
+        print(f"Resuming thread {thread_id} from checkpoint...")
+        final_state = app.invoke(None, config=config)
+    else:
+        key = f"{time.time()}:{prompt}"
+        thread_id = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        print(f"Thread ID: {thread_id}")
+        config = {"configurable": {"thread_id": thread_id}}
+        final_state = app.invoke(initial_state, config=config)
     
     print("\n### FACTORY SHUTDOWN ###")
     print(f"Final Status: {final_state.get('current_status')}")
@@ -33,4 +55,6 @@ def run_simulation():
 
 
 if __name__ == "__main__":
+    # Load environment variables (already-set values take precedence)
+    load_dotenv(override=False)
     run_simulation()
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import os
 import tempfile
+import uuid
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -33,3 +34,26 @@ def mock_env_vars(monkeypatch):
     """Set up mock environment variables."""
     monkeypatch.setenv("GOOGLE_API_KEY", "test_api_key")
     monkeypatch.setenv("GITHUB_TOKEN", "test_github_token")
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session-wide scratch directory for tests that use unique file names."""
+    return tmp_path_factory.mktemp("daemon-tests")
+
+
+@pytest.fixture
+def daemon_paths(shared_tmp, monkeypatch):
+    """Point the daemon's request/status files at fresh paths in the shared directory."""
+    import nexus_daemon
+
+    prefix = shared_tmp / uuid.uuid4().hex
+    paths = SimpleNamespace(
+        request=Path(f"{prefix}.request.json"),
+        processed=Path(f"{prefix}.request.processed.json"),
+        status=Path(f"{prefix}.status.json"),
+    )
+    monkeypatch.setattr(nexus_daemon, "REQUEST_FILE", str(paths.request))
+    monkeypatch.setattr(nexus_daemon, "PROCESSED_FILE", str(paths.processed))
+    monkeypatch.setattr(nexus_daemon, "STATUS_FILE", str(paths.status))
+    return paths
@@ -1,121 +1,126 @@
 """Tests for nexus_daemon module."""
 
-import json
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import MappingProxyType, SimpleNamespace
 
+import orjson
 import pytest
+from unittest.mock import patch
+
+from nexus_daemon import (
+    archive_request, get_factory, get_thread_id, initialize_status, load_request, process_request
+)
+
+# Read-only request shared by the tests, serialized once at import
+_REQUEST_DATA = MappingProxyType({
+    "prompt": "Test prompt",
+    "env_mode": "DEV",
+    "timestamp": "2024-01-01T00:00:00"
+})
+_REQUEST_JSON = orjson.dumps(dict(_REQUEST_DATA))
 
 
 class TestLoadRequest:
     """Test load_request function."""
     
-    def test_load_request_valid(self, tmp_path):
-        """Test loading a valid request."""
-        # Import inside test to avoid side effects
-        from nexus_daemon import load_request
-        
-        request_file = tmp_path / "request.json"
-        request_data = {
-            "prompt": "Test prompt",
-            "env_mode": "DEV",
-            "timestamp": "2024-01-01T00:00:00"
-        }
-        
-        with open(request_file, "w") as f:
-            json.dump(request_data, f)
-        
-        with patch("nexus_daemon.REQUEST_FILE", str(request_file)):
-            result = load_request()
-        
-        assert result is not None
-        assert result["prompt"] == "Test prompt"
-        assert result["env_mode"] == "DEV"
-    
-    def test_load_request_nonexistent(self, tmp_path):
-        """Test loading when file doesn't exist."""
-        from nexus_daemon import load_request
-        
-        request_file = tmp_path / "nonexistent.json"
-        
-        with patch("nexus_daemon.REQUEST_FILE", str(request_file)):
-            result = load_request()
-        
-        assert result is None
-    
-    def test_load_request_invalid_json(self, tmp_path):
-        """Test loading invalid JSON."""
-        from nexus_daemon import load_request
-        
-        request_file = tmp_path / "request.json"
-        
-        with open(request_file, "w") as f:
-            f.write("invalid json {")
-        
-        with patch("nexus_daemon.REQUEST_FILE", str(request_file)):
-            result = load_request()
-        
-        assert result is None
+    @pytest.mark.parametrize("contents,expected", [
+        (_REQUEST_JSON, ("Test prompt", "DEV")),
+        (b"invalid json {", None),
+        (None, None),
+    ], ids=["valid", "invalid_json", "nonexistent"])
+    def test_load_request(self, daemon_paths, contents, expected):
+        """Test loading a valid, invalid or missing request file."""
+        if contents is not None:
+            daemon_paths.request.write_bytes(contents)
+        
+        result = load_request()
+        
+        if expected is None:
+            assert result is None
+        else:
+            assert (result["prompt"], result["env_mode"]) == expected
 
 
 class TestArchiveRequest:
     """Test archive_request function."""
     
-    def test_archive_request(self, tmp_path):
+    def test_archive_request(self, daemon_paths):
         """Test archiving a request."""
-        from nexus_daemon import archive_request
-        
-        request_file = tmp_path / "request.json"
-        processed_file = tmp_path / "request.processed.json"
+        request_file = daemon_paths.request
+        processed_file = daemon_paths.processed
         
         # Create request file
-        request_data = {
-            "prompt": "Test prompt",
-            "env_mode": "DEV",
-            "timestamp": "2024-01-01T00:00:00"
-        }
-        
-        with open(request_file, "w") as f:
-            json.dump(request_data, f)
+        request_file.write_bytes(_REQUEST_JSON)
         
         # Archive it
-        with patch("nexus_daemon.REQUEST_FILE", str(request_file)), \
-             patch("nexus_daemon.PROCESSED_FILE", str(processed_file)):
-            archive_request(request_data)
+        archive_request(_REQUEST_DATA)
         
         # Check original is removed
         assert not request_file.exists()
         
         # Check processed file exists and contains data
         assert processed_file.exists()
-        with open(processed_file) as f:
-            processed_data = json.load(f)
+        processed_data = orjson.loads(processed_file.read_bytes())
         
-        assert processed_data["prompt"] == "Test prompt"
-        assert processed_data["env_mode"] == "DEV"
+        assert (processed_data["prompt"], processed_data["env_mode"]) == ("Test prompt", "DEV")
         assert "processed_at" in processed_data
 
 
 class TestInitializeStatus:
     """Test initialize_status function."""
     
-    def test_initialize_status(self, tmp_path):
+    def test_initialize_status(self, daemon_paths):
         """Test status initialization."""
-        from nexus_daemon import initialize_status
+        status_file = daemon_paths.status
         
-        status_file = tmp_path / "status.json"
-        
-        with patch("nexus_daemon.STATUS_FILE", str(status_file)):
-            initialize_status("Test prompt", "PROD")
+        initialize_status("Test prompt", "PROD")
         
         assert status_file.exists()
         
-        with open(status_file) as f:
-            status_data = json.load(f)
+        status_data = orjson.loads(status_file.read_bytes())
         
         assert status_data["current_status"] == "INITIALIZING"
         assert status_data["env_mode"] == "PROD"
         assert status_data["quality_score"] == 0
         assert status_data["feedback_loop_count"] == 0
         assert "Test prompt" in status_data["spec_excerpt"]
+
+
+class TestProcessRequest:
+    """Test process_request function."""
+    
+    @patch('nexus_daemon.build_nexus_factory')
+    def test_factory_is_built_once(self, mock_build, daemon_paths):
+        """Test that consecutive requests reuse one graph and its checkpointer."""
+        app = mock_build.return_value
+        app.checkpointer = None
+        app.invoke.return_value = {"current_status": "DONE", "env_mode": "DEV", "quality_score": 90}
+        get_factory.cache_clear()
+        try:
+            process_request(dict(_REQUEST_DATA))
+            process_request({**_REQUEST_DATA, "prompt": "Other prompt"})
+        finally:
+            get_factory.cache_clear()
+        
+        mock_build.assert_called_once_with()
+        assert app.invoke.call_count == 2
+    
+    @pytest.mark.parametrize("next_nodes,values,thread", [
+        (("council",), {"feedback_loop_count": 1}, "stable"),
+        ((), {"feedback_loop_count": 3}, "fresh"),
+        ((), {}, "stable"),
+    ], ids=["pending", "finished", "new"])
+    @patch('nexus_daemon.build_nexus_factory')
+    def test_only_pending_threads_resume(self, mock_build, daemon_paths, next_nodes, values, thread):
+        """Test that a finished thread is never continued by a new run."""
+        app = mock_build.return_value
+        app.get_state.return_value = SimpleNamespace(next=next_nodes, values=values)
+        app.invoke.return_value = {"current_status": "DONE", "env_mode": "DEV", "quality_score": 90}
+        get_factory.cache_clear()
+        try:
+            process_request(dict(_REQUEST_DATA))
+        finally:
+            get_factory.cache_clear()
+        
+        args, kwargs = app.invoke.call_args
+        is_stable = kwargs["config"]["configurable"]["thread_id"] == get_thread_id(_REQUEST_DATA)
+        assert (args[0] is None, is_stable) == (bool(next_nodes), thread == "stable")
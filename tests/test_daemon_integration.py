@@ -1,21 +1,22 @@
 """Integration test for the complete daemon workflow."""
 
-import json
-import time
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
-
+import orjson
 import pytest
 
+from nexus_daemon import archive_request, initialize_status, load_request
+
+
+def _read_all(paths):
+    """Parse every daemon file that currently exists, keyed by its role."""
+    return {
+        role: orjson.loads(path.read_bytes())
+        for role, path in vars(paths).items()
+        if path.exists()
+    }
+
 
-def test_daemon_workflow_integration(tmp_path):
+def test_daemon_workflow_integration(daemon_paths):
     """Test the complete daemon workflow with a mock request."""
-    # Setup temporary directory for files
-    request_file = tmp_path / "request.json"
-    processed_file = tmp_path / "request.processed.json"
-    status_file = tmp_path / "status.json"
-    
     # Create a test request
     request_data = {
         "prompt": "Create a simple Python calculator",
@@ -23,43 +24,30 @@ def test_daemon_workflow_integration(tmp_path):
         "timestamp": "2024-01-01T00:00:00"
     }
     
-    with open(request_file, "w") as f:
-        json.dump(request_data, f)
+    daemon_paths.request.write_bytes(orjson.dumps(request_data))
+    
+    # Step 1: Load request
+    loaded = load_request()
+    assert loaded is not None
+    assert (loaded["prompt"], loaded["env_mode"]) == ("Create a simple Python calculator", "DEV")
+    
+    # Step 2: Initialize status
+    initialize_status(loaded["prompt"], loaded["env_mode"])
+    
+    # Step 3: Archive request
+    archive_request(loaded)
+    
+    # Verify every file in one read-back (archiving leaves status untouched)
+    files = _read_all(daemon_paths)
+    assert files.keys() == {"processed", "status"}
+    
+    status = files["status"]
+    assert (status["current_status"], status["env_mode"]) == ("INITIALIZING", "DEV")
+    assert "calculator" in status["spec_excerpt"]
     
-    # Import daemon functions with patched paths
-    with patch("nexus_daemon.REQUEST_FILE", str(request_file)), \
-         patch("nexus_daemon.PROCESSED_FILE", str(processed_file)), \
-         patch("nexus_daemon.STATUS_FILE", str(status_file)):
-        
-        from nexus_daemon import load_request, archive_request, initialize_status
-        
-        # Step 1: Load request
-        loaded = load_request()
-        assert loaded is not None
-        assert loaded["prompt"] == "Create a simple Python calculator"
-        assert loaded["env_mode"] == "DEV"
-        
-        # Step 2: Initialize status
-        initialize_status(loaded["prompt"], loaded["env_mode"])
-        assert status_file.exists()
-        
-        with open(status_file) as f:
-            status = json.load(f)
-        
-        assert status["current_status"] == "INITIALIZING"
-        assert status["env_mode"] == "DEV"
-        assert "calculator" in status["spec_excerpt"]
-        
-        # Step 3: Archive request
-        archive_request(loaded)
-        assert not request_file.exists()
-        assert processed_file.exists()
-        
-        with open(processed_file) as f:
-            processed = json.load(f)
-        
-        assert processed["prompt"] == "Create a simple Python calculator"
-        assert "processed_at" in processed
+    processed = files["processed"]
+    assert processed["prompt"] == "Create a simple Python calculator"
+    assert "processed_at" in processed
 
 
 if __name__ == "__main__":
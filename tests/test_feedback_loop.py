@@ -2,62 +2,136 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+from contextlib import contextmanager
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
 
 from nexusprime.agents.dev_squad import DevSquadAgent
 from nexusprime.agents.council import CouncilAgent, ReviewerOpinion
 
 
+def _stub_router(result):
+    """Build a router stand-in whose call() records its kwargs and returns result."""
+    calls = []
+    
+    def call(**kwargs):
+        calls.append(kwargs)
+        return result
+    
+    return SimpleNamespace(call=call, calls=calls)
+
+
+class _MemoryFile(io.StringIO):
+    """Text buffer that stores its contents in the owning _MemoryFiles on close."""
+    
+    def __init__(self, files, path):
+        super().__init__()
+        self._files = files
+        self._path = path
+    
+    def close(self):
+        self._files[self._path] = self.getvalue()
+        super().close()
+
+
+class _MemoryFiles(dict):
+    """Dict-backed stand-in for open() in write mode, keyed by path."""
+    
+    def __call__(self, path, mode="r", *args, **kwargs):
+        return _MemoryFile(self, path)
+
+
+@contextmanager
+def mock_dev_squad(router):
+    """Patch Dev Squad's router, status, validation and file output in one go.
+    
+    The 'open' entry of the yielded dict maps each written path to its text.
+    """
+    files = _MemoryFiles()
+    with patch.multiple(
+        'nexusprime.agents.dev_squad',
+        get_llm_router=DEFAULT,
+        save_status_snapshot=DEFAULT,
+        validate_generated_code=DEFAULT,
+        open=files,
+        create=True,
+    ) as mocks, patch('nexusprime.agents.dev_squad.os.makedirs'):
+        mocks['get_llm_router'].return_value = router
+        mocks['validate_generated_code'].return_value = (True, [])
+        mocks['open'] = files
+        yield mocks
+
+
+@pytest.fixture(scope="module")
+def council_agent():
+    """One CouncilAgent shared by the pure formatting tests.
+    
+    mock_env_vars is function-scoped, so the environment is set with a
+    module-scoped MonkeyPatch here instead.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GOOGLE_API_KEY", "test_api_key")
+        mp.setenv("GITHUB_TOKEN", "test_github_token")
+        with patch('nexusprime.agents.council.NexusMemory'):
+            yield CouncilAgent()
+
+
+@pytest.fixture(scope="class")
+def dev_agent():
+    """One stateless DevSquadAgent shared within a test class."""
+    return DevSquadAgent()
+
+
+@pytest.fixture
+def make_opinion():
+    """Build ReviewerOpinion objects from Claude defaults plus overrides."""
+    def make(**overrides):
+        fields = {"reviewer": "Claude", "model": "claude-sonnet-4", "reasoning": "", "concerns": []}
+        fields.update(overrides)
+        return ReviewerOpinion(**fields)
+    
+    return make
+
+
 class TestDevSquadFeedbackIntegration:
     """Test cases for Dev Squad feedback integration."""
     
-    @patch('nexusprime.agents.dev_squad.get_llm_router')
-    @patch('nexusprime.agents.dev_squad.save_status_snapshot')
-    @patch('nexusprime.agents.dev_squad.validate_generated_code')
-    @patch('nexusprime.agents.dev_squad.os.makedirs')
-    @patch('nexusprime.agents.dev_squad.open', create=True)
-    def test_initial_generation(self, mock_open, mock_makedirs, mock_validate, mock_save, mock_get_router):
+    def test_initial_generation(self, dev_agent):
         """Test Dev Squad initial code generation without feedback."""
         # Mock LLM router response
-        mock_router = Mock()
-        mock_router.call.return_value = ("print('Hello')", {"total_token_count": 50})
-        mock_get_router.return_value = mock_router
-        mock_validate.return_value = (True, [])
+        mock_router = _stub_router(("print('Hello')", {"total_token_count": 50}))
         
-        agent = DevSquadAgent()
         state = {
             "spec_document": "Create a hello world program",
             "env_mode": "DEV",
             "total_tokens": {}
         }
         
-        result = agent.execute(state)
+        with mock_dev_squad(mock_router) as mocks:
+            result = dev_agent.execute(state)
         
         # Verify initial generation prompt was used
-        call_args = mock_router.call.call_args
-        prompt = call_args[1]['prompt']
+        prompt = mock_router.calls[-1]['prompt']
         assert "Write the complete Python code" in prompt
         assert "FEEDBACKS DU COUNCIL" not in prompt
         
         # Verify code is saved to state
         assert "previous_code" in result
         assert result["previous_code"] == "print('Hello')"
+        
+        # Verify the generated code was written out
+        (file_path,) = result["file_system_state"]
+        assert mocks['open'] == {file_path: "print('Hello')"}
     
-    @patch('nexusprime.agents.dev_squad.get_llm_router')
-    @patch('nexusprime.agents.dev_squad.save_status_snapshot')
-    @patch('nexusprime.agents.dev_squad.validate_generated_code')
-    @patch('nexusprime.agents.dev_squad.os.makedirs')
-    @patch('nexusprime.agents.dev_squad.open', create=True)
-    def test_revision_with_feedback(self, mock_open, mock_makedirs, mock_validate, mock_save, mock_get_router):
+    def test_revision_with_feedback(self, dev_agent):
         """Test Dev Squad revision with Council feedback."""
         # Mock LLM router response
-        mock_router = Mock()
-        mock_router.call.return_value = ("print('Hello, World!')", {"total_token_count": 60})
-        mock_get_router.return_value = mock_router
-        mock_validate.return_value = (True, [])
+        mock_router = _stub_router(("print('Hello, World!')", {"total_token_count": 60}))
         
-        agent = DevSquadAgent()
         state = {
             "spec_document": "Create a hello world program",
             "env_mode": "DEV",
@@ -66,11 +140,11 @@ class TestDevSquadFeedbackIntegration:
             "review_comments": "Add punctuation and improve message"
         }
         
-        result = agent.execute(state)
+        with mock_dev_squad(mock_router):
+            result = dev_agent.execute(state)
         
         # Verify revision prompt was used
-        call_args = mock_router.call.call_args
-        prompt = call_args[1]['prompt']
+        prompt = mock_router.calls[-1]['prompt']
         assert "FEEDBACKS DU COUNCIL" in prompt
         assert "CODE ACTUEL" in prompt
         assert "print('Hello')" in prompt
@@ -84,19 +158,15 @@ class TestDevSquadFeedbackIntegration:
 class TestCouncilFeedbackFormatting:
     """Test cases for Council feedback formatting."""
     
-    def test_format_concerns_for_dev_squad(self):
+    def test_format_concerns_for_dev_squad(self, council_agent, make_opinion):
         """Test formatting of concerns for Dev Squad."""
-        agent = CouncilAgent()
-        
         opinions = [
-            ReviewerOpinion(
-                reviewer="Claude",
-                model="claude-sonnet-4",
+            make_opinion(
                 score=75,
                 reasoning="Good but needs improvements",
                 concerns=["Missing error handling", "No tests"]
             ),
-            ReviewerOpinion(
+            make_opinion(
                 reviewer="Gemini",
                 model="gemini-2.5-pro",
                 score=80,
@@ -105,7 +175,7 @@ class TestCouncilFeedbackFormatting:
             ),
         ]
         
-        feedback = agent._format_concerns_for_dev_squad(opinions)
+        feedback = council_agent._format_concerns_for_dev_squad(opinions)
         
         assert "CONCERNS À CORRIGER" in feedback
         assert "Claude" in feedback
@@ -114,40 +184,99 @@ class TestCouncilFeedbackFormatting:
         assert "Gemini" in feedback
         assert "Documentation incomplete" in feedback
     
-    def test_format_concerns_no_issues(self):
+    def test_format_concerns_no_issues(self, council_agent, make_opinion):
         """Test formatting when there are no concerns."""
-        agent = CouncilAgent()
-        
         opinions = [
-            ReviewerOpinion(
-                reviewer="Claude",
-                model="claude-sonnet-4",
-                score=95,
-                reasoning="Excellent code",
-                concerns=[]
-            ),
+            make_opinion(score=95, reasoning="Excellent code"),
         ]
         
-        feedback = agent._format_concerns_for_dev_squad(opinions)
+        feedback = council_agent._format_concerns_for_dev_squad(opinions)
         
         assert "Aucun problème majeur" in feedback
 
 
+class TestCouncilReviewFanOut:
+    """Test cases for concurrent Council reviews."""
+    
+    @patch('nexusprime.agents.council.NexusMemory')
+    @patch('nexusprime.agents.council.get_llm_router')
+    def test_reviews_use_council_fanout(self, mock_get_router, mock_memory, mock_env_vars):
+        """Test that reviewers are queried in one fan-out and failures are isolated."""
+        mock_router = Mock()
+        mock_router.council_fanout = AsyncMock(return_value=[
+            ("SCORE: 80\nREASONING: Solid\nCONCERNS: None", {}),
+            RuntimeError("timeout"),
+            ("SCORE: 70\nREASONING: Fine\nCONCERNS: No tests", {}),
+        ])
+        mock_router.run_coroutine.side_effect = asyncio.run
+        mock_router.AGENT_MODEL_MAPPING = {}
+        mock_get_router.return_value = mock_router
+        
+        agent = CouncilAgent()
+        opinions = agent._gather_independent_reviews("Build a CLI", "print('hi')")
+        
+        mock_router.council_fanout.assert_awaited_once()
+        mock_router.run_coroutine.assert_called_once()
+        mock_router.call.assert_not_called()
+        assert [op.score for op in opinions] == [80, 50, 70]
+        assert opinions[1].model == "error"
+
+
+class TestCouncilReviewReuse:
+    """Test cases for reusing Council verdicts on unchanged code."""
+    
+    @patch('nexusprime.agents.council.NexusMemory')
+    @patch('nexusprime.agents.council.save_status_snapshot')
+    def test_only_identical_code_reuses_review(self, mock_snapshot, mock_memory, mock_env_vars):
+        """Test that re-submitted approved code skips the LLM review but any change is re-reviewed."""
+        agent = CouncilAgent()
+        agent._push_to_github = Mock()
+        opinion = ReviewerOpinion("Claude", "claude-sonnet-4", 90, "Solid", [])
+        agent._gather_independent_reviews = Mock(return_value=[opinion])
+        agent._arbitrate_reviews = Mock(return_value=(90, "Ship it", {"total_token_count": 10}))
+        
+        state = {"env_mode": "DEV", "spec_document": "Build a CLI", "previous_code": "print('v1')"}
+        state.update(agent.execute(state))
+        state.update(agent.execute(state))
+        assert agent._gather_independent_reviews.call_count == 1
+        assert state["quality_score"] == 90
+        assert state["reviewed_versions"][0].keys() >= {"digest", "quality_score"}
+        assert "embedding" not in state["reviewed_versions"][0]
+        
+        # A one-character change must not inherit the previous verdict
+        state.update(agent.execute({**state, "previous_code": "print('v1') "}))
+        assert agent._gather_independent_reviews.call_count == 2
+        assert len(state["reviewed_versions"]) == 2
+    
+    @patch('nexusprime.agents.council.NexusMemory')
+    @patch('nexusprime.agents.council.save_status_snapshot')
+    def test_rejected_code_is_reviewed_again(self, mock_snapshot, mock_memory, mock_env_vars):
+        """Test that two loops over unchanged rejected code both get a fresh review."""
+        agent = CouncilAgent()
+        opinion = ReviewerOpinion("Claude", "claude-sonnet-4", 50, "Weak", ["No tests"])
+        agent._gather_independent_reviews = Mock(return_value=[opinion])
+        agent._arbitrate_reviews = Mock(side_effect=[
+            (50, "Needs tests", {"total_token_count": 10}),
+            (80, "Acceptable now", {"total_token_count": 10}),
+        ])
+        agent._push_to_github = Mock()
+        
+        state = {"env_mode": "DEV", "spec_document": "Build a CLI", "previous_code": "print('v1')"}
+        state.update(agent.execute(state))
+        state.update(agent.execute(state))
+        
+        assert agent._gather_independent_reviews.call_count == 2
+        assert state["quality_score"] == 80
+        assert state["feedback_loop_count"] == 2
+
+
 class TestCouncilReportGeneration:
     """Test cases for Council report generation."""
     
-    def test_report_with_improvements_section(self):
+    def test_report_with_improvements_section(self, council_agent, make_opinion):
         """Test that report includes improvements section with history."""
-        agent = CouncilAgent()
-        
         opinions = [
-            ReviewerOpinion(
-                reviewer="Claude",
-                model="claude-sonnet-4",
-                score=85,
-                reasoning="Much improved",
-                concerns=[]
-            ),
+            make_opinion(score=85, reasoning="Much improved"),
         ]
         
         previous_reviews = [
@@ -160,27 +289,19 @@ class TestCouncilReportGeneration:
             }
         ]
         
-        report = agent._generate_report(opinions, 85, "Good progress", previous_reviews)
+        report = council_agent._generate_report(opinions, 85, "Good progress", previous_reviews)
         
         assert "AMÉLIORATIONS / CHANGEMENTS" in report
         assert "Claude: 75 → 85" in report
         assert "+10" in report
     
-    def test_report_without_history(self):
+    def test_report_without_history(self, council_agent, make_opinion):
         """Test that report works without previous reviews."""
-        agent = CouncilAgent()
-        
         opinions = [
-            ReviewerOpinion(
-                reviewer="Claude",
-                model="claude-sonnet-4",
-                score=85,
-                reasoning="Good work",
-                concerns=[]
-            ),
+            make_opinion(score=85, reasoning="Good work"),
         ]
         
-        report = agent._generate_report(opinions, 85, "Well done", None)
+        report = council_agent._generate_report(opinions, 85, "Well done", None)
         
         assert "COUNCIL MULTI-LLM REVIEW REPORT" in report
         assert "Claude" in report
@@ -0,0 +1,165 @@
+"""Tests for GitHub client caching."""
+
+from __future__ import annotations
+
+import pytest
+from github import GithubException
+from unittest.mock import Mock, patch
+
+from nexusprime.integrations.github_client import GitHubClient, git_blob_sha
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset the class-level caches between tests."""
+    GitHubClient._repo_cache.clear()
+    GitHubClient._file_sha_cache.clear()
+    yield
+    GitHubClient._repo_cache.clear()
+    GitHubClient._file_sha_cache.clear()
+
+
+class TestGitHubClient:
+    """Test cases for GitHubClient."""
+    
+    def test_git_blob_sha(self):
+        """Test that the blob SHA matches `git hash-object`."""
+        assert git_blob_sha("hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+    
+    @patch('nexusprime.integrations.github_client.Github')
+    def test_repo_lookup_is_cached(self, mock_github_class):
+        """Test that a repository is fetched once across client instances."""
+        mock_user = mock_github_class.return_value.get_user.return_value
+        
+        repo1 = GitHubClient(token="t").get_or_create_repo("workspace")
+        repo2 = GitHubClient(token="t").get_or_create_repo("workspace")
+        
+        assert repo1 is repo2
+        mock_user.get_repo.assert_called_once_with("workspace")
+    
+    @patch('nexusprime.integrations.github_client.Github')
+    def test_unchanged_file_is_not_rewritten(self, mock_github_class):
+        """Test that identical content skips the update and later lookups."""
+        client = GitHubClient(token="t")
+        repo = Mock(full_name="user/workspace")
+        repo.get_contents.return_value = Mock(path="app.py", sha="stale")
+        
+        client.create_or_update_file(repo, "app.py", "print('v1')", "Update")
+        client.create_or_update_file(repo, "app.py", "print('v1')", "Update")
+        
+        repo.update_file.assert_called_once()
+        repo.get_contents.assert_called_once()
+        
+        # Remote already holds the new content: no write
+        repo.get_contents.return_value = Mock(path="app.py", sha=git_blob_sha("print('v2')"))
+        client.create_or_update_file(repo, "app.py", "print('v2')", "Update")
+        repo.update_file.assert_called_once()
+    
+    @patch('nexusprime.integrations.github_client.time.monotonic')
+    @patch('nexusprime.integrations.github_client.Github')
+    def test_caches_expire(self, mock_github_class, mock_monotonic):
+        """Test that cached repositories and file SHAs are looked up again after their TTL."""
+        mock_monotonic.return_value = 1000.0
+        mock_user = mock_github_class.return_value.get_user.return_value
+        client = GitHubClient(token="t")
+        repo = Mock(full_name="user/workspace")
+        repo.get_contents.return_value = Mock(path="app.py", sha="stale")
+        
+        client.get_or_create_repo("workspace")
+        client.create_or_update_file(repo, "app.py", "print('v1')", "Update")
+        
+        # The file was edited remotely: once the SHA entry expires the push goes through
+        mock_monotonic.return_value += GitHubClient.FILE_SHA_CACHE_TTL
+        client.create_or_update_file(repo, "app.py", "print('v1')", "Update")
+        assert repo.update_file.call_count == 2
+        
+        mock_monotonic.return_value += GitHubClient.REPO_CACHE_TTL
+        client.get_or_create_repo("workspace")
+        assert mock_user.get_repo.call_count == 2
+    
+    @patch('nexusprime.integrations.github_client.Github')
+    def test_failed_push_forgets_cached_sha(self, mock_github_class):
+        """Test that a failed push drops the cached SHA instead of skipping the retry."""
+        client = GitHubClient(token="t")
+        repo = Mock(full_name="user/workspace", default_branch="main")
+        repo.create_git_commit.return_value = Mock(sha="abc1234def")
+        client.push_many(repo, {"a.py": "a"}, "Add a")
+        
+        # Remote file deleted meanwhile: the next write fails and must not be cached
+        repo.create_git_tree.side_effect = Exception("422")
+        with pytest.raises(Exception, match="422"):
+            client.push_many(repo, {"a.py": "a2"}, "Update a")
+        repo.get_contents.side_effect = Exception("404")
+        repo.create_file.side_effect = Exception("409")
+        with pytest.raises(Exception, match="409"):
+            client.create_or_update_file(repo, "a.py", "a", "Restore a")
+        
+        assert GitHubClient._file_sha_cache == {}
+    
+    @patch('nexusprime.integrations.github_client.Github')
+    def test_push_many_creates_one_commit(self, mock_github_class):
+        """Test that several files are pushed through a single tree and commit."""
+        client = GitHubClient(token="t")
+        repo = Mock(full_name="user/workspace", default_branch="main")
+        repo.create_git_commit.return_value = Mock(sha="abc1234def")
+        
+        sha = client.push_many(repo, {"a.py": "a", "b.py": "b"}, "Update files")
+        
+        assert sha == "abc1234def"
+        repo.get_git_ref.assert_called_once_with("heads/main")
+        elements = repo.create_git_tree.call_args[0][0]
+        assert len(elements) == 2
+        repo.get_git_ref.return_value.edit.assert_called_once_with("abc1234def")
+        
+        # Nothing changed since the last push
+        assert client.push_many(repo, {"a.py": "a"}, "Update files") is None
+        repo.create_git_commit.assert_called_once()
+    
+    @pytest.mark.parametrize("status,per_file", [(404, True), (409, True), (401, False), (403, False)])
+    @patch('nexusprime.integrations.github_client.Github')
+    def test_push_many_ref_errors(self, mock_github_class, status, per_file):
+        """Test that only an empty repository falls back to per-file commits."""
+        client = GitHubClient(token="t")
+        repo = Mock(full_name="user/workspace", default_branch="main")
+        repo.get_git_ref.side_effect = GithubException(status, {"message": "error"}, None)
+        
+        if per_file:
+            assert client.push_many(repo, {"a.py": "a"}, "Add a") is None
+        else:
+            with pytest.raises(GithubException):
+                client.push_many(repo, {"a.py": "a"}, "Add a")
+        
+        assert repo.get_contents.called == per_file
+    
+    @patch('nexusprime.integrations.github_client.InputGitTreeElement')
+    @patch('nexusprime.integrations.github_client.Github')
+    def test_push_local_files_uploads_blobs(self, mock_github_class, mock_element_class, temp_dir):
+        """Test that batched local files, UTF-8 or not, are pushed as base64 blobs."""
+        client = GitHubClient(token="t")
+        repo = Mock(full_name="user/workspace", default_branch="main")
+        repo.create_git_blob.return_value = Mock(sha="b" * 40)
+        repo.create_git_commit.return_value = Mock(sha="abc1234def")
+        path = temp_dir / "legacy.py"
+        path.write_bytes(b"# caf\xe9\n")
+        
+        client.push_local_files(repo, {"legacy.py": str(path)}, "Add legacy")
+        
+        repo.create_git_blob.assert_called_once_with("IyBjYWbpCg==", "base64")
+        mock_element_class.assert_called_once_with("legacy.py", "100644", "blob", sha="b" * 40)
+    
+    @patch('nexusprime.integrations.github_client.Github')
+    def test_push_local_file_sends_raw_bytes(self, mock_github_class, temp_dir):
+        """Test that local files are pushed as bytes without decoding."""
+        client = GitHubClient(token="t")
+        repo = Mock(full_name="user/workspace")
+        repo.get_contents.side_effect = Exception("404")
+        path = temp_dir / "app.py"
+        path.write_bytes("print('é')\n".encode("utf-8"))
+        empty = temp_dir / "empty.py"
+        empty.write_bytes(b"")
+        
+        client.push_local_file(repo, str(path), "app.py", "Add app")
+        client.push_local_file(repo, str(empty), "empty.py", "Add empty")
+        
+        assert repo.create_file.call_args_list[0][0][2] == "print('é')\n".encode("utf-8")
+        assert repo.create_file.call_args_list[1][0][2] == b""
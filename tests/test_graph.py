@@ -0,0 +1,47 @@
+"""Tests for graph construction and routing."""
+
+from __future__ import annotations
+
+import pytest
+from unittest.mock import Mock, patch
+
+from nexusprime.core import graph
+
+
+class TestBuildNexusFactory:
+    """Test cases for build_nexus_factory."""
+
+    def test_build_without_checkpointer(self, mock_env_vars):
+        """Test that the graph compiles without a checkpointer."""
+        app = graph.build_nexus_factory(use_checkpointer=False)
+        assert app.checkpointer is None
+
+    @pytest.mark.skipif(not graph.CHECKPOINT_AVAILABLE, reason="langgraph-checkpoint-sqlite not installed")
+    def test_build_with_sqlite_checkpointer(self, mock_env_vars, temp_dir):
+        """Test that the graph compiles with a SQLite checkpointer."""
+        checkpointer = graph.get_checkpointer(str(temp_dir / "checkpoints.db"))
+        app = graph.build_nexus_factory(checkpointer=checkpointer)
+        assert app.checkpointer is checkpointer
+
+        # A fresh thread has no pending nodes
+        config = {"configurable": {"thread_id": "test-thread"}}
+        assert app.get_state(config).next == ()
+
+
+class TestRouteCouncil:
+    """Test cases for route_council."""
+    
+    @patch('nexusprime.core.graph.get_settings')
+    def test_thresholds_per_env(self, mock_settings):
+        """Test approval thresholds and the loop safety exit."""
+        mock_settings.return_value = Mock(
+            max_feedback_loops=5,
+            dev_quality_threshold=75,
+            prod_quality_threshold=95
+        )
+        
+        assert graph.route_council({"env_mode": "DEV", "quality_score": 80}) == "approved"
+        assert graph.route_council({"env_mode": "PROD", "quality_score": 80}) == "rejected"
+        assert graph.route_council({"env_mode": "PROD", "quality_score": 96}) == "approved"
+        assert graph.route_council({"env_mode": "QA", "quality_score": 100}) == "rejected"
+        assert graph.route_council({"quality_score": 100, "feedback_loop_count": 6}) == "failed"
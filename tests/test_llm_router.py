@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import orjson
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from nexusprime.core.llm_router import (
     LLMProvider,
@@ -14,6 +20,55 @@ from nexusprime.core.llm_router import (
 )
 
 
+def _response(payload, status_code=200, headers=None):
+    """Build a minimal stand-in for an httpx.Response carrying a JSON payload."""
+    return SimpleNamespace(
+        status_code=status_code,
+        headers=headers or {},
+        content=orjson.dumps(payload),
+        raise_for_status=lambda: None,
+    )
+
+
+class _FakeClient:
+    """Minimal httpx.Client stand-in that replays canned responses in order.
+
+    The last response is returned again once the others are used up.
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def post(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+    def close(self):
+        pass
+
+    @property
+    def last(self):
+        """Positional and keyword arguments of the latest post()."""
+        return self.calls[-1]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def github_token():
+    """Expose a GitHub token to every router built in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GITHUB_TOKEN", "test_token")
+        yield
+
+
+@pytest.fixture(scope="class")
+def router():
+    """Build one router shared by the tests that only read its mapping."""
+    shared = GitHubModelsRouter()
+    yield shared
+    shared.close()
+
+
 class TestLLMProvider:
     """Test cases for LLMProvider enum."""
     
@@ -57,12 +112,8 @@ class TestLLMConfig:
 class TestGitHubModelsRouter:
     """Test cases for GitHubModelsRouter."""
     
-    def test_agent_model_mapping(self):
+    def test_agent_model_mapping(self, router):
         """Test that agent model mapping is correct."""
-        # Test with a mock token to avoid environment dependency
-        with patch('nexusprime.core.llm_router.get_required_env', return_value='mock_token'):
-            router = GitHubModelsRouter()
-        
         # Check product_owner mapping
         po_config = router.AGENT_MODEL_MAP["product_owner"]
         assert po_config.provider == LLMProvider.CLAUDE_SONNET_4
@@ -95,78 +146,90 @@ class TestGitHubModelsRouter:
         assert council_claude.provider == LLMProvider.CLAUDE_SONNET_4
         assert council_claude.temperature == 0.4
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
+    @pytest.mark.parametrize("agent_name,custom_config,body,expected_content,expected_usage,expected_payload", [
+        (
+            "product_owner",
+            None,
+            {
+                "content": [{"text": "Test response from Claude"}],
+                "usage": {"input_tokens": 15, "output_tokens": 25}
+            },
+            "Test response from Claude",
+            {"prompt_tokens": 15, "completion_tokens": 25, "total_token_count": 40},
+            {"model": "claude-sonnet-4-20250514", "temperature": 0.3},
+        ),
+        (
+            "council_grok",
+            None,
+            {
+                "choices": [{"message": {"content": "Test response from Grok"}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30}
+            },
+            "Test response from Grok",
+            {"prompt_tokens": 10, "completion_tokens": 20, "total_token_count": 30},
+            {"model": "azureml-xai/grok-3", "temperature": 0.4},
+        ),
+        (
+            "unknown_agent",
+            LLMConfig(provider=LLMProvider.GPT_5, temperature=0.8, max_tokens=1000),
+            {
+                "choices": [{"message": {"content": "Custom response"}}],
+                "usage": {"total_tokens": 50}
+            },
+            "Custom response",
+            {"prompt_tokens": 0, "completion_tokens": 0, "total_token_count": 50},
+            {"model": "azure-openai/gpt-5", "temperature": 0.8, "max_tokens": 1000},
+        ),
+    ], ids=["anthropic", "github_models", "custom_config"])
     @patch('nexusprime.core.llm_router.httpx.Client')
-    def test_call_anthropic(self, mock_client_class, mock_env):
-        """Test successful Anthropic API call."""
-        # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "content": [
-                {
-                    "text": "Test response from Claude"
-                }
-            ],
-            "usage": {
-                "input_tokens": 15,
-                "output_tokens": 25
-            }
-        }
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.return_value = mock_response
+    def test_call(self, mock_client_class, agent_name, custom_config, body,
+                  expected_content, expected_usage, expected_payload):
+        """Test successful calls per provider and with a custom configuration."""
+        mock_client_instance = _FakeClient(_response(body))
         mock_client_class.return_value = mock_client_instance
         
         with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test_anthropic_key'}):
             router = GitHubModelsRouter()
             content, usage = router.call(
                 prompt="Test prompt",
-                agent_name="product_owner"
+                agent_name=agent_name,
+                custom_config=custom_config
             )
         
-        assert content == "Test response from Claude"
-        assert usage["prompt_tokens"] == 15
-        assert usage["completion_tokens"] == 25
-        assert usage["total_token_count"] == 40
+        assert content == expected_content
+        assert usage == expected_usage
+        
+        # Verify the request was built from the agent (or custom) configuration
+        payload = orjson.loads(mock_client_instance.last[1]['content'])
+        assert {key: payload[key] for key in expected_payload} == expected_payload
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
+    @patch('nexusprime.core.llm_router.time.sleep')
     @patch('nexusprime.core.llm_router.httpx.Client')
-    def test_call_github_models(self, mock_client_class, mock_env):
-        """Test successful GitHub Models API call."""
-        # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": "Test response from Grok"
-                    }
-                }
-            ],
-            "usage": {
-                "prompt_tokens": 10,
-                "completion_tokens": 20,
-                "total_tokens": 30
-            }
-        }
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.post.return_value = mock_response
+    def test_call_retries_rate_limit(self, mock_client_class, mock_sleep):
+        """Test that a 429 is retried after the Retry-After delay."""
+        rate_limited = _response({}, status_code=429, headers={"Retry-After": "2"})
+        ok = _response({
+            "choices": [{"message": {"content": "Recovered"}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        })
+        mock_client_instance = _FakeClient(rate_limited, ok)
         mock_client_class.return_value = mock_client_instance
         
         router = GitHubModelsRouter()
-        content, usage = router.call(
-            prompt="Test prompt",
-            agent_name="council_grok"
-        )
+        content, _ = router.call(prompt="Test prompt", agent_name="council_grok")
+        
+        assert content == "Recovered"
+        assert len(mock_client_instance.calls) == 2
+        mock_sleep.assert_called_once_with(2.0)
+    
+    def test_retry_delay_backoff_is_capped(self):
+        """Test exponential backoff without Retry-After stays within the cap."""
+        response = SimpleNamespace(headers={})
         
-        assert content == "Test response from Grok"
-        assert usage["prompt_tokens"] == 10
-        assert usage["completion_tokens"] == 20
-        assert usage["total_token_count"] == 30
+        assert 1.0 <= GitHubModelsRouter._retry_delay(response, 0) <= 2.0
+        assert GitHubModelsRouter._retry_delay(response, 10) == GitHubModelsRouter.RETRY_MAX_DELAY
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
-    def test_call_google_without_api_key(self, mock_env):
+    def test_call_google_without_api_key(self):
         """Test that Google API call fails without API key."""
         router = GitHubModelsRouter()
         
@@ -176,8 +239,7 @@ class TestGitHubModelsRouter:
                 agent_name="tech_lead"
             )
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
-    def test_call_anthropic_without_api_key(self, mock_env):
+    def test_call_anthropic_without_api_key(self):
         """Test that Anthropic API call fails without API key."""
         router = GitHubModelsRouter()
         
@@ -187,47 +249,246 @@ class TestGitHubModelsRouter:
                 agent_name="product_owner"
             )
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
     @patch('nexusprime.core.llm_router.httpx.Client')
-    def test_call_with_custom_config(self, mock_client_class, mock_env):
-        """Test LLM call with custom configuration."""
-        # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Custom response"}}],
-            "usage": {"total_tokens": 50}
-        }
-        
+    def test_anthropic_key_set_after_init(self, mock_client_class):
+        """Test that an Anthropic key exported after init is picked up."""
+        mock_client_instance = _FakeClient(_response({
+            "content": [{"text": "Late key"}],
+            "usage": {"input_tokens": 1, "output_tokens": 1}
+        }))
+        mock_client_class.return_value = mock_client_instance
+
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'test_token'}, clear=True):
+            router = GitHubModelsRouter()
+
+        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'late_key'}):
+            content, _ = router.call(prompt="Test prompt", agent_name="dev_squad")
+
+        assert content == "Late key"
+        headers = mock_client_instance.last[1]['headers']
+        assert headers["x-api-key"] == "late_key"
+
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_stream_anthropic_deltas(self, mock_client_class):
+        """Test SSE parsing when events are split across network chunks."""
+        body = (
+            b'event: message_start\ndata: {"type":"message_start","message":{"usage":{"input_tokens":7}}}\n\n'
+            b'event: content_block_delta\ndata: {"type":"content_block_delta","delta":{"text":"Hel"}}\n\n'
+            b'event: content_block_delta\ndata: {"type":"content_block_delta","delta":{"text":"lo \xc3\xa9"}}\n\n'
+            b'event: message_delta\ndata: {"type":"message_delta","usage":{"output_tokens":3}}\n\n'
+            b'event: message_stop\ndata: {"type":"message_stop"}\n\n'
+        )
+        mock_response = MagicMock()
+        mock_response.iter_bytes.return_value = [body[i:i + 13] for i in range(0, len(body), 13)]
+
+        mock_client_instance = MagicMock()
+        mock_client_instance.stream.return_value.__enter__.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test_anthropic_key'}):
+            router = GitHubModelsRouter()
+            usage = {}
+            chunks = list(router.stream(prompt="Test prompt", agent_name="dev_squad", usage=usage))
+
+        assert chunks == ["Hel", "lo é"]
+        assert usage == {"prompt_tokens": 7, "completion_tokens": 3, "total_token_count": 10}
+        payload = orjson.loads(mock_client_instance.stream.call_args[1]['content'])
+        assert payload['stream'] is True
+
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_stream_github_models_deltas(self, mock_client_class):
+        """Test OpenAI-style SSE parsing for GitHub Models, including [DONE]."""
+        body = (
+            b'data: {"choices":[{"delta":{"role":"assistant"}}]}\n\n'
+            b'data: {"choices":[{"delta":{"content":"Bon"}}]}\n\n'
+            b'data: {"choices":[{"delta":{"content":"jour"}}]}\n\n'
+            b'data: {"choices":[],"usage":{"prompt_tokens":5,"completion_tokens":2,"total_tokens":7}}\n\n'
+            b'data: [DONE]\n\n'
+        )
+        mock_response = MagicMock()
+        mock_response.iter_bytes.return_value = [body[i:i + 11] for i in range(0, len(body), 11)]
+
         mock_client_instance = MagicMock()
-        mock_client_instance.post.return_value = mock_response
+        mock_client_instance.stream.return_value.__enter__.return_value = mock_response
         mock_client_class.return_value = mock_client_instance
+
+        router = GitHubModelsRouter()
+        usage = {}
+        chunks = list(router.stream(prompt="Test prompt", agent_name="council_gpt", usage=usage))
+
+        assert chunks == ["Bon", "jour"]
+        assert usage == {"prompt_tokens": 5, "completion_tokens": 2, "total_token_count": 7}
+        payload = orjson.loads(mock_client_instance.stream.call_args[1]['content'])
+        assert payload['stream'] is True
+        assert payload['stream_options'] == {"include_usage": True}
+
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_low_temperature_calls_are_cached(self, mock_client_class):
+        """Test that identical low-temperature calls hit the network once."""
+        mock_client_instance = _FakeClient(_response({
+            "choices": [{"message": {"content": "Cached response"}}],
+            "usage": {"prompt_tokens": 4, "completion_tokens": 6, "total_tokens": 10}
+        }))
+        mock_client_class.return_value = mock_client_instance
+
+        router = GitHubModelsRouter()
+        low_temp = LLMConfig(provider=LLMProvider.GPT_5, temperature=0.1)
+        high_temp = LLMConfig(provider=LLMProvider.GPT_5, temperature=0.7)
+
+        first = router.call(prompt="Same prompt", agent_name="x", custom_config=low_temp)
+        second = router.call(prompt="Same prompt", agent_name="x", custom_config=low_temp)
+        router.call(prompt="Same prompt", agent_name="x", custom_config=high_temp)
+        router.call(prompt="Same prompt", agent_name="x", custom_config=high_temp)
+
+        assert first[0] == second[0] == "Cached response"
+        assert second[1]["total_token_count"] == 0
+        assert len(mock_client_instance.calls) == 3
+        assert router.cache_stats == {"hits": 1, "misses": 1}
+
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_uncached_calls_always_hit_the_network(self, mock_client_class):
+        """Test that cache=False bypasses the cache even at low temperature."""
+        mock_client_instance = _FakeClient(_response({
+            "choices": [{"message": {"content": "Fresh response"}}],
+            "usage": {"total_tokens": 10}
+        }))
+        mock_client_class.return_value = mock_client_instance
+
+        router = GitHubModelsRouter()
+        low_temp = LLMConfig(provider=LLMProvider.GPT_5, temperature=0.1)
+
+        for _ in range(2):
+            router.call(prompt="Same prompt", agent_name="x", custom_config=low_temp, cache=False)
+
+        assert len(mock_client_instance.calls) == 2
+        assert router.cache_stats == {"hits": 0, "misses": 0}
+        assert not router._cache
+
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_concurrent_identical_calls_are_coalesced(self, mock_client_class):
+        """Test that a second identical call waits for the in-flight request."""
+        release = threading.Event()
+        mock_response = _response({
+            "choices": [{"message": {"content": "Shared response"}}],
+            "usage": {"total_tokens": 10}
+        })
+
+        def slow_post(*args, **kwargs):
+            release.wait(timeout=5)
+            return mock_response
+
+        mock_client_instance = MagicMock()
+        mock_client_instance.post.side_effect = slow_post
+        mock_client_class.return_value = mock_client_instance
+
+        router = GitHubModelsRouter()
+        config = LLMConfig(provider=LLMProvider.GPT_5, temperature=0.1)
+        results = []
+
+        def worker():
+            results.append(router.call(prompt="Same prompt", agent_name="x", custom_config=config))
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        threads[0].start()
+        while not router._inflight:
+            time.sleep(0.001)
+        threads[1].start()
+        while router.cache_stats["hits"] == 0:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert [content for content, _ in results] == ["Shared response", "Shared response"]
+        assert mock_client_instance.post.call_count == 1
+        assert not router._inflight
+
+    @patch('nexusprime.core.llm_router.httpx.AsyncClient')
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_council_fanout(self, mock_client_class, mock_async_client_class):
+        """Test that council reviewers are queried through the async client."""
+        mock_response = _response({
+            "choices": [{"message": {"content": "SCORE: 80"}}],
+            "usage": {"total_tokens": 12}
+        })
+        mock_async_client = MagicMock()
+        mock_async_client.post = AsyncMock(return_value=mock_response)
+        mock_async_client_class.return_value = mock_async_client
+
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'test_token'}, clear=True):
+            router = GitHubModelsRouter()
+            results = asyncio.run(router.council_fanout(
+                "Review this", "Be strict", agent_names=("council_gpt", "council_grok", "council_claude")
+            ))
+
+        assert results[0] == ("SCORE: 80", {"prompt_tokens": 0, "completion_tokens": 0, "total_token_count": 12})
+        assert results[1][0] == "SCORE: 80"
+        # Missing Anthropic key surfaces as a per-reviewer exception
+        assert isinstance(results[2], ValueError)
+        assert mock_async_client.post.await_count == 2
+
+    @patch('nexusprime.core.llm_router.httpx.AsyncClient')
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_fanout_rounds_share_one_async_client(self, mock_client_class, mock_async_client_class):
+        """Test that fan-outs on the router loop reuse one async client, closed by close()."""
+        mock_async_client = MagicMock()
+        mock_async_client.post = AsyncMock(return_value=_response({
+            "choices": [{"message": {"content": "SCORE: 80"}}],
+            "usage": {"total_tokens": 12}
+        }))
+        mock_async_client.aclose = AsyncMock()
+        mock_async_client_class.return_value = mock_async_client
         
         router = GitHubModelsRouter()
-        custom_config = LLMConfig(
-            provider=LLMProvider.GPT_5,
-            temperature=0.8,
-            max_tokens=1000
-        )
+        for _ in range(2):
+            results = router.run_coroutine(router.council_fanout(
+                "Review this", "Be strict", agent_names=("council_gpt", "council_grok")
+            ))
+            assert [content for content, _ in results] == ["SCORE: 80", "SCORE: 80"]
+        router.close()
         
-        content, usage = router.call(
-            prompt="Custom test",
-            agent_name="unknown_agent",
-            custom_config=custom_config
-        )
+        assert mock_async_client_class.call_count == 1
+        assert mock_async_client.post.await_count == 4
+        mock_async_client.aclose.assert_awaited_once()
+    
+    @patch('nexusprime.core.llm_router.httpx.AsyncClient')
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_async_client_closed_when_loop_changes(self, mock_client_class, mock_async_client_class):
+        """Test that the async client of a previous event loop is closed, not leaked."""
+        clients = [MagicMock(aclose=AsyncMock()), MagicMock(aclose=AsyncMock())]
+        mock_async_client_class.side_effect = clients
+        router = GitHubModelsRouter()
         
-        assert content == "Custom response"
+        async def bind():
+            router._get_async_client()
+            await asyncio.sleep(0)
         
-        # Verify the request was made with custom config
-        call_args = mock_client_instance.post.call_args
-        payload = call_args[1]['json']
-        assert payload['model'] == "azure-openai/gpt-5"
-        assert payload['temperature'] == 0.8
-        assert payload['max_tokens'] == 1000
+        asyncio.run(bind())
+        asyncio.run(bind())
+        
+        clients[0].aclose.assert_awaited_once()
+        clients[1].aclose.assert_not_awaited()
+        assert router._aclient is clients[1]
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
-    def test_list_available_models(self, mock_env):
+    @patch('nexusprime.core.llm_router.httpx.Client')
+    def test_prewarm_opens_connections(self, mock_client_class):
+        """Test that prewarming issues background HEAD requests to the API hosts."""
+        mock_client_instance = MagicMock()
+        mock_client_class.return_value = mock_client_instance
+
+        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test_anthropic_key'}):
+            router = GitHubModelsRouter(prewarm=True)
+
+        deadline = time.monotonic() + 5
+        urls = set()
+        while len(urls) < 2 and time.monotonic() < deadline:
+            urls = {call[0][0] for call in mock_client_instance.head.call_args_list}
+            time.sleep(0.001)
+
+        assert urls == {router.GITHUB_MODELS_URL, router.ANTHROPIC_API_URL}
+
+    def test_list_available_models(self, router):
         """Test listing available models."""
-        router = GitHubModelsRouter()
         models = router.list_available_models()
         
         assert "claude-sonnet-4-20250514" in models
@@ -235,16 +496,18 @@ class TestGitHubModelsRouter:
         assert "azureml-xai/grok-3" in models
         assert "azure-openai/gpt-5" in models
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
-    def test_get_model_for_agent(self, mock_env):
+    def test_get_model_for_agent(self, router):
         """Test getting model for specific agent."""
-        router = GitHubModelsRouter()
-        
         assert router.get_model_for_agent("product_owner") == "claude-sonnet-4-20250514"
         assert router.get_model_for_agent("tech_lead") == "gemini-3-pro-preview"
         assert router.get_model_for_agent("council_gpt") == "azure-openai/gpt-5"
         assert router.get_model_for_agent("council_grok") == "azureml-xai/grok-3"
         assert router.get_model_for_agent("unknown") == "claude-sonnet-4-20250514"
+    
+    def test_agent_model_map_is_read_only(self, router):
+        """Test that the agent mapping cannot drift from the compiled plans."""
+        with pytest.raises(TypeError):
+            router.AGENT_MODEL_MAP["dev_squad"] = LLMConfig(LLMProvider.GPT_5)
 
 
 class TestCopilotLLMRouterAlias:
@@ -258,26 +521,34 @@ class TestCopilotLLMRouterAlias:
 class TestGetLLMRouter:
     """Test cases for get_llm_router singleton."""
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
-    def test_singleton_behavior(self, mock_env):
+    @pytest.fixture(autouse=True)
+    def no_prewarm(self):
+        """Keep the singleton's TLS pre-warm off the network and close it afterwards."""
+        get_llm_router.cache_clear()
+        with patch.object(GitHubModelsRouter, '_start_prewarm') as mock_prewarm:
+            yield mock_prewarm
+        get_llm_router.cache_clear()
+    
+    def test_singleton_behavior(self, no_prewarm):
         """Test that get_llm_router returns the same instance."""
-        # Clear singleton for test
-        import nexusprime.core.llm_router as router_module
-        router_module._router_instance = None
-        
         router1 = get_llm_router()
         router2 = get_llm_router()
         
         assert router1 is router2
         assert isinstance(router1, GitHubModelsRouter)
+        no_prewarm.assert_called_once_with()
     
-    @patch('nexusprime.core.llm_router.get_required_env', return_value='test_token')
-    def test_singleton_is_github_models_router(self, mock_env):
-        """Test that singleton is a GitHubModelsRouter instance."""
-        # Clear singleton for test
-        import nexusprime.core.llm_router as router_module
-        router_module._router_instance = None
+    def test_cache_clear_closes_router(self):
+        """Test that clearing the singleton closes the previous instance."""
+        router = get_llm_router()
+        with patch.object(router, 'close') as mock_close:
+            get_llm_router.cache_clear()
         
+        mock_close.assert_called_once_with()
+        assert get_llm_router() is not router
+    
+    def test_singleton_is_github_models_router(self):
+        """Test that singleton is a GitHubModelsRouter instance."""
         router = get_llm_router()
         assert isinstance(router, GitHubModelsRouter)
         assert hasattr(router, 'AGENT_MODEL_MAP')
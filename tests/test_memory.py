@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
+
+import numpy
 import pytest
+from unittest.mock import patch
 
-from nexusprime.integrations.memory import NexusMemory
+from nexusprime.integrations.memory import NexusMemory, read_lessons
 
 
 class TestNexusMemory:
@@ -67,6 +71,20 @@ class TestNexusMemory:
         result = memory.retrieve_context("completely different topic")
         assert "No prior lessons found" in result
     
+    def test_keyword_index_ranking(self, temp_memory_file):
+        """Test keyword ranking by match count, ignoring punctuation and deleted lessons."""
+        memory = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        memory.store_lesson("Caching", "redis, ttl", "Success", "Use a TTL")
+        memory.store_lesson("Redis caching", "ttl eviction", "Success", "Use LRU")
+        deleted_id = memory.store_lesson("Redis", "cluster", "Failure", "Avoid cluster mode")
+        memory.delete_lesson(deleted_id)
+        
+        reloaded = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        for mem in (memory, reloaded):
+            result = mem.retrieve_context("Redis TTL eviction?", top_k=2)
+            assert result.index("Use LRU") < result.index("Use a TTL")
+            assert "Avoid cluster mode" not in result
+    
     def test_delete_lesson(self, temp_memory_file):
         """Test deleting a lesson."""
         memory = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
@@ -112,6 +130,69 @@ class TestNexusMemory:
         lessons = memory.list_lessons(limit=2)
         assert len(lessons) == 2
     
+    def test_delete_persists_as_tombstone(self, temp_memory_file):
+        """Test that deleted lessons stay deleted after reload."""
+        memory1 = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        kept_id = memory1.store_lesson("Kept", "Context", "Success", "Solution")
+        deleted_id = memory1.store_lesson("Deleted", "Context", "Success", "Solution")
+        memory1.delete_lesson(deleted_id)
+        
+        memory2 = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        assert [l["id"] for l in memory2.data["lessons"]] == [kept_id]
+        
+        # Rows stay aligned for lessons appended after a reload
+        new_id = memory2.store_lesson("New", "Context", "Success", "Solution")
+        memory3 = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        assert [l["id"] for l in memory3.data["lessons"]] == [kept_id, new_id]
+    
+    def test_concurrent_instances_share_rows(self, temp_memory_file):
+        """Test that two instances on the same files append and delete at the right rows."""
+        memory1 = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        memory2 = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        first_id = memory1.store_lesson("First", "Context", "Success", "Solution")
+        second_id = memory2.store_lesson("Second", "Context", "Success", "Solution")
+        memory2.delete_lesson(second_id)
+        
+        assert [l["id"] for l in read_lessons(temp_memory_file)] == [first_id]
+        
+        # A torn last line stays its own (skipped) row instead of swallowing the next lesson
+        with open(memory1.lessons_path, "ab") as f:
+            f.write(b'{"id": "torn')
+        third_id = memory1.store_lesson("Third", "Context", "Success", "Solution")
+        
+        assert [l["id"] for l in read_lessons(temp_memory_file)] == [first_id, third_id]
+    
+    def test_migrates_legacy_json(self, temp_memory_file):
+        """Test that a legacy JSON memory file is converted to JSONL."""
+        with open(temp_memory_file, "w", encoding="utf-8") as f:
+            json.dump({"lessons": [{
+                "id": "legacy-1", "topic": "Legacy", "context": "Old format",
+                "outcome": "Success", "solution": "Migrate", "timestamp": "2024-01-01T00:00:00"
+            }]}, f)
+        
+        memory = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        assert memory.data["lessons"][0]["id"] == "legacy-1"
+        assert os.path.exists(memory.lessons_path)
+        
+        reloaded = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        assert reloaded.data["lessons"][0]["topic"] == "Legacy"
+    
+    def test_read_lessons_after_migration(self, temp_memory_file):
+        """Test that read-only readers see lessons stored after migration."""
+        with open(temp_memory_file, "w", encoding="utf-8") as f:
+            json.dump({"lessons": [{
+                "id": "legacy-1", "topic": "Legacy", "context": "Old format",
+                "outcome": "Success", "solution": "Migrate", "timestamp": "2024-01-01T00:00:00"
+            }]}, f)
+        assert [l["id"] for l in read_lessons(temp_memory_file)] == ["legacy-1"]
+        
+        memory = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        new_id = memory.store_lesson("New", "After migration", "Success", "Read the JSONL")
+        deleted_id = memory.store_lesson("Deleted", "Context", "Success", "Solution")
+        memory.delete_lesson(deleted_id)
+        
+        assert [l["id"] for l in read_lessons(temp_memory_file)] == ["legacy-1", new_id]
+    
     def test_persistence(self, temp_memory_file):
         """Test that lessons are persisted to disk."""
         memory1 = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
@@ -121,3 +202,103 @@ class TestNexusMemory:
         memory2 = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
         assert len(memory2.data["lessons"]) == 1
         assert memory2.data["lessons"][0]["topic"] == "Topic"
+
+
+class _FakeEncoder:
+    """Deterministic stand-in for SentenceTransformer."""
+    
+    VOCAB = ["python", "testing", "docker", "deploy"]
+    
+    def encode(self, text, **kwargs):
+        if isinstance(text, list):
+            return numpy.array([self._vector(t) for t in text])
+        return self._vector(text)
+    
+    def _vector(self, text):
+        words = text.lower().split()
+        return numpy.array([float(sum(w.startswith(v) for w in words)) + 0.01 for v in self.VOCAB])
+
+
+class TestNexusMemoryEmbeddings:
+    """Test cases for embedding-based retrieval."""
+    
+    @patch('nexusprime.integrations.memory.np', numpy, create=True)
+    def test_retrieve_ranks_by_cosine_similarity(self, temp_memory_file):
+        """Test that retrieval returns the most similar lessons first."""
+        memory = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        memory.use_embeddings = True
+        memory.model = _FakeEncoder()
+        
+        memory.store_lesson("Docker", "deploy containers", "Success", "Use compose")
+        python_id = memory.store_lesson("Python", "testing units", "Success", "Use pytest")
+        memory.store_lesson("Deploy", "docker deploy", "Success", "Use k8s")
+        
+        result = memory.retrieve_context("python testing", top_k=2)
+        lines = result.splitlines()[1:]
+        assert len(lines) == 2
+        assert "Use pytest" in lines[0]
+        
+        # Deleted lessons drop out of the similarity index
+        memory.delete_lesson(python_id)
+        assert memory._emb_matrix.shape == (2, 4)
+        assert "Use pytest" not in memory.retrieve_context("python testing", top_k=2)
+    
+    @patch('nexusprime.integrations.memory.INT8_INDEX_MIN_ROWS', 4)
+    @patch('nexusprime.integrations.memory.np', numpy, create=True)
+    def test_retrieve_with_int8_index(self, temp_memory_file):
+        """Test that the int8 shortlist keeps the float32 ranking and scores."""
+        memory = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        memory.use_embeddings = True
+        memory.model = _FakeEncoder()
+        
+        for i in range(8):
+            memory.store_lesson(f"Docker {i}", "deploy containers", "Success", f"Use compose {i}")
+        memory.store_lesson("Python", "testing units", "Success", "Use pytest")
+        
+        result = memory.retrieve_context("python testing", top_k=1)
+        assert memory._emb_matrix_q.dtype == numpy.int8
+        assert memory._emb_matrix_q.shape == memory._emb_matrix.shape
+        assert "Use pytest" in result
+        assert "(similarity: 1.00)" in result
+        
+        # New lessons are appended to the existing int8 index
+        memory.store_lesson("Rust", "borrow checker", "Success", "Use clippy")
+        assert memory._emb_matrix_q.shape == memory._emb_matrix.shape
+    
+    @patch('nexusprime.integrations.memory.np', numpy, create=True)
+    def test_store_lessons_bulk(self, temp_memory_file):
+        """Test that bulk storage embeds in one batch and saves once."""
+        memory = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        memory.use_embeddings = True
+        memory.model = _FakeEncoder()
+        
+        with patch.object(memory.model, 'encode', wraps=memory.model.encode) as mock_encode, \
+                patch.object(memory, '_append_lessons', wraps=memory._append_lessons) as mock_append:
+            ids = memory.store_lessons_bulk([
+                {"topic": "Python", "context": "testing", "outcome": "Success", "solution": "Use pytest"},
+                {"topic": "Docker", "context": "deploy", "outcome": "Success", "solution": "Use compose"},
+            ])
+        
+        assert len(ids) == 2
+        assert mock_encode.call_count == 1
+        mock_append.assert_called_once()
+        assert memory._emb_matrix.shape == (2, 4)
+        assert "Use pytest" in memory.retrieve_context("python testing", top_k=1)
+    
+    @patch('nexusprime.integrations.memory.np', numpy, create=True)
+    def test_embeddings_persist_in_npy(self, temp_memory_file):
+        """Test that embeddings are reloaded from the memory-mapped matrix."""
+        memory = NexusMemory(memory_path=temp_memory_file, use_embeddings=False)
+        memory.use_embeddings = True
+        memory.model = _FakeEncoder()
+        for topic in ("Docker", "Python", "Deploy"):
+            memory.store_lesson(topic, "context", "Success", f"About {topic}")
+        
+        with patch('nexusprime.integrations.memory.EMBEDDINGS_AVAILABLE', True), \
+                patch('nexusprime.integrations.memory._load_embedding_model', return_value=_FakeEncoder()):
+            reloaded = NexusMemory(memory_path=temp_memory_file, use_embeddings=True)
+        
+        # Capacity grows in powers of two
+        assert reloaded._embeddings.shape == (4, 4)
+        assert reloaded._emb_matrix.shape == (3, 4)
+        assert "About Python" in reloaded.retrieve_context("python", top_k=1)
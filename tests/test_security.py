@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 import pytest
 
 from nexusprime.utils.security import get_required_env, validate_generated_code
@@ -96,3 +95,12 @@ eval('1 + 1')
         is_safe, warnings = validate_generated_code(code)
         assert is_safe is False
         assert any("write/append mode" in w or "File writing" in w for w in warnings)
+    
+    def test_overlapping_patterns(self):
+        """Test that a pattern nested inside another match is still reported."""
+        code = "open(eval(\"w.txt\"), 'w')"
+        is_safe, warnings = validate_generated_code(code)
+        assert is_safe is False
+        assert len(warnings) == 2
+        assert "eval" in warnings[0]
+        assert "File writing" in warnings[1]
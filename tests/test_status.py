@@ -0,0 +1,102 @@
+"""Tests for status snapshot utilities."""
+
+from __future__ import annotations
+
+import json
+import os
+from unittest.mock import patch
+
+from nexusprime.utils import status
+from nexusprime.utils.tokens import TokenUsage
+
+
+class TestSaveStatusSnapshot:
+    """Test cases for debounced status snapshots."""
+    
+    def test_snapshots_are_coalesced(self, temp_status_file):
+        """Test that rapid updates produce a single write of the latest state."""
+        with patch('nexusprime.utils.status._write_snapshot', wraps=status._write_snapshot) as mock_write:
+            for count in range(5):
+                status.save_status_snapshot(
+                    {"current_status": "CODING", "feedback_loop_count": count, "total_tokens": TokenUsage(1, 2, 3)},
+                    temp_status_file
+                )
+            status.flush_status_snapshots()
+        
+        assert mock_write.call_count == 1
+        with open(temp_status_file, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["feedback_loop_count"] == 4
+        assert data["total_tokens"] == {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3}
+    
+    def test_unchanged_snapshot_is_not_rewritten(self, temp_status_file):
+        """Test that flushing an identical snapshot skips the disk write."""
+        with patch('nexusprime.utils.status.os.replace', wraps=os.replace) as mock_replace:
+            for current_status in ("CODING", "CODING", "REVIEWING"):
+                status.save_status_snapshot({"current_status": current_status}, temp_status_file)
+                status.flush_status_snapshots()
+        
+        assert mock_replace.call_count == 2
+        assert status.load_status_snapshot(temp_status_file)["current_status"] == "REVIEWING"
+    
+    def test_external_rewrite_is_overwritten(self, temp_status_file):
+        """Test that the unchanged-snapshot skip notices a file rewritten by someone else."""
+        status.save_status_snapshot({"current_status": "CODING"}, temp_status_file)
+        status.flush_status_snapshots()
+        with open(temp_status_file, "w", encoding="utf-8") as f:
+            f.write('{"current_status": "EDITED"}')
+        
+        status.save_status_snapshot({"current_status": "CODING"}, temp_status_file)
+        status.flush_status_snapshots()
+        
+        assert status.load_status_snapshot(temp_status_file)["current_status"] == "CODING"
+    
+    def test_write_replaces_pending_snapshot(self, temp_status_file):
+        """Test that a direct write is not overwritten by an older pending snapshot."""
+        status.save_status_snapshot({"current_status": "CODING"}, temp_status_file)
+        status.write_status_snapshot({"current_status": "ERROR", "last_message": "Error: boom"}, temp_status_file)
+        status.flush_status_snapshots()
+        
+        assert status.load_status_snapshot(temp_status_file)["current_status"] == "ERROR"
+    
+    def test_spec_excerpt(self, temp_status_file):
+        """Test that the spec excerpt is truncated and tolerates a missing spec."""
+        status.save_status_snapshot({"spec_document": "x" * 500}, temp_status_file)
+        status.flush_status_snapshots()
+        assert status.load_status_snapshot(temp_status_file)["spec_excerpt"] == "x" * 200
+        
+        status.save_status_snapshot({"spec_document": None}, temp_status_file)
+        status.flush_status_snapshots()
+        assert status.load_status_snapshot(temp_status_file)["spec_excerpt"] == ""
+    
+    def test_round_trip(self, temp_status_file):
+        """Test that a flushed snapshot can be loaded back."""
+        status.save_status_snapshot({"current_status": "APPROVED", "env_mode": "DEV"}, temp_status_file)
+        status.flush_status_snapshots()
+        
+        loaded = status.load_status_snapshot(temp_status_file)
+        assert loaded["current_status"] == "APPROVED"
+        assert loaded["env_mode"] == "DEV"
+        assert not os.path.exists(f"{temp_status_file}.tmp")
+    
+    def test_load_invalid_json(self, temp_status_file):
+        """Test that a corrupt status file loads as None."""
+        with open(temp_status_file, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        
+        assert status.load_status_snapshot(temp_status_file) is None
+    
+    def test_load_reuses_unchanged_file(self, temp_status_file):
+        """Test that an unchanged file is parsed once and a rewrite is picked up."""
+        status.save_status_snapshot({"current_status": "CODING"}, temp_status_file)
+        status.flush_status_snapshots()
+        
+        with patch('nexusprime.utils.status.orjson.loads', wraps=status.orjson.loads) as mock_loads:
+            first = status.load_status_snapshot(temp_status_file)
+            assert status.load_status_snapshot(temp_status_file) is first
+            assert mock_loads.call_count == 1
+            
+            status.save_status_snapshot({"current_status": "REVIEWING"}, temp_status_file)
+            status.flush_status_snapshots()
+            assert status.load_status_snapshot(temp_status_file)["current_status"] == "REVIEWING"
+            assert mock_loads.call_count == 2
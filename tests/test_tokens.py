@@ -0,0 +1,71 @@
+"""Tests for token usage utilities."""
+
+from __future__ import annotations
+
+import pytest
+
+from nexusprime.utils import tokens
+from nexusprime.utils.tokens import (
+    TokenUsage,
+    format_token_counts,
+    format_token_usage,
+    truncate_tokens,
+    update_token_usage,
+)
+
+
+class TestUpdateTokenUsage:
+    """Test cases for update_token_usage."""
+    
+    def test_accumulates_router_usage(self):
+        """Test that router-format usage is added to the running totals."""
+        current = TokenUsage(prompt=10, completion=5, total=15)
+        new = {"prompt_tokens": 3, "completion_tokens": 2, "total_token_count": 5}
+        
+        result = update_token_usage(current, new)
+        
+        assert (result.prompt, result.completion, result.total) == (13, 7, 20)
+        # The state's usage object is not mutated
+        assert (current.prompt, current.completion, current.total) == (10, 5, 15)
+    
+    def test_accumulates_gemini_usage(self):
+        """Test that Gemini-format usage is still understood."""
+        new = {"prompt_token_count": 3, "candidates_token_count": 2, "total_token_count": 5}
+        result = update_token_usage(TokenUsage(), new)
+        assert (result.prompt, result.completion, result.total) == (3, 2, 5)
+    
+    def test_from_serialized_dict(self):
+        """Test merging into a serialized (or empty) usage dict."""
+        result = update_token_usage({"total_tokens": 10}, {"total_token_count": 50})
+        assert result.to_dict() == {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 60}
+        
+        assert update_token_usage({}, {}).to_dict()["total_tokens"] == 0
+
+
+class TestFormatTokenUsage:
+    """Test cases for format_token_usage."""
+    
+    def test_format(self):
+        """Test formatting with thousands separators."""
+        usage = {"prompt_tokens": 1200, "completion_tokens": 300, "total_tokens": 1500}
+        assert format_token_usage(usage) == "Tokens - Prompt: 1,200, Completion: 300, Total: 1,500"
+        assert format_token_usage(TokenUsage(1200, 300, 1500)) == format_token_usage(usage)
+        assert format_token_counts(1200, 300, 1500) == format_token_usage(usage)
+
+
+class TestTruncateTokens:
+    """Test cases for truncate_tokens."""
+    
+    def test_short_text_unchanged(self):
+        """Test that text within budget is returned as-is."""
+        assert truncate_tokens("short spec", 150) == "short spec"
+    
+    def test_character_fallback(self, monkeypatch):
+        """Test character-based truncation without a tokenizer."""
+        monkeypatch.setattr(tokens, "_get_encoder", lambda: None)
+        truncate_tokens.cache_clear()
+        
+        result = truncate_tokens("é" * 1000, 10)
+        
+        assert result == "é" * (10 * tokens.CHARS_PER_TOKEN)
+        truncate_tokens.cache_clear()